@@ -30,6 +30,8 @@
             reportlab
             psutil
             questionary
+            pytest
+            pytest-xdist
           ]
         );
 
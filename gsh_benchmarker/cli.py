@@ -69,37 +69,39 @@ SUPPORTED_SERVICES = {
 
 def show_help():
     """Show detailed help information"""
-    help_text = Text()
-    help_text.append("GSH Benchmarker Suite", style=f"bold {KARTOZA_COLORS['highlight2']}")
-    help_text.append("\n\n")
-    help_text.append("A unified benchmarking framework for geospatial services\n", style=f"{KARTOZA_COLORS['highlight3']}")
-    help_text.append("\n")
-    
-    help_text.append("Supported Services:", style=f"bold {KARTOZA_COLORS['highlight1']}")
-    help_text.append("\n")
-    for service_id, service_info in SUPPORTED_SERVICES.items():
-        status = "✅" if service_id == 'geoserver' else "🚧"
-        help_text.append(f"  {status} {service_id:<12} - {service_info['description']}\n", 
-                        style=f"{KARTOZA_COLORS['highlight3']}")
-    
-    help_text.append("\n")
-    help_text.append("Common Usage Patterns:", style=f"bold {KARTOZA_COLORS['highlight1']}")
-    help_text.append("\n")
-    help_text.append("  # Non-interactive single layer test\n", style=f"{KARTOZA_COLORS['highlight4']}")
-    help_text.append("  python3 -m gsh_benchmarker.cli --service geoserver \\\n", style=f"{KARTOZA_COLORS['highlight4']}")
-    help_text.append("    --url https://example.com/geoserver \\\n", style=f"{KARTOZA_COLORS['highlight4']}")
-    help_text.append("    --layer LayerName -t 100 -c 1,10,100\n", style=f"{KARTOZA_COLORS['highlight4']}")
-    help_text.append("\n")
-    help_text.append("  # Comprehensive test suite\n", style=f"{KARTOZA_COLORS['highlight4']}")
-    help_text.append("  python3 -m gsh_benchmarker.cli --service geoserver \\\n", style=f"{KARTOZA_COLORS['highlight4']}")
-    help_text.append("    --comprehensive --url https://example.com/geoserver \\\n", style=f"{KARTOZA_COLORS['highlight4']}")
-    help_text.append("    -t 5000 -c 1,10,100,500,1000\n", style=f"{KARTOZA_COLORS['highlight4']}")
-    help_text.append("\n")
-    help_text.append("  # Generate PDF report from latest results\n", style=f"{KARTOZA_COLORS['highlight4']}")
-    help_text.append("  python3 -m gsh_benchmarker.cli --generate-report\n", style=f"{KARTOZA_COLORS['highlight4']}")
-    help_text.append("\n")
-    help_text.append("  # Select and generate PDF report from previous runs\n", style=f"{KARTOZA_COLORS['highlight4']}")
-    help_text.append("  python3 -m gsh_benchmarker.cli --select-report\n", style=f"{KARTOZA_COLORS['highlight4']}")
+    heading = f"bold {KARTOZA_COLORS['highlight1']}"
+    example = f"{KARTOZA_COLORS['highlight4']}"
+    services = "".join(
+        f"  {'✅' if service_id == 'geoserver' else '🚧'} {service_id:<12} - {service_info['description']}\n"
+        for service_id, service_info in SUPPORTED_SERVICES.items()
+    )
+    help_text = Text.assemble(
+        ("GSH Benchmarker Suite", f"bold {KARTOZA_COLORS['highlight2']}"),
+        "\n\n",
+        ("A unified benchmarking framework for geospatial services\n", f"{KARTOZA_COLORS['highlight3']}"),
+        "\n",
+        ("Supported Services:", heading),
+        "\n",
+        (services, f"{KARTOZA_COLORS['highlight3']}"),
+        "\n",
+        ("Common Usage Patterns:", heading),
+        "\n",
+        ("  # Non-interactive single layer test\n"
+         "  python3 -m gsh_benchmarker.cli --service geoserver \\\n"
+         "    --url https://example.com/geoserver \\\n"
+         "    --layer LayerName -t 100 -c 1,10,100\n"
+         "\n"
+         "  # Comprehensive test suite\n"
+         "  python3 -m gsh_benchmarker.cli --service geoserver \\\n"
+         "    --comprehensive --url https://example.com/geoserver \\\n"
+         "    -t 5000 -c 1,10,100,500,1000\n"
+         "\n"
+         "  # Generate PDF report from latest results\n"
+         "  python3 -m gsh_benchmarker.cli --generate-report\n"
+         "\n"
+         "  # Select and generate PDF report from previous runs\n"
+         "  python3 -m gsh_benchmarker.cli --select-report\n", example),
+    )
     
     panel = Panel.fit(
         help_text,
@@ -19,6 +19,7 @@ from .config import (
     AB_USER_AGENT,
     AB_ACCEPT_HEADER,
     AB_TIMEOUT,
+    AB_KEEP_ALIVE,
     MAP_IMAGE_WIDTH,
     MAP_IMAGE_HEIGHT,
     PREVIEW_SIZE,
@@ -35,7 +36,9 @@ from .url_utils import (
 from .utils import (
     BenchmarkResult,
     BaseBenchmarker,
+    get_http_session,
     run_apache_bench,
+    terminate_apache_bench,
     parse_ab_output,
     save_benchmark_result,
     create_results_summary_table,
@@ -54,14 +57,30 @@ from .image_utils import (
     create_simple_chart_ascii
 )
 
-# Import PDF generator with optional dependency handling
-try:
-    from .pdf_generator import generate_pdf_report, PDFReportGenerator
-    PDF_GENERATOR_AVAILABLE = True
-except ImportError:
-    PDF_GENERATOR_AVAILABLE = False
-    generate_pdf_report = None
-    PDFReportGenerator = None
+# The PDF generator pulls in pandas, matplotlib and reportlab, which dominate
+# start-up time, so it is imported on first access instead (PEP 562)
+_PDF_EXPORTS = ("generate_pdf_report", "PDFReportGenerator", "PDF_GENERATOR_AVAILABLE")
+
+
+def __getattr__(name):
+    """Resolve the PDF exports lazily, with optional dependency handling"""
+    if name not in _PDF_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        from .pdf_generator import generate_pdf_report, PDFReportGenerator
+        available = True
+    except ImportError:
+        generate_pdf_report = PDFReportGenerator = None
+        available = False
+
+    # Cache as real module globals so later lookups skip this hook
+    globals().update(
+        generate_pdf_report=generate_pdf_report,
+        PDFReportGenerator=PDFReportGenerator,
+        PDF_GENERATOR_AVAILABLE=available,
+    )
+    return globals()[name]
 
 __all__ = [
     # Colors
@@ -80,6 +99,7 @@ __all__ = [
     "AB_USER_AGENT",
     "AB_ACCEPT_HEADER",
     "AB_TIMEOUT",
+    "AB_KEEP_ALIVE",
     "MAP_IMAGE_WIDTH",
     "MAP_IMAGE_HEIGHT",
     "PREVIEW_SIZE",
@@ -96,7 +116,9 @@ __all__ = [
     # Benchmark utilities
     "BenchmarkResult",
     "BaseBenchmarker",
+    "get_http_session",
     "run_apache_bench",
+    "terminate_apache_bench",
     "parse_ab_output",
     "save_benchmark_result",
     "create_results_summary_table",
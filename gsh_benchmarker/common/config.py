@@ -35,4 +35,6 @@ PREVIEW_SIZE = "80x25"
 # Apache Bench configuration (can be used by multiple benchmarkers)
 AB_USER_AGENT = "GSH-Benchmarker/1.0"
 AB_ACCEPT_HEADER = "application/json,text/html,*/*"
-AB_TIMEOUT = 60
\ No newline at end of file
+AB_TIMEOUT = 60
+# Reuse connections (ab -k) so runs measure tile serving rather than TCP/TLS setup
+AB_KEEP_ALIVE = True
\ No newline at end of file
@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from functools import cached_property
 
 from rich.console import Console
 from .colors import KARTOZA_COLORS
@@ -34,6 +35,37 @@ class MonitoringEndpoint:
         if self.created_at is None:
             self.created_at = datetime.now().isoformat()
         self.updated_at = datetime.now().isoformat()
+    
+    @cached_property
+    def status_icon(self) -> str:
+        """Status emoji shown in endpoint selection menus"""
+        return "✅" if self.enabled else "❌"
+    
+    @cached_property
+    def status_label(self) -> str:
+        """Status emoji with a human readable label"""
+        return "✅ Enabled" if self.enabled else "❌ Disabled"
+    
+    @cached_property
+    def status_word(self) -> str:
+        """Plain lowercase status used in confirmation prompts"""
+        return "enabled" if self.enabled else "disabled"
+    
+    @cached_property
+    def type_display(self) -> str:
+        """Endpoint type formatted for display"""
+        return self.endpoint_type.upper()
+    
+    @cached_property
+    def description_display(self) -> str:
+        """Description shortened to 50 characters for endpoint listings"""
+        description = self.description or "No description"
+        return description[:50] + "..." if len(description) > 50 else description
+    
+    def invalidate_display_cache(self):
+        """Drop cached display strings after enabled/endpoint_type/description change"""
+        for attr in ('status_icon', 'status_label', 'status_word', 'type_display', 'description_display'):
+            self.__dict__.pop(attr, None)
 
 class MonitoringConfigManager:
     """Manager for monitoring endpoint configurations"""
@@ -47,10 +79,32 @@ class MonitoringConfigManager:
             self.config_file = Path(config_file)
         
         self.endpoints: Dict[str, MonitoringEndpoint] = {}
+        # Last summary returned, reused while the config file's mtime is unchanged
+        self._summary_cache: Optional[Dict] = None
         self.load_config()
     
+    @cached_property
+    def _endpoint_counts(self) -> Dict[str, int]:
+        """Endpoint totals for the summary, counted in one pass until endpoints change"""
+        counts = {'total_endpoints': len(self.endpoints), 'enabled_endpoints': 0,
+                  'prometheus_endpoints': 0, 'grafana_endpoints': 0}
+        for endpoint in self.endpoints.values():
+            if endpoint.enabled:
+                counts['enabled_endpoints'] += 1
+            if endpoint.endpoint_type == 'prometheus':
+                counts['prometheus_endpoints'] += 1
+            elif endpoint.endpoint_type == 'grafana':
+                counts['grafana_endpoints'] += 1
+        return counts
+    
+    def _invalidate_counts(self):
+        """Drop the cached endpoint totals and summary after endpoints are loaded or modified"""
+        self.__dict__.pop('_endpoint_counts', None)
+        self._summary_cache = None
+    
     def load_config(self) -> bool:
         """Load configuration from file"""
+        self._invalidate_counts()
         try:
             if self.config_file.exists():
                 with open(self.config_file, 'r') as f:
@@ -73,6 +127,8 @@ class MonitoringConfigManager:
     
     def save_config(self) -> bool:
         """Save configuration to file"""
+        # Every CRUD operation mutates self.endpoints and then saves
+        self._invalidate_counts()
         try:
             # Ensure directory exists
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
@@ -169,6 +225,7 @@ class MonitoringConfigManager:
                 if field == 'url' and value and not value.startswith(('http://', 'https://')):
                     value = f'http://{value}'
                 setattr(endpoint, field, value)
+        endpoint.invalidate_display_cache()
         
         # Update timestamp
         endpoint.updated_at = datetime.now().isoformat()
@@ -186,6 +243,7 @@ class MonitoringConfigManager:
         """Toggle enabled/disabled status of an endpoint"""
         if name in self.endpoints:
             self.endpoints[name].enabled = not self.endpoints[name].enabled
+            self.endpoints[name].invalidate_display_cache()
             self.endpoints[name].updated_at = datetime.now().isoformat()
             return self.save_config()
         return False
@@ -244,17 +302,21 @@ class MonitoringConfigManager:
         return env_vars
     
     def get_config_summary(self) -> Dict:
-        """Get a summary of the configuration"""
-        total_endpoints = len(self.endpoints)
-        enabled_endpoints = len([e for e in self.endpoints.values() if e.enabled])
-        prometheus_count = len([e for e in self.endpoints.values() if e.endpoint_type == 'prometheus'])
-        grafana_count = len([e for e in self.endpoints.values() if e.endpoint_type == 'grafana'])
+        """Get a summary of the configuration
         
-        return {
-            'total_endpoints': total_endpoints,
-            'enabled_endpoints': enabled_endpoints,
-            'prometheus_endpoints': prometheus_count,
-            'grafana_endpoints': grafana_count,
-            'config_file': str(self.config_file),
-            'last_modified': self.config_file.stat().st_mtime if self.config_file.exists() else None
-        }
\ No newline at end of file
+        The same dict is returned until the endpoints change or the config
+        file's mtime moves, so callers must treat it as read-only.
+        """
+        try:
+            last_modified = self.config_file.stat().st_mtime
+        except FileNotFoundError:
+            last_modified = None
+        
+        summary = self._summary_cache
+        if summary is None or summary['last_modified'] != last_modified:
+            summary = self._summary_cache = {
+                **self._endpoint_counts,
+                'config_file': str(self.config_file),
+                'last_modified': last_modified
+            }
+        return summary
\ No newline at end of file
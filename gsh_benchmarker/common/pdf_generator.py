@@ -11,9 +11,10 @@ import argparse
 import os
 import requests
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 
 # Import plotting libraries
 try:
@@ -50,6 +51,57 @@ from .colors import KARTOZA_COLORS
 
 console = Console()
 
+# Per-request timing columns that may appear in Apache Bench -g output
+AB_TIME_COLUMNS = ('ttime', 'Time in ms', 'dtime')
+
+# Receives (percent complete, current step description) during report generation
+ProgressCallback = Callable[[float, str], None]
+
+
+class CallbackProgress:
+    """Stand-in for a Rich Progress that forwards updates to a callback
+    
+    Used when the caller already shows its own progress display, so report
+    generation reports real progress to it instead of opening a second one.
+    """
+    
+    def __init__(self, callback: ProgressCallback):
+        self.callback = callback
+        self.completed = 0.0
+        self.description = ""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def add_task(self, description: str, total: float = 100) -> int:
+        self.description = description
+        self.callback(self.completed, self.description)
+        return 0
+    
+    def update(self, task: int, advance: float = None, completed: float = None,
+               description: str = None, **kwargs):
+        if completed is not None:
+            self.completed = completed
+        if advance is not None:
+            self.completed += advance
+        if description is not None:
+            self.description = description
+        self.callback(min(self.completed, 100.0), self.description)
+
+
+def _progress_display(progress_callback: Optional[ProgressCallback] = None):
+    """Spinner progress for standalone runs, or a callback forwarder when the caller tracks progress"""
+    if progress_callback is not None:
+        return CallbackProgress(progress_callback)
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    )
+
 # Dynamic layer metadata discovery
 def get_layer_metadata_from_capabilities(geoserver_url: str, layer_name: str) -> Dict[str, str]:
     """Get layer metadata from GeoServer capabilities instead of hardcoded values"""
@@ -95,7 +147,8 @@ class PDFReportGenerator:
     def generate_comprehensive_report(
         self, 
         results_pattern: str = None,
-        output_filename: str = None
+        output_filename: str = None,
+        progress_callback: Optional[ProgressCallback] = None
     ) -> Optional[Path]:
         """Generate a comprehensive PDF report from consolidated results"""
         
@@ -108,7 +161,8 @@ class PDFReportGenerator:
             console.print(f"[{KARTOZA_COLORS['alert']}]❌ No consolidated results found matching: {results_pattern}[/]")
             return None
         
-        latest_file = max(consolidated_files, key=lambda p: p.stat().st_mtime)
+        # Consolidated filenames end in a sortable YYYYMMDD_HHMMSS stamp, so the newest needs no stat()
+        latest_file = max(consolidated_files, key=lambda p: p.name)
         console.print(f"[{KARTOZA_COLORS['highlight2']}]📊 Generating report from: {latest_file}[/]")
         
         # Load results
@@ -123,11 +177,7 @@ class PDFReportGenerator:
         
         output_path = self.output_dir / output_filename
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with _progress_display(progress_callback) as progress:
             
             task = progress.add_task("Generating PDF report...", total=100)
             
@@ -267,8 +317,8 @@ class PDFReportGenerator:
             target_results[target].append(result)
         
         # Create charts for each target (max 4 per page)
-        targets = list(target_results.keys())
-        pages_needed = (len(targets) + 3) // 4
+        target_items = list(target_results.items())
+        pages_needed = (len(target_items) + 3) // 4
         
         for page in range(pages_needed):
             fig, axes = plt.subplots(2, 2, figsize=(8.5, 11))
@@ -276,12 +326,9 @@ class PDFReportGenerator:
             axes = axes.flatten()
             
             start_idx = page * 4
-            end_idx = min(start_idx + 4, len(targets))
+            end_idx = min(start_idx + 4, len(target_items))
             
-            for i, target_idx in enumerate(range(start_idx, end_idx)):
-                target = targets[target_idx]
-                target_data = target_results[target]
-                
+            for i, (target, target_data) in enumerate(target_items[start_idx:end_idx]):
                 ax = axes[i]
                 
                 # Extract data for this target
@@ -620,8 +667,8 @@ class ReportLabPDFGenerator:
             if not csv_files:
                 return None
             
-            all_response_times = []
-            concurrency_data = []
+            # One timing array per CSV, concatenated once all files are read
+            time_chunks = []
             
             for csv_file in csv_files:
                 try:
@@ -634,8 +681,10 @@ class ReportLabPDFGenerator:
                     else:
                         concurrency = "unknown"
                     
-                    # Read CSV data
-                    df = pd.read_csv(csv_file, sep='\t')  # Apache Bench CSV is tab-separated
+                    # Read CSV data, parsing only the timing columns (ab's starttime
+                    # strings are the slowest part to parse and are never used)
+                    df = pd.read_csv(csv_file, sep='\t',  # Apache Bench CSV is tab-separated
+                                     usecols=lambda column: column in AB_TIME_COLUMNS)
                     
                     # Check for different possible column names
                     time_column = None
@@ -647,17 +696,17 @@ class ReportLabPDFGenerator:
                         time_column = 'dtime'  # Apache Bench processing time
                     
                     if time_column and len(df) > 0:
-                        response_times = df[time_column].values
-                        all_response_times.extend(response_times)
-                        concurrency_data.extend([int(concurrency)] * len(response_times))
+                        response_times = df[time_column].to_numpy()
+                        time_chunks.append(response_times)
                         console.print(f"[{KARTOZA_COLORS['highlight4']}]✅ Added {len(response_times)} requests from concurrency {concurrency}[/]")
                         
                 except Exception as e:
                     console.print(f"[{KARTOZA_COLORS['alert']}]⚠️  Error processing {csv_file}: {e}[/]")
                     continue
             
-            if not all_response_times:
+            if not time_chunks:
                 return None
+            all_response_times = np.concatenate(time_chunks)
             
             # Create histogram
             fig, ax = plt.subplots(figsize=(12, 8))
@@ -676,9 +725,8 @@ class ReportLabPDFGenerator:
             
             # Add statistical lines
             mean_time = np.mean(all_response_times)
-            median_time = np.median(all_response_times)
-            p95_time = np.percentile(all_response_times, 95)
-            p99_time = np.percentile(all_response_times, 99)
+            # All three percentiles from a single partition of the data
+            median_time, p95_time, p99_time = np.percentile(all_response_times, [50, 95, 99])
             
             ax.axvline(mean_time, color=KARTOZA_COLORS["alert"], linestyle='--', 
                       label=f'Mean: {mean_time:.0f}ms')
@@ -717,7 +765,8 @@ class ReportLabPDFGenerator:
             console.print(f"[{KARTOZA_COLORS['alert']}]⚠️  Could not create detailed histogram for {layer_name}: {e}[/]")
             return None
     
-    def generate_comprehensive_report(self, timestamp: str = None, results_pattern: str = None) -> Optional[Path]:
+    def generate_comprehensive_report(self, timestamp: str = None, results_pattern: str = None,
+                                      progress_callback: Optional[ProgressCallback] = None) -> Optional[Path]:
         """Generate comprehensive PDF report using ReportLab"""
         if timestamp is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -735,8 +784,8 @@ class ReportLabPDFGenerator:
             console.print(f"[{KARTOZA_COLORS['alert']}]❌ No consolidated results found matching: {pattern_info}[/]")
             return None
         
-        # Use most recent if multiple files found
-        latest_file = max(consolidated_files, key=lambda p: p.stat().st_mtime)
+        # Use most recent if multiple files found (by the timestamp embedded in the name)
+        latest_file = max(consolidated_files, key=lambda p: p.name)
         console.print(f"[{KARTOZA_COLORS['highlight2']}]📊 Using results: {latest_file}[/]")
         
         try:
@@ -750,11 +799,7 @@ class ReportLabPDFGenerator:
         report_filename = self.output_dir / f"{self.service_type}_comprehensive_report_{timestamp}.pdf"
         console.print(f"[{KARTOZA_COLORS['highlight1']}]📄 Generating PDF: {report_filename}[/]")
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
+        with _progress_display(progress_callback) as progress:
             task = progress.add_task("Creating PDF report...", total=100)
             
             try:
@@ -863,10 +908,24 @@ class ReportLabPDFGenerator:
         
         progress.update(task, advance=20, description="Processing targets...")
         
+        # Fetch each layer's capabilities metadata and map preview from GeoServer in the
+        # background, so the network waits overlap with building the sections below.
+        # Charts are still drawn on this thread, as pyplot is not thread-safe.
+        fetcher = ThreadPoolExecutor(max_workers=4)
+        layer_fetches = {
+            target: (
+                fetcher.submit(get_layer_metadata_from_capabilities, self.geoserver_url, target),
+                fetcher.submit(self.capture_map_image, target)
+            )
+            for target in results_by_target if target != 'unknown'
+        }
+        fetcher.shutdown(wait=False)
+        
         # Add layer sections with dynamic metadata
-        for i, (target, target_results) in enumerate(results_by_target.items()):
+        for target, target_results in results_by_target.items():
             if target == 'unknown':
                 continue
+            metadata_future, map_image_future = layer_fetches[target]
                 
             progress.update(task, advance=60/len(results_by_target), 
                           description=f"Processing {target}...")
@@ -874,7 +933,7 @@ class ReportLabPDFGenerator:
             story.append(PageBreak())
             
             # Get layer metadata from capabilities
-            metadata = get_layer_metadata_from_capabilities(self.geoserver_url, target)
+            metadata = metadata_future.result()
             
             story.append(Paragraph(metadata["title"], heading_style))
             story.append(Paragraph("Layer Information", subheading_style))
@@ -882,7 +941,7 @@ class ReportLabPDFGenerator:
             story.append(Spacer(1, 10))
             
             # Add map image
-            map_image_path = self.capture_map_image(target)
+            map_image_path = map_image_future.result()
             if map_image_path and os.path.exists(map_image_path):
                 story.append(Paragraph("Map Preview", subheading_style))
                 img = Image(map_image_path, width=4*inch, height=3*inch)
@@ -1301,7 +1360,8 @@ class ReportLabPDFGenerator:
             console.print(f"[{KARTOZA_COLORS['alert']}]⚠️  Error adding monitoring section: {e}[/]")
 
 
-def generate_pdf_report(service_type: str = "geoserver", use_reportlab: bool = True, results_file: str = None) -> Optional[Path]:
+def generate_pdf_report(service_type: str = "geoserver", use_reportlab: bool = True, results_file: str = None,
+                        progress_callback: Optional[ProgressCallback] = None) -> Optional[Path]:
     """
     Convenience function to generate a PDF report for a specific service type
     
@@ -1309,6 +1369,8 @@ def generate_pdf_report(service_type: str = "geoserver", use_reportlab: bool = T
         service_type: Type of service (geoserver, nginx, etc.)
         use_reportlab: Whether to use ReportLab (True) or matplotlib (False)
         results_file: Specific results file path to use instead of finding latest
+        progress_callback: Called with (percent complete, step description) as the
+            report is built; when given, no progress display of its own is shown
         
     Returns:
         Path to generated PDF or None if failed
@@ -1319,16 +1381,18 @@ def generate_pdf_report(service_type: str = "geoserver", use_reportlab: bool = T
             if results_file:
                 # Extract pattern from specific file for backwards compatibility
                 results_pattern = Path(results_file).name
-                return generator.generate_comprehensive_report(results_pattern=results_pattern)
+                return generator.generate_comprehensive_report(results_pattern=results_pattern,
+                                                               progress_callback=progress_callback)
             else:
-                return generator.generate_comprehensive_report()
+                return generator.generate_comprehensive_report(progress_callback=progress_callback)
         else:
             generator = PDFReportGenerator(service_type)
             if results_file:
                 results_pattern = Path(results_file).name
-                return generator.generate_comprehensive_report(results_pattern=results_pattern)
+                return generator.generate_comprehensive_report(results_pattern=results_pattern,
+                                                               progress_callback=progress_callback)
             else:
-                return generator.generate_comprehensive_report()
+                return generator.generate_comprehensive_report(progress_callback=progress_callback)
     except ImportError as e:
         console.print(f"[{KARTOZA_COLORS['alert']}]❌ Cannot generate PDF: {e}[/]")
         console.print(f"[{KARTOZA_COLORS['highlight3']}]Install missing dependencies[/]")
@@ -9,7 +9,7 @@ import json
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, List, Dict, Any, Optional, Tuple
 
 from rich.console import Console
 from rich.table import Table
@@ -36,29 +36,31 @@ class ReportGenerator:
         self.reports_dir.mkdir(exist_ok=True)
         self.results_dir.mkdir(exist_ok=True)
     
-    def consolidate_results(
+    def build_consolidated(
         self, 
         results: List[BenchmarkResult], 
         timestamp: str,
-        test_config: Dict[str, Any]
-    ) -> Path:
+        test_config: Dict[str, Any],
+        now: Callable[[], datetime] = datetime.now
+    ) -> Dict[str, Any]:
         """
-        Consolidate multiple benchmark results into a single report file
+        Build the consolidated report data for a test run without writing it
         
         Args:
             results: List of benchmark results
             timestamp: Test run timestamp  
             test_config: Configuration used for the test run
+            now: Clock used for the report dates
             
         Returns:
-            Path to the consolidated results file
+            JSON-serializable dict as written by consolidate_results
         """
         consolidated = {
             "test_suite": {
                 "name": f"{self.service_type.title()} Comprehensive Benchmark",
                 "service_type": self.service_type,
                 "timestamp": timestamp,
-                "date": datetime.now().isoformat(),
+                "date": now().isoformat(),
                 "total_requests_per_test": test_config.get("total_requests", "unknown"),
                 "concurrency_levels": test_config.get("concurrency_levels", []),
                 "targets_tested": list(set(r.target for r in results)),
@@ -77,7 +79,7 @@ class ReportGenerator:
                 "test_id": result.test_id,
                 "total_requests": result.total_requests,
                 "concurrency_level": result.concurrency,
-                "test_date": datetime.now().isoformat(),
+                "test_date": now().isoformat(),
                 "results": {
                     "requests_per_second": f"{result.requests_per_second:.2f}",
                     "mean_response_time_ms": f"{result.mean_response_time:.2f}",
@@ -90,10 +92,33 @@ class ReportGenerator:
             }
             consolidated["results"].append(result_data)
         
+        return consolidated
+    
+    def consolidate_results(
+        self, 
+        results: List[BenchmarkResult], 
+        timestamp: str,
+        test_config: Dict[str, Any],
+        now: Callable[[], datetime] = datetime.now
+    ) -> Path:
+        """
+        Consolidate multiple benchmark results into a single report file
+        
+        Args:
+            results: List of benchmark results
+            timestamp: Test run timestamp  
+            test_config: Configuration used for the test run
+            now: Clock used for the report dates
+            
+        Returns:
+            Path to the consolidated results file
+        """
+        consolidated = self.build_consolidated(results, timestamp, test_config, now)
+        
         # Save consolidated results
         consolidated_file = self.results_dir / f"consolidated_{self.service_type}_results_{timestamp}.json"
         with open(consolidated_file, "w") as f:
-            json.dump(consolidated, f, indent=2)
+            f.write(json.dumps(consolidated, indent=2))
         
         console.print(
             f"[{KARTOZA_COLORS['highlight4']}]📋 Consolidated results saved: {consolidated_file}[/]"
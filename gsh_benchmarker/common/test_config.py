@@ -8,7 +8,7 @@ last used concurrency levels, request counts, etc.
 
 import json
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
@@ -115,10 +115,16 @@ def parse_concurrency_list(concurrency_input: str) -> List[int]:
     except (ValueError, AttributeError):
         return []
 
-def validate_concurrency_list(concurrency_list: List[int], total_requests: int) -> List[int]:
-    """Remove concurrency levels that are greater than total requests"""
-    valid_concurrency = [c for c in concurrency_list if c <= total_requests]
-    return sorted(valid_concurrency)
+def validate_concurrency_list(concurrency_list: List[int], total_requests: int) -> Tuple[List[int], List[int]]:
+    """Split concurrency levels into those usable with total requests and those greater than it
+    
+    Returns (valid, removed), both sorted, from a single pass over the list.
+    """
+    valid_concurrency = []
+    removed_concurrency = []
+    for c in sorted(concurrency_list):
+        (valid_concurrency if c <= total_requests else removed_concurrency).append(c)
+    return valid_concurrency, removed_concurrency
 
 def format_concurrency_list(concurrency_list: List[int]) -> str:
     """Format concurrency list as comma-separated string"""
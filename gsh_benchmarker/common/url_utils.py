@@ -8,7 +8,7 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 from urllib.parse import urlparse, urlunparse
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.prompt import Prompt
 from rich.table import Table
 from rich.panel import Panel
@@ -17,6 +17,9 @@ from .colors import KARTOZA_COLORS
 
 console = Console()
 
+# Border-coloured rule under the server configuration title, built once
+_SEPARATOR_50 = f"[{KARTOZA_COLORS['border']}]{'─' * 50}[/]"
+
 
 class ServerHistoryManager:
     """Manages server URL history and configuration across all benchmarkers"""
@@ -164,25 +167,22 @@ def get_server_url_interactive(server_type: str = "server", history_manager: Opt
     if history_manager is None:
         history_manager = ServerHistoryManager()
     
-    console.print()
+    # The whole screen is collected first and printed as one group
+    lines = [""]
     
     # Server config header with proper centering - matching main interface design
-    config_title = Text()
-    config_title.append("▲ ", style=f"{KARTOZA_COLORS['accent']}")
-    config_title.append(f"{server_type.title()} Server Configuration", style=f"bold {KARTOZA_COLORS['primary_blue']}")
-    
-    console.print(Align.center(config_title))
-    console.print(Align.center(f"[{KARTOZA_COLORS['border']}]{'─' * 50}[/]"))
-    console.print()
+    config_title = Text.assemble(
+        ("▲ ", f"{KARTOZA_COLORS['accent']}"),
+        (f"{server_type.title()} Server Configuration", f"bold {KARTOZA_COLORS['primary_blue']}")
+    )
+    lines += [Align.center(config_title), Align.center(_SEPARATOR_50), ""]
     
     # Show recent servers with centered layout
     recent_servers = history_manager.get_recent_servers(server_type, 5)
     
     if recent_servers:
-        recent_header = Text()
-        recent_header.append(f"Recent {server_type} servers:", style=f"{KARTOZA_COLORS['secondary_teal']}")
-        console.print(Align.center(recent_header))
-        console.print()
+        recent_header = Text(f"Recent {server_type} servers:", style=f"{KARTOZA_COLORS['secondary_teal']}")
+        lines += [Align.center(recent_header), ""]
         
         for i, entry in enumerate(recent_servers, 1):
             description = entry.get('description', '')
@@ -190,37 +190,28 @@ def get_server_url_interactive(server_type: str = "server", history_manager: Opt
             if description:
                 display_text += f" ({description})"
             
-            server_item = Text()
-            server_item.append(f"  {display_text}", style=f"{KARTOZA_COLORS['neutral_grey']}")
-            console.print(Align.center(server_item))
+            lines.append(Align.center(Text(f"  {display_text}", style=f"{KARTOZA_COLORS['neutral_grey']}")))
         
-        console.print()
+        lines.append("")
     
     # Options section with centered layout  
-    options_header = Text()
-    options_header.append("Options:", style=f"bold {KARTOZA_COLORS['primary_orange']}")
-    console.print(Align.center(options_header))
-    console.print()
+    options_header = Text("Options:", style=f"bold {KARTOZA_COLORS['primary_orange']}")
+    lines += [Align.center(options_header), ""]
     
     # Create centered option list
     if recent_servers:
-        option1 = Text()
-        option1.append(f"• Enter a number (1-{len(recent_servers)}) to use a recent server", style=f"{KARTOZA_COLORS['muted']}")
-        console.print(Align.center(option1))
+        option1 = f"• Enter a number (1-{len(recent_servers)}) to use a recent server"
     else:
-        option1 = Text()
-        option1.append(f"• No recent {server_type} servers found", style=f"{KARTOZA_COLORS['muted']}")
-        console.print(Align.center(option1))
-    
-    option2 = Text()
-    option2.append(f"• Enter a new {server_type} URL (e.g., http://your-server.com:8080/geoserver)", style=f"{KARTOZA_COLORS['muted']}")
-    console.print(Align.center(option2))
-    
-    option3 = Text()
-    option3.append("• Press Enter to cancel", style=f"{KARTOZA_COLORS['muted']}")
-    console.print(Align.center(option3))
-    
-    console.print()
+        option1 = f"• No recent {server_type} servers found"
+    options = (
+        option1,
+        f"• Enter a new {server_type} URL (e.g., http://your-server.com:8080/geoserver)",
+        "• Press Enter to cancel"
+    )
+    lines += [Align.center(Text(option, style=f"{KARTOZA_COLORS['muted']}")) for option in options]
+    lines.append("")
+    
+    console.print(Group(*lines))
     
     choice = Prompt.ask(f"[{KARTOZA_COLORS['primary_blue']}]Your choice[/]").strip()
     
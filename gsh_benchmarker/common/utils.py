@@ -5,11 +5,16 @@ Shared utility functions for GSH Benchmarker Suite
 import json
 import shutil
 import subprocess
+import threading
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Dict, List, Optional, Set, Tuple, Any, Union
 from dataclasses import dataclass
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, MofNCompleteColumn
 from rich.table import Table
@@ -17,11 +22,34 @@ from rich.table import Table
 from .colors import KARTOZA_COLORS
 from .config import (
     RESULTS_DIR, REPORTS_DIR, TEMP_DIR, AB_USER_AGENT, AB_ACCEPT_HEADER, 
-    REQUEST_TIMEOUT, DEFAULT_TOTAL_REQUESTS
+    AB_KEEP_ALIVE, REQUEST_TIMEOUT, MAX_RETRIES, DEFAULT_TOTAL_REQUESTS
 )
 
 console = Console()
 
+# Apache Bench processes currently running, so an aborted sweep can stop them
+_running_ab: Set[subprocess.Popen] = set()
+_running_ab_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """Shared HTTP session for probes against the server under test
+
+    Reusing pooled keep-alive connections spares each connectivity probe a
+    fresh DNS lookup and TLS handshake. The pool is sized for the concurrent
+    layer probes, and connection errors are retried with a short backoff.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(total=MAX_RETRIES, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 @dataclass
 class BenchmarkResult:
@@ -84,6 +112,8 @@ def run_apache_bench(
     Run Apache Bench test and parse results
     
     This is a shared function that can be used by any benchmarker that needs HTTP load testing.
+    ab runs in its own session, so a Ctrl-C at the terminal does not cut a run short;
+    use terminate_apache_bench() to stop running tests deliberately.
     """
     
     log_file = f"{output_prefix}.log"
@@ -99,6 +129,10 @@ def run_apache_bench(
         f"-H", f"Accept: {AB_ACCEPT_HEADER}",
     ]
     
+    # HTTP keep-alive, so each connection serves many requests instead of one
+    if AB_KEEP_ALIVE:
+        cmd.append("-k")
+    
     # Add custom headers if provided
     if headers:
         for key, value in headers.items():
@@ -107,22 +141,39 @@ def run_apache_bench(
     cmd.append(url)
     
     try:
-        # Run Apache Bench
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        # Run Apache Bench outside the terminal's process group
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+            start_new_session=True
+        )
+        with _running_ab_lock:
+            _running_ab.add(process)
+        try:
+            stdout, stderr = process.communicate(timeout=300)
+        except BaseException:
+            # Timed out, or the caller is unwinding - never leave ab running detached
+            process.kill()
+            process.communicate()
+            raise
+        finally:
+            with _running_ab_lock:
+                _running_ab.discard(process)
         
-        # Save log output
+        # Save log output in a single write
+        log_text = stdout
+        if stderr:
+            log_text += f"\n--- STDERR ---\n{stderr}"
         with open(log_file, "w") as f:
-            f.write(result.stdout)
-            if result.stderr:
-                f.write(f"\n--- STDERR ---\n{result.stderr}")
+            f.write(log_text)
         
-        if result.returncode != 0:
+        if process.returncode != 0:
+            # Includes runs stopped by terminate_apache_bench(), whose output is partial
             return False, {
-                "error": f"Apache Bench failed with code {result.returncode}"
+                "error": f"Apache Bench failed with code {process.returncode}"
             }
         
         # Parse results from stdout
-        return True, parse_ab_output(result.stdout)
+        return True, parse_ab_output(stdout)
         
     except subprocess.TimeoutExpired:
         return False, {"error": "Apache Bench test timed out"}
@@ -130,6 +181,16 @@ def run_apache_bench(
         return False, {"error": f"Failed to run Apache Bench: {e}"}
 
 
+def terminate_apache_bench():
+    """Terminate every Apache Bench process started by run_apache_bench
+    
+    The interrupted runs report failure rather than parsing partial output.
+    """
+    with _running_ab_lock:
+        for process in _running_ab:
+            process.terminate()
+
+
 def parse_ab_output(output: str) -> Dict[str, Any]:
     """Parse Apache Bench output to extract metrics"""
     results = {}
@@ -187,8 +248,9 @@ def save_benchmark_result(
         metadata.update(additional_metadata)
     
     json_file = results_dir / f"{result.test_id}.json"
+    # json.dump writes chunk by chunk; serialise first so the file gets one write
     with open(json_file, "w") as f:
-        json.dump(metadata, f, indent=2)
+        f.write(json.dumps(metadata, indent=2))
 
 
 def create_results_summary_table(results: List[BenchmarkResult], service_type: str) -> Table:
@@ -12,6 +12,7 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .config import KARTOZA_COLORS, REQUEST_TIMEOUT
+from ..common import get_http_session
 
 console = Console()
 
@@ -54,7 +55,7 @@ class CapabilitiesParser:
         
         try:
             with console.status(f"[{KARTOZA_COLORS['highlight2']}]Fetching WMS capabilities..."):
-                response = requests.get(capabilities_url, timeout=REQUEST_TIMEOUT)
+                response = get_http_session().get(capabilities_url, timeout=REQUEST_TIMEOUT)
                 response.raise_for_status()
                 
                 # Parse XML
@@ -265,7 +266,7 @@ class CapabilitiesParser:
                    f"FORMAT=image/png")
         
         try:
-            response = requests.get(tile_url, timeout=REQUEST_TIMEOUT)
+            response = get_http_session().get(tile_url, timeout=REQUEST_TIMEOUT)
             return response.status_code == 200, response.status_code
         except requests.RequestException:
             return False, 0
@@ -27,6 +27,11 @@ DEFAULT_ZOOM_LEVEL = 8
 DEFAULT_TILE_ROW = 84
 DEFAULT_TILE_COL = 133
 
+# Rendered (uncached) GetMap workload: each window covers this fraction of the
+# layer extent per axis, placed at random so GeoWebCache cannot serve it warm
+RENDER_TILE_SIZE = 256
+RENDER_WINDOW_FRACTION = 0.125
+
 # Generic world bounding boxes for fallback when layer bbox is not available
 WORLD_BBOX_4326 = [-180, -90, 180, 90]  # Full world in WGS84
 WORLD_BBOX_3857 = [-20037508, -20037508, 20037508, 20037508]  # Web Mercator world extent
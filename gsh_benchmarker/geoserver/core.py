@@ -3,13 +3,17 @@ Core functionality for GeoServer load testing
 """
 
 import json
+import random
 import subprocess
 import tempfile
+import threading
 import requests
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
+from urllib.parse import parse_qs, urlsplit
 from dataclasses import dataclass
 
 from rich.console import Console
@@ -22,6 +26,7 @@ from rich.progress import (
     MofNCompleteColumn,
 )
 from rich.panel import Panel
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
@@ -32,6 +37,9 @@ from .config import (
     DEFAULT_TILE_ROW,
     DEFAULT_TILE_COL,
     AB_ACCEPT_HEADER,
+    RENDER_TILE_SIZE,
+    RENDER_WINDOW_FRACTION,
+    WORLD_BBOX_4326,
 )
 from .capabilities import discover_layers, LayerInfo, CapabilitiesParser
 from .subdomain_manager import get_server_url_interactive
@@ -46,6 +54,7 @@ from ..common import (
     REQUEST_TIMEOUT,
     BaseBenchmarker,
     BenchmarkResult,
+    get_http_session,
     run_apache_bench,
     save_benchmark_result,
     format_timestamp,
@@ -54,6 +63,11 @@ from ..common import (
 
 console = Console()
 
+# Pre-parsed styles for the status lines printed for every test in a sweep
+_STYLE_TESTING = Style.parse(KARTOZA_COLORS['highlight2'])
+_STYLE_PASS = Style.parse(KARTOZA_COLORS['highlight4'])
+_STYLE_FAIL = Style.parse(KARTOZA_COLORS['alert'])
+
 
 class GeoServerTester(BaseBenchmarker):
     """Main class for GeoServer load testing operations"""
@@ -62,9 +76,15 @@ class GeoServerTester(BaseBenchmarker):
         """Initialize the tester with server configuration"""
         super().__init__("geoserver", server_url)
         self.layers: Dict[str, LayerInfo] = {}
+        # Bumped whenever the layer set is replaced so callers can cache derived data
+        self.layers_version = 0
         self.service_info: Dict[str, str] = {}
+        # Display-length service abstract, truncated once when service_info is loaded
+        self.service_abstract = ""
         self.wmts_base = ""
         self.wms_base = ""
+        # GetTile URL with only layer/zoom/row/col left to fill, rebuilt per server URL
+        self._tile_url_template = ""
 
         if self.server_url:
             self._setup_urls()
@@ -75,6 +95,14 @@ class GeoServerTester(BaseBenchmarker):
             base_url = self.server_url.rstrip("/")
             self.wmts_base = f"{base_url}/gwc/service/wmts"
             self.wms_base = f"{base_url}/wms"
+            self._tile_url_template = (
+                f"{self.wmts_base}?"
+                f"SERVICE=WMTS&REQUEST=GetTile&VERSION=1.0.0&"
+                f"LAYER={{layer}}&STYLE=&"
+                f"TILEMATRIXSET={TILE_MATRIX_SET}&"
+                f"TILEMATRIX={{zoom}}&TILEROW={{row}}&TILECOL={{col}}&"
+                f"FORMAT={TILE_FORMAT}"
+            )
 
     def set_server_url(self, server_url: str):
         """Set the server URL and update endpoints"""
@@ -83,7 +111,9 @@ class GeoServerTester(BaseBenchmarker):
 
         # Clear existing layer data when changing servers
         self.layers = {}
+        self.layers_version += 1
         self.service_info = {}
+        self.service_abstract = ""
 
     def discover_layers(self) -> bool:
         """Discover layers from the GeoServer via GetCapabilities"""
@@ -93,12 +123,15 @@ class GeoServerTester(BaseBenchmarker):
 
         try:
             layer_list, self.service_info = discover_layers(self.server_url)
+            abstract = self.service_info.get("abstract") or ""
+            self.service_abstract = abstract[:97] + "..." if len(abstract) > 100 else abstract
 
             # Convert list to dictionary for easier access
             self.layers = {}
             for layer_info in layer_list:
                 # Use layer name as key
                 self.layers[layer_info.name] = layer_info
+            self.layers_version += 1
 
             if not self.layers:
                 console.print(f"[{KARTOZA_COLORS['alert']}]⚠️  No layers discovered[/]")
@@ -134,14 +167,7 @@ class GeoServerTester(BaseBenchmarker):
         if not self.wmts_base:
             raise ValueError("Server URL not configured. Call set_server_url() first.")
 
-        return (
-            f"{self.wmts_base}?"
-            f"SERVICE=WMTS&REQUEST=GetTile&VERSION=1.0.0&"
-            f"LAYER={layer_name}&STYLE=&"
-            f"TILEMATRIXSET={TILE_MATRIX_SET}&"
-            f"TILEMATRIX={zoom}&TILEROW={row}&TILECOL={col}&"
-            f"FORMAT={TILE_FORMAT}"
-        )
+        return self._tile_url_template.format(layer=layer_name, zoom=zoom, row=row, col=col)
 
     def generate_wms_url(
         self, layer_name: str, width: int = 600, height: int = 400, crs: str = "EPSG:4326"
@@ -173,17 +199,58 @@ class GeoServerTester(BaseBenchmarker):
             f"FORMAT={TILE_FORMAT}"
         )
 
+    def generate_render_url(
+        self,
+        layer_name: str,
+        width: int = RENDER_TILE_SIZE,
+        height: int = RENDER_TILE_SIZE,
+        rng: random.Random = random,
+    ) -> str:
+        """Generate an untiled WMS GetMap URL over a random window of the layer
+
+        TILED=false keeps the request off GeoWebCache, and the randomly placed
+        bbox is unlikely to have been rendered before, so the benchmark measures
+        map rendering rather than cached tile delivery.
+        """
+        if not self.wms_base:
+            raise ValueError("Server URL not configured. Call set_server_url() first.")
+
+        layer_info = self.get_layer_info(layer_name)
+        if layer_info and layer_info.bbox:
+            bbox = layer_info.bbox
+            minx, miny, maxx, maxy = bbox["minx"], bbox["miny"], bbox["maxx"], bbox["maxy"]
+        else:
+            minx, miny, maxx, maxy = WORLD_BBOX_4326
+
+        span_x = (maxx - minx) * RENDER_WINDOW_FRACTION
+        span_y = (maxy - miny) * RENDER_WINDOW_FRACTION
+        x0 = rng.uniform(minx, maxx - span_x)
+        y0 = rng.uniform(miny, maxy - span_y)
+
+        return (
+            f"{self.wms_base}?"
+            f"SERVICE=WMS&VERSION=1.1.0&REQUEST=GetMap&"
+            f"LAYERS={layer_name}&STYLES=&SRS=EPSG:4326&"
+            f"BBOX={x0},{y0},{x0 + span_x},{y0 + span_y}&"
+            f"WIDTH={width}&HEIGHT={height}&TILED=false&"
+            f"FORMAT={TILE_FORMAT}"
+        )
+
     def test_connectivity(self, layer_name: str) -> Tuple[bool, int]:
         """Test if a layer is accessible"""
         try:
             tile_url = self.generate_tile_url(layer_name)
-            response = requests.get(tile_url, timeout=REQUEST_TIMEOUT)
+            response = get_http_session().get(tile_url, timeout=REQUEST_TIMEOUT)
             return response.status_code == 200, response.status_code
         except (requests.RequestException, ValueError):
             return False, 0
 
-    def test_all_connectivity(self) -> Dict[str, Tuple[bool, int]]:
-        """Test connectivity for all discovered layers"""
+    def test_all_connectivity(self, max_workers: int = 8) -> Dict[str, Tuple[bool, int]]:
+        """Test connectivity for all discovered layers
+        
+        Probes are independent round trips, so up to max_workers run at once.
+        Results keep the order of self.layers.
+        """
         if not self.layers:
             console.print(
                 f"[{KARTOZA_COLORS['alert']}]❌ No layers discovered. Run discover_layers() first.[/]"
@@ -204,12 +271,18 @@ class GeoServerTester(BaseBenchmarker):
                 "Testing layer connectivity...", total=len(self.layers)
             )
 
-            for layer_name, layer_info in self.layers.items():
-                progress.update(task, description=f"Testing {layer_info.title}")
-                results[layer_name] = self.test_connectivity(layer_name)
-                progress.advance(task)
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(self.layers))) as executor:
+                futures = {
+                    executor.submit(self.test_connectivity, layer_name): layer_name
+                    for layer_name in self.layers
+                }
+                for future in as_completed(futures):
+                    layer_name = futures[future]
+                    results[layer_name] = future.result()
+                    progress.update(task, description=f"Tested {self.layers[layer_name].title}")
+                    progress.advance(task)
 
-        return results
+        return {layer_name: results[layer_name] for layer_name in self.layers}
 
     def download_map_preview(self, layer_name: str) -> Optional[Path]:
         """Download a WMS map preview using the same working logic as report generation"""
@@ -279,8 +352,15 @@ class GeoServerTester(BaseBenchmarker):
                                 subprocess.run(['fim', str(preview_path)], check=False)
                             except Exception:
                                 try:
-                                    subprocess.run(['xdg-open', str(preview_path)], check=False)
-                                except Exception:
+                                    # Hand off to the desktop viewer without waiting for it
+                                    subprocess.Popen(
+                                        ['xdg-open', str(preview_path)],
+                                        stdin=subprocess.DEVNULL,
+                                        stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.DEVNULL,
+                                        start_new_session=True,
+                                    )
+                                except OSError:
                                     console.print(f"[dim]View manually: {preview_path}[/dim]")
                     
                     return preview_path
@@ -298,15 +378,24 @@ class GeoServerTester(BaseBenchmarker):
         concurrency: int,
         total_requests: int = DEFAULT_TOTAL_REQUESTS,
         timestamp: Optional[str] = None,
+        render: bool = False,
     ) -> Optional[BenchmarkResult]:
-        """Run a single load test for a layer"""
+        """Run a single load test for a layer
+
+        By default Apache Bench hammers one cached WMTS tile. With render=True
+        it targets an untiled WMS GetMap instead (see generate_render_url), so
+        the figures reflect rendering capacity.
+        """
 
         if timestamp is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         test_id = f"{layer_key}_c{concurrency}_{timestamp}"
         output_prefix = self.results_dir / test_id
-        tile_url = self.generate_tile_url(layer_key)
+        if render:
+            tile_url = self.generate_render_url(layer_key)
+        else:
+            tile_url = self.generate_tile_url(layer_key)
 
         layer_info = self.layers[layer_key]
 
@@ -344,14 +433,75 @@ class GeoServerTester(BaseBenchmarker):
         )
 
         # Save detailed test metadata to JSON
-        self._save_test_metadata(result, tile_url, layer_info)
+        self._save_test_metadata(result, tile_url, layer_info, "WMS" if render else "WMTS")
 
         return result
 
+    def run_concurrency_tests(
+        self,
+        layer_key: str,
+        concurrency_levels: List[int],
+        total_requests: int = DEFAULT_TOTAL_REQUESTS,
+        max_parallel: int = 1,
+        on_start: Optional[Callable[[int], None]] = None,
+        on_complete: Optional[Callable[[int, Optional[BenchmarkResult]], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        render: bool = False,
+    ) -> List[Optional[BenchmarkResult]]:
+        """Run a layer test at each concurrency level, up to max_parallel at a time
+
+        Every level is its own Apache Bench process, so worker threads only wait
+        on subprocesses. Results are returned in concurrency_levels order, with
+        None for failed levels. Parallel levels compete for the same server, so
+        max_parallel=1 keeps the per-level figures independent. Once
+        cancel_event is set, levels that have not started yet are skipped
+        (also None) while running ones finish; Apache Bench runs outside the
+        terminal's process group, so a Ctrl-C does not cut them short. Call
+        terminate_apache_bench() to abort those too. render=True benchmarks
+        the uncached WMS GetMap workload, as in run_single_test.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        def run_level(concurrency: int) -> Optional[BenchmarkResult]:
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            if on_start:
+                on_start(concurrency)
+            result = self.run_single_test(
+                layer_key, concurrency, total_requests, timestamp, render=render
+            )
+            if on_complete:
+                on_complete(concurrency, result)
+            return result
+
+        if max_parallel <= 1:
+            return [run_level(concurrency) for concurrency in concurrency_levels]
+
+        with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+            return list(executor.map(run_level, concurrency_levels))
+
     def _save_test_metadata(
-        self, result: BenchmarkResult, tile_url: str, layer_info
+        self, result: BenchmarkResult, tile_url: str, layer_info, protocol: str = "WMTS"
     ):
-        """Save detailed test metadata to JSON file"""
+        """Save detailed test metadata to JSON file
+
+        WMTS runs record the tile that was requested; WMS runs record the
+        GetMap window and image size instead.
+        """
+
+        if protocol == "WMS":
+            query = parse_qs(urlsplit(tile_url).query)
+            request_fields = {
+                "bbox": query["BBOX"][0],
+                "width": query["WIDTH"][0],
+                "height": query["HEIGHT"][0],
+            }
+        else:
+            request_fields = {
+                "tile_matrix": str(DEFAULT_ZOOM_LEVEL),
+                "tile_row": str(DEFAULT_TILE_ROW),
+                "tile_col": str(DEFAULT_TILE_COL),
+            }
 
         metadata = {
             "layer": result.target,
@@ -363,10 +513,8 @@ class GeoServerTester(BaseBenchmarker):
             "tile_url": tile_url,
             "test_date": datetime.now().isoformat(),
             "server": "climate-adaptation-services.geospatialhosting.com",
-            "protocol": "WMTS",
-            "tile_matrix": str(DEFAULT_ZOOM_LEVEL),
-            "tile_row": str(DEFAULT_TILE_ROW),
-            "tile_col": str(DEFAULT_TILE_COL),
+            "protocol": protocol,
+            **request_fields,
             "format": TILE_FORMAT,
             "results": {
                 "requests_per_second": f"{result.requests_per_second:.2f}",
@@ -380,14 +528,19 @@ class GeoServerTester(BaseBenchmarker):
 
         json_file = self.results_dir / f"{result.test_id}.json"
         with open(json_file, "w") as f:
-            json.dump(metadata, f, indent=2)
+            f.write(json.dumps(metadata, indent=2))
 
     def run_comprehensive_test(
         self,
         total_requests: int = DEFAULT_TOTAL_REQUESTS,
         concurrency_levels: Optional[List[int]] = None,
+        render: bool = False,
     ) -> List[BenchmarkResult]:
-        """Run comprehensive tests across all layers and concurrency levels"""
+        """Run comprehensive tests across all layers and concurrency levels
+
+        render=True benchmarks the uncached WMS GetMap workload for every test,
+        as in run_single_test.
+        """
 
         if concurrency_levels is None:
             concurrency_levels = CONCURRENCY_LEVELS
@@ -409,9 +562,14 @@ class GeoServerTester(BaseBenchmarker):
         # Clear previous results
         self.clear_results()
 
+        # Probe every layer up front, concurrently, rather than one by one mid-sweep
+        connectivity = self.test_all_connectivity()
+
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        all_results = []
         total_tests = len(self.layers) * len(concurrency_levels)
+        # One slot per planned test; unused slots are trimmed once the sweep ends
+        all_results: List[Optional[BenchmarkResult]] = [None] * total_tests
+        completed = 0
 
         with Progress(
             SpinnerColumn(),
@@ -426,11 +584,9 @@ class GeoServerTester(BaseBenchmarker):
                 "Running comprehensive load tests...", total=total_tests
             )
 
-            for layer_key in self.layers:
-                layer_info = self.layers[layer_key]
+            for layer_key, layer_info in self.layers.items():
 
-                # Test connectivity first
-                is_accessible, status_code = self.test_connectivity(layer_key)
+                is_accessible, status_code = connectivity[layer_key]
                 if not is_accessible:
                     console.print(
                         f"[{KARTOZA_COLORS['alert']}]❌ Skipping {layer_info.title} - "
@@ -441,9 +597,7 @@ class GeoServerTester(BaseBenchmarker):
                         progress.advance(main_task)
                     continue
 
-                console.print(
-                    f"[{KARTOZA_COLORS['highlight2']}]🗺️  Testing: {layer_info.title}[/]"
-                )
+                console.print(Text(f"🗺️  Testing: {layer_info.title}", style=_STYLE_TESTING))
 
                 for concurrency in concurrency_levels:
                     progress.update(
@@ -451,23 +605,25 @@ class GeoServerTester(BaseBenchmarker):
                     )
 
                     result = self.run_single_test(
-                        layer_key, concurrency, total_requests, timestamp
+                        layer_key, concurrency, total_requests, timestamp, render=render
                     )
 
                     if result:
-                        all_results.append(result)
-                        console.print(
-                            f"[{KARTOZA_COLORS['highlight4']}]  ✅ C={concurrency}: "
+                        all_results[completed] = result
+                        completed += 1
+                        console.print(Text(
+                            f"  ✅ C={concurrency}: "
                             f"{result.requests_per_second:.1f} RPS, "
-                            f"{result.mean_response_time:.1f}ms avg[/]"
-                        )
+                            f"{result.mean_response_time:.1f}ms avg",
+                            style=_STYLE_PASS,
+                        ))
                     else:
-                        console.print(
-                            f"[{KARTOZA_COLORS['alert']}]  ❌ C={concurrency}: Failed[/]"
-                        )
+                        console.print(Text(f"  ❌ C={concurrency}: Failed", style=_STYLE_FAIL))
 
                     progress.advance(main_task)
 
+        del all_results[completed:]
+
         # Save consolidated results
         if all_results:
             report_generator = ReportGenerator("geoserver")
@@ -475,7 +631,8 @@ class GeoServerTester(BaseBenchmarker):
                 "total_requests": total_requests,
                 "concurrency_levels": concurrency_levels,
                 "layers_tested": list(self.layers.keys()),
-                "server": self.server_url or "unknown"
+                "server": self.server_url or "unknown",
+                "protocol": "WMS" if render else "WMTS",
             }
             report_generator.consolidate_results(all_results, timestamp, test_config)
 
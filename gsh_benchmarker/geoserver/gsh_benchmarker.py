@@ -34,75 +34,52 @@ console = Console()
 
 def show_help():
     """Show detailed help information"""
-    help_text = Text()
-    help_text.append(
-        "GeoServer Load Testing Suite", style=f"bold {KARTOZA_COLORS['highlight2']}"
-    )
-    help_text.append("\n\n")
-    help_text.append(
-        "Available Commands:", style=f"bold {KARTOZA_COLORS['highlight1']}"
-    )
-    help_text.append("\n")
-    help_text.append(
-        "  --help              Show this help message\n",
-        style=f"{KARTOZA_COLORS['highlight3']}",
-    )
-    help_text.append(
-        "  --connectivity      Test connectivity to all layers\n",
-        style=f"{KARTOZA_COLORS['highlight3']}",
-    )
-    help_text.append(
-        "  --single LAYER      Run test for specific layer\n",
-        style=f"{KARTOZA_COLORS['highlight3']}",
-    )
-    help_text.append(
-        "  --comprehensive     Run comprehensive test suite\n",
-        style=f"{KARTOZA_COLORS['highlight3']}",
-    )
-    help_text.append(
-        "  --results           Show summary of recent results\n",
-        style=f"{KARTOZA_COLORS['highlight3']}",
-    )
-    help_text.append("\n")
-    help_text.append("Options:", style=f"bold {KARTOZA_COLORS['highlight1']}")
-    help_text.append("\n")
-    help_text.append(
-        "  --requests N        Number of requests per test (default: 5000)\n",
-        style=f"{KARTOZA_COLORS['highlight3']}",
-    )
-    help_text.append(
-        "  --concurrency LIST  Comma-separated concurrency levels\n",
-        style=f"{KARTOZA_COLORS['highlight3']}",
-    )
-    help_text.append(
-        "                      (default: 1,10,100,500,1000,2000,3000,4000,5000)\n",
-        style=f"{KARTOZA_COLORS['highlight3']}",
-    )
-    help_text.append("\n")
-    help_text.append("Layer Discovery:", style=f"bold {KARTOZA_COLORS['highlight1']}")
-    help_text.append("\n")
-    help_text.append(
-        "  Layers are discovered dynamically from GeoServer GetCapabilities\n",
-        style=f"{KARTOZA_COLORS['highlight3']}",
-    )
-    help_text.append(
-        "  No hardcoded layer list - works with any GeoServer instance\n",
-        style=f"{KARTOZA_COLORS['highlight3']}",
-    )
-    help_text.append("\n")
-    help_text.append("Examples:", style=f"bold {KARTOZA_COLORS['highlight1']}")
-    help_text.append("\n")
-    help_text.append("  python3 geotest.py\n", style=f"{KARTOZA_COLORS['highlight4']}")
-    help_text.append(
-        "  python3 geotest.py --connectivity\n", style=f"{KARTOZA_COLORS['highlight4']}"
-    )
-    help_text.append(
-        "  python3 geotest.py --single AfstandTotKoelte --requests 1000\n",
-        style=f"{KARTOZA_COLORS['highlight4']}",
-    )
-    help_text.append(
-        "  python3 geotest.py --comprehensive --concurrency 1,10,100\n",
-        style=f"{KARTOZA_COLORS['highlight4']}",
+    heading = f"bold {KARTOZA_COLORS['highlight1']}"
+    body = f"{KARTOZA_COLORS['highlight3']}"
+    example = f"{KARTOZA_COLORS['highlight4']}"
+    help_text = Text.assemble(
+        ("GeoServer Load Testing Suite", f"bold {KARTOZA_COLORS['highlight2']}"),
+        "\n\n",
+        ("Available Commands:", heading),
+        "\n",
+        (
+            "  --help              Show this help message\n"
+            "  --connectivity      Test connectivity to all layers\n"
+            "  --single LAYER      Run test for specific layer\n"
+            "  --comprehensive     Run comprehensive test suite\n"
+            "  --results           Show summary of recent results\n",
+            body,
+        ),
+        "\n",
+        ("Options:", heading),
+        "\n",
+        (
+            "  --requests N        Number of requests per test (default: 5000)\n"
+            "  --concurrency LIST  Comma-separated concurrency levels\n"
+            "                      (default: 1,10,100,500,1000,2000,3000,4000,5000)\n"
+            "  --render            Benchmark untiled WMS GetMap rendering instead of\n"
+            "                      cached WMTS tiles (with --single or --comprehensive)\n",
+            body,
+        ),
+        "\n",
+        ("Layer Discovery:", heading),
+        "\n",
+        (
+            "  Layers are discovered dynamically from GeoServer GetCapabilities\n"
+            "  No hardcoded layer list - works with any GeoServer instance\n",
+            body,
+        ),
+        "\n",
+        ("Examples:", heading),
+        "\n",
+        (
+            "  python3 geotest.py\n"
+            "  python3 geotest.py --connectivity\n"
+            "  python3 geotest.py --single AfstandTotKoelte --requests 1000\n"
+            "  python3 geotest.py --comprehensive --concurrency 1,10,100\n"
+            "  python3 geotest.py --comprehensive --render --requests 500\n",
+            example,
+        ),
     )
 
     panel = Panel.fit(
@@ -173,7 +150,8 @@ def test_connectivity(server_url=None):
         )
 
 
-def run_single_test(layer_name: str, requests: int, concurrency: int, server_url=None):
+def run_single_test(layer_name: str, requests: int, concurrency: int, server_url=None,
+                    render: bool = False):
     """Run a single layer test"""
     # Get server URL interactively if not provided
     if not server_url:
@@ -203,6 +181,8 @@ def run_single_test(layer_name: str, requests: int, concurrency: int, server_url
     console.print(f"[{KARTOZA_COLORS['highlight3']}]Layer: {layer_info.title}[/]")
     console.print(f"[{KARTOZA_COLORS['highlight3']}]Requests: {requests:,}[/]")
     console.print(f"[{KARTOZA_COLORS['highlight3']}]Concurrency: {concurrency}[/]")
+    if render:
+        console.print(f"[{KARTOZA_COLORS['highlight3']}]Workload: rendered WMS GetMap (uncached)[/]")
     console.print()
 
     # Test connectivity first
@@ -220,7 +200,7 @@ def run_single_test(layer_name: str, requests: int, concurrency: int, server_url
     with console.status(
         f"[{KARTOZA_COLORS['highlight1']}]Running Apache Bench test..."
     ):
-        result = tester.run_single_test(layer_name, concurrency, requests)
+        result = tester.run_single_test(layer_name, concurrency, requests, render=render)
 
     if result:
         console.print(
@@ -254,7 +234,7 @@ def run_single_test(layer_name: str, requests: int, concurrency: int, server_url
 
 
 def run_comprehensive_test(
-    requests: int, concurrency_levels: List[int], server_url=None
+    requests: int, concurrency_levels: List[int], server_url=None, render: bool = False
 ):
     """Run comprehensive test suite"""
     # Get server URL interactively if not provided
@@ -284,9 +264,11 @@ def run_comprehensive_test(
     console.print(
         f"  • Total requests: {requests * len(tester.layers) * len(concurrency_levels):,}"
     )
+    if render:
+        console.print("  • Workload: rendered WMS GetMap (uncached)")
     console.print()
 
-    results = tester.run_comprehensive_test(requests, concurrency_levels)
+    results = tester.run_comprehensive_test(requests, concurrency_levels, render=render)
 
     if results:
         console.print(
@@ -439,6 +421,11 @@ Examples:
         action="append",
         help="Output format (json, csv - currently not used)",
     )
+    parser.add_argument(
+        "--render",
+        action="store_true",
+        help="Benchmark untiled WMS GetMap rendering instead of cached WMTS tiles",
+    )
     parser.add_argument(
         "--url", type=str, help="GeoServer URL (e.g., https://example.com/geoserver)"
     )
@@ -461,9 +448,9 @@ Examples:
         # For single tests, use first concurrency level or default
         concurrency = concurrency_levels[0] if concurrency_levels else 100
         layer_name = args.single or args.layer
-        run_single_test(layer_name, args.requests, concurrency, args.url)
+        run_single_test(layer_name, args.requests, concurrency, args.url, args.render)
     elif args.comprehensive:
-        run_comprehensive_test(args.requests, concurrency_levels, args.url)
+        run_comprehensive_test(args.requests, concurrency_levels, args.url, args.render)
     elif args.results:
         show_results()
     else:
@@ -7,6 +7,7 @@ import os
 import base64
 import subprocess
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 from rich.console import Console
@@ -14,12 +15,20 @@ from rich.console import Console
 console = Console()
 
 
+@lru_cache(maxsize=None)
+def _installed_tools() -> Tuple[str, ...]:
+    """ASCII renderers found on PATH, probed once per process"""
+    # Check for chafa, img2txt (from libcaca) and jp2a (for JPEG to ASCII)
+    return tuple(tool for tool in ('chafa', 'img2txt', 'jp2a') if shutil.which(tool))
+
+
 class TerminalImageRenderer:
     """Handle rendering images in terminal using various methods"""
     
     def __init__(self):
         self.terminal_type = self._detect_terminal_type()
         self.available_renderers = self._detect_available_renderers()
+        self._capabilities: Optional[dict] = None
     
     def _detect_terminal_type(self) -> str:
         """Detect the type of terminal we're running in"""
@@ -42,19 +51,7 @@ class TerminalImageRenderer:
     
     def _detect_available_renderers(self) -> list:
         """Detect which image rendering tools are available"""
-        renderers = []
-        
-        # Check for chafa
-        if shutil.which('chafa'):
-            renderers.append('chafa')
-        
-        # Check for img2txt (from libcaca)
-        if shutil.which('img2txt'):
-            renderers.append('img2txt')
-        
-        # Check for jp2a (for JPEG to ASCII)
-        if shutil.which('jp2a'):
-            renderers.append('jp2a')
+        renderers = list(_installed_tools())
         
         # Kitty terminal support
         if self.terminal_type == 'kitty':
@@ -245,13 +242,18 @@ class TerminalImageRenderer:
         return False
     
     def get_capabilities_info(self) -> dict:
-        """Get information about available rendering capabilities"""
-        return {
-            'terminal_type': self.terminal_type,
-            'available_renderers': self.available_renderers,
-            'preferred_renderer': self.available_renderers[0] if self.available_renderers else None,
-            'supports_true_images': 'kitty' in self.available_renderers or 'iterm2' in self.available_renderers
-        }
+        """Get information about available rendering capabilities
+        
+        Built once per renderer, since terminal type and renderers are fixed at init.
+        """
+        if self._capabilities is None:
+            self._capabilities = {
+                'terminal_type': self.terminal_type,
+                'available_renderers': self.available_renderers,
+                'preferred_renderer': self.available_renderers[0] if self.available_renderers else None,
+                'supports_true_images': 'kitty' in self.available_renderers or 'iterm2' in self.available_renderers
+            }
+        return self._capabilities
     
     def print_capabilities(self):
         """Print information about rendering capabilities"""
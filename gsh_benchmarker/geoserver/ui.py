@@ -2,31 +2,38 @@
 Rich-based user interface for GeoServer load testing
 """
 
+import importlib.util
+import heapq
+import os
+import re
 import sys
+import select
 import subprocess
-import glob
+import shutil
 import termios
+import threading
 import tty
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Callable, Optional, List, Dict, Sequence, Tuple
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.prompt import Prompt, IntPrompt, Confirm
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich.panel import Panel
 from rich.table import Table
+from rich.style import Style
 from rich.text import Text
-from rich.columns import Columns
 from rich.align import Align
-from rich.layout import Layout
-from rich.live import Live
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn, MofNCompleteColumn
+from rich.markup import escape
+from rich.cells import cell_len
 
-try:
-    import questionary
-    QUESTIONARY_AVAILABLE = True
-except ImportError:
-    QUESTIONARY_AVAILABLE = False
-    questionary = None
+# questionary is optional and only imported the first time an interactive select is shown
+QUESTIONARY_AVAILABLE = importlib.util.find_spec("questionary") is not None
 
 from .core import GeoServerTester
 from .config import (
@@ -38,6 +45,7 @@ from .subdomain_manager import get_server_url_interactive
 from .image_renderer import TerminalImageRenderer
 from ..common import (
     ReportGenerator,
+    terminate_apache_bench,
     execute_external_report_generator,
     find_latest_report_file,
     create_benchmark_summary_panel,
@@ -48,6 +56,163 @@ from ..common.test_config import TestConfigManager, parse_concurrency_list, vali
 
 console = Console()
 
+# Rich style strings used throughout the menus, built once at import
+STYLE_BOLD_BLUE = f"bold {KARTOZA_COLORS['primary_blue']}"
+STYLE_BOLD_ORANGE = f"bold {KARTOZA_COLORS['primary_orange']}"
+STYLE_BOLD_GREEN = f"bold {KARTOZA_COLORS['success_green']}"
+STYLE_BOLD_RED = f"bold {KARTOZA_COLORS['danger_red']}"
+STYLE_BOLD_AMBER = f"bold {KARTOZA_COLORS['warning_amber']}"
+STYLE_BOLD_ACCENT = f"bold {KARTOZA_COLORS['accent']}"
+STYLE_HIGHLIGHT_BG = f"bold {KARTOZA_COLORS['primary_blue']} on grey11"
+STYLE_HIGHLIGHT1 = KARTOZA_COLORS['highlight1']
+STYLE_HIGHLIGHT2 = KARTOZA_COLORS['highlight2']
+STYLE_HIGHLIGHT3 = KARTOZA_COLORS['highlight3']
+STYLE_HIGHLIGHT4 = KARTOZA_COLORS['highlight4']
+STYLE_ALERT = KARTOZA_COLORS['alert']
+
+SEPARATOR_50 = f"[{KARTOZA_COLORS['border']}]{'─' * 50}[/]"
+SEPARATOR_60 = f"[{KARTOZA_COLORS['border']}]{'─' * 60}[/]"
+_separator_cache: Dict[int, str] = {50: SEPARATOR_50, 60: SEPARATOR_60}
+
+# Fixed prompt texts, styled once so Prompt/Confirm skip markup parsing on every ask
+PROMPT_CONTINUE = Text("Press Enter to continue: ")
+PROMPT_START_SUITE = Text("Start load test suite?", style=KARTOZA_COLORS['highlight4'])
+PROMPT_RUN_PARALLEL = Text(
+    "Run concurrency levels in parallel? (faster, but levels share server capacity)",
+    style=KARTOZA_COLORS['highlight3']
+)
+PROMPT_RENDER_WORKLOAD = Text(
+    "Benchmark uncached WMS GetMap rendering instead of cached WMTS tiles?",
+    style=KARTOZA_COLORS['highlight3']
+)
+PROMPT_CONFIRM_COMPREHENSIVE = Text("⚠️  This is a comprehensive test. Continue?", style=KARTOZA_COLORS['alert'])
+PROMPT_GENERATE_PDF = Text("Generate PDF report?", style=KARTOZA_COLORS['highlight4'])
+PROMPT_TEXT_REPORT = Text("Generate text report instead?", style=KARTOZA_COLORS['highlight3'])
+PROMPT_OPEN_PDF = Text("Open PDF report now?", style=KARTOZA_COLORS['highlight2'])
+
+# Fixed status messages shared between menus, styled once at import
+MSG_NO_SERVER = Text.assemble(
+    ("× ", STYLE_BOLD_RED),
+    ("No server configured. Please run server setup first", KARTOZA_COLORS['danger_red'])
+)
+MSG_NO_LAYERS = Text("❌ No layers available", style=KARTOZA_COLORS['alert'])
+MSG_RUN_TESTS_FIRST = Text("💡 Run some benchmark tests first", style=KARTOZA_COLORS['highlight3'])
+MSG_PDF_DEPS_MISSING = Text("❌ PDF generation requires additional dependencies", style=KARTOZA_COLORS['alert'])
+MSG_OPERATION_CANCELLED = Text("Operation cancelled", style=KARTOZA_COLORS['highlight3'])
+MSG_NO_CHANGES = Text("No changes made", style=KARTOZA_COLORS['highlight3'])
+
+
+def _separator(width: int) -> str:
+    """Border-coloured horizontal rule markup of the given width"""
+    markup = _separator_cache.get(width)
+    if markup is None:
+        markup = _separator_cache[width] = f"[{KARTOZA_COLORS['border']}]{'─' * width}[/]"
+    return markup
+
+
+def _print_block(*lines: str):
+    """Print several markup lines, followed by a blank line, with a single console write"""
+    console.print("\n".join(lines) + "\n")
+
+
+def _pause():
+    """Wait for Enter; a bare continue prompt needs none of Prompt's default/validation handling"""
+    console.input(PROMPT_CONTINUE)
+
+
+def _print_group(*renderables: RenderableType):
+    """Print a sequence of renderables as one group, in a single render pass and write"""
+    console.print(Group(*renderables))
+
+
+_RESULT_FILENAME_RE = re.compile(r"consolidated_(.+?)_results_(\d{8})_(\d{6})\.json")
+
+
+@lru_cache(maxsize=512)
+def _parse_result_filename(name: str) -> Optional[str]:
+    """Formatted date/time embedded in a consolidated results filename, if any
+    
+    Example: consolidated_geoserver_results_20241116_093401.json -> 2024-11-16 09:34:01
+    """
+    match = _RESULT_FILENAME_RE.fullmatch(name)
+    if match is None:
+        return None
+    date_str, time_str = match.group(2), match.group(3)
+    return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]} {time_str[:2]}:{time_str[2:4]}:{time_str[4:6]}"
+
+
+def _format_result_choice(file_path: str) -> str:
+    """Selection label for a results file: its embedded date/time and name, or just the name"""
+    filename = os.path.basename(file_path)
+    formatted_date = _parse_result_filename(filename)
+    return f"{formatted_date} - {filename}" if formatted_date else filename
+
+
+def _list_consolidated_results(results_dir: Path, service_type: str = "",
+                               limit: Optional[int] = None) -> Tuple[List[str], int]:
+    """Newest consolidated result files in ``results_dir`` and how many exist in total
+    
+    The filenames embed a sortable YYYYMMDD_HHMMSS timestamp, so ordering by
+    name needs no per-file stat() call. With ``limit`` only that many newest
+    files are selected (a heap top-k) rather than sorting the whole directory.
+    """
+    prefix = f"consolidated_{service_type}_results_" if service_type else "consolidated_"
+    try:
+        with os.scandir(results_dir) as it:
+            names = [
+                entry.name for entry in it
+                if entry.name.startswith(prefix) and entry.name.endswith(".json")
+                and "_results_" in entry.name and entry.is_file(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        return [], 0
+    if limit is None:
+        newest = sorted(names, reverse=True)
+    else:
+        newest = heapq.nlargest(limit, names)
+    return [str(Path(results_dir) / name) for name in newest], len(names)
+
+
+# Success-rate colour bands as parsed styles, checked from the highest lower bound down; anything below is red
+_SUCCESS_THRESHOLDS = (
+    (98, Style.parse(KARTOZA_COLORS['success_green'])),
+    (90, Style.parse(KARTOZA_COLORS['warning_amber'])),
+)
+_SUCCESS_RATE_LOW = Style.parse(KARTOZA_COLORS['danger_red'])
+
+
+def _success_rate_cell(success_rate: float) -> Text:
+    """Success-rate table cell, coloured green/amber/red by threshold
+    
+    Returned as styled Text so the table does not parse markup for every row.
+    """
+    success_style = next(
+        (style for threshold, style in _SUCCESS_THRESHOLDS if success_rate >= threshold),
+        _SUCCESS_RATE_LOW
+    )
+    return Text(f"{success_rate:.1f}%", style=success_style)
+
+
+def _require_pdf_generator():
+    """The PDF generator, loaded by ..common on first use
+    
+    Raises ImportError when its optional plotting/PDF dependencies are missing,
+    matching what the previous per-call import did.
+    """
+    from ..common import PDF_GENERATOR_AVAILABLE, generate_pdf_report
+
+    if not PDF_GENERATOR_AVAILABLE:
+        raise ImportError("PDF generator dependencies are not installed")
+    return generate_pdf_report
+
+
+@lru_cache(maxsize=None)
+def _load_questionary():
+    """Import questionary on first use"""
+    import questionary
+    return questionary
+
+
 class MenuInterface:
     """Rich-based menu interface for the GeoServer testing suite"""
     
@@ -56,165 +221,392 @@ class MenuInterface:
         self.tester = GeoServerTester()
         self.server_configured = False
         self.image_renderer = TerminalImageRenderer()
-        self.monitoring_config = MonitoringConfigManager()
         self.test_config = TestConfigManager()
         self.use_interactive_menus = QUESTIONARY_AVAILABLE
+        # Rendered endpoint selection labels, keyed by label variant
+        self._choices_cache: Dict[str, List[str]] = {}
+        # Snapshot of (name, endpoint) pairs the cached labels were built from
+        self._endpoint_items_cache: Optional[Tuple[Tuple[str, MonitoringEndpoint], ...]] = None
+        # Pre-rendered output of static screens (banner, help) and the width it was laid out for
+        self._static_render_cache: Dict[str, Tuple[int, str]] = {}
+        # Pre-rendered menu frames, keyed by (choices, title, width, server_configured)
+        self._menu_render_cache: Dict[tuple, Tuple[str, List[str], List[str], str, bool]] = {}
+        # (layers_version, layer names, layer choice labels, widest label)
+        self._layer_choices_cache: Optional[Tuple[int, List[str], List[str], int]] = None
+        # Keys read from the terminal but not yet consumed by a menu
+        self._key_buf = ""
+    
+    @cached_property
+    def monitoring_config(self) -> MonitoringConfigManager:
+        """Monitoring configuration, loaded on first use of the monitoring menus"""
+        return MonitoringConfigManager()
+    
+    @cached_property
+    def _service_info_panel(self) -> Optional[Panel]:
+        """Panel summarising the connected service, built on first display after discovery"""
+        service_info = self.tester.service_info
+        if not service_info:
+            return None
+        
+        info_text = Text()
+        info_text.append("Service: ", style=STYLE_BOLD_BLUE)
+        info_text.append(service_info.get('title', 'Unknown'), style=KARTOZA_COLORS['info_blue'])
+        if self.tester.service_abstract:
+            info_text.append("\n")
+            info_text.append(self.tester.service_abstract, style=KARTOZA_COLORS['muted'])
+        
+        return Panel.fit(
+            Align.center(info_text),
+            border_style=KARTOZA_COLORS['border'],
+            padding=(0, 1)
+        )
+    
+    @cached_property
+    def _fim_path(self) -> Optional[str]:
+        """Resolved path of the fim image viewer, looked up once on first preview"""
+        return shutil.which("fim")
+    
+    @cached_property
+    def _system_opener(self) -> Optional[str]:
+        """Resolved path of xdg-open (Linux) or open (macOS), if either is installed"""
+        return shutil.which("xdg-open") or shutil.which("open")
+    
+    def _launch_viewer(self, path: Path):
+        """Hand a file to the desktop's default viewer without waiting for it to exit
+        
+        On Windows the shell association is used directly via os.startfile, with
+        no child process. Elsewhere raises FileNotFoundError when neither xdg-open
+        nor open is installed.
+        """
+        if os.name == 'nt':
+            os.startfile(str(path))
+            return
+        subprocess.Popen(
+            [self._system_opener or "xdg-open", str(path)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
     
     def show_banner(self):
         """Display a simplified, clean banner with Kartoza branding"""
-        # Create a minimal, professional banner
-        banner_text = Text()
+        console.file.write(self._render_banner())
+    
+    def _show_screen_header(self, icon: str, title: str, separator: str = SEPARATOR_60):
+        """Clear the screen and draw the banner plus a centred section title
         
-        # Logo text only
-        banner_text.append("KARTOZA", style=f"bold {KARTOZA_COLORS['primary_orange']}")
-        banner_text.append("\nOPEN SOURCE GEOSPATIAL SOLUTIONS", style=f"{KARTOZA_COLORS['secondary_teal']}")
-        banner_text.append("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", style=f"{KARTOZA_COLORS['border']}")
+        The clear sequence, banner and title are composed first and sent to the
+        terminal in one write instead of one flush per printed line.
+        """
+        with console.capture() as capture:
+            console.print()
+            console.print(Align.center(f"[{KARTOZA_COLORS['accent']}]{icon} [/][{STYLE_BOLD_BLUE}]{title}[/]"))
+            console.print(Align.center(separator))
+            console.print()
+        self._write_screen(capture.get())
+    
+    def _write_screen(self, body: str):
+        """Clear the screen and write the banner followed by pre-rendered ``body`` in one write"""
+        clear = "\x1b[2J\x1b[H" if console.is_terminal else ""
+        self._write_frame(clear + self._render_banner() + body)
+    
+    def _render_static(self, name: str, build: Callable[[], RenderableType]) -> str:
+        """Render the output of ``build`` once per terminal width and return the cached output
+        
+        Layout of the banner, help and endpoint listing depends only on the
+        width, so a change in terminal height alone reuses the cached output.
+        ``build`` is only called when nothing usable is cached.
+        """
+        width = console.width
+        cached = self._static_render_cache.get(name)
+        if cached is not None and cached[0] == width:
+            return cached[1]
+        
+        with console.capture() as capture:
+            console.print(build())
+        self._static_render_cache[name] = (width, capture.get())
+        return self._static_render_cache[name][1]
+    
+    def _build_banner(self) -> Align:
+        """Centred Kartoza banner panel"""
+        # Create a minimal, professional banner
+        banner_text = Text.assemble(
+            ("KARTOZA", STYLE_BOLD_ORANGE),
+            ("\nOPEN SOURCE GEOSPATIAL SOLUTIONS", KARTOZA_COLORS['secondary_teal']),
+            ("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", KARTOZA_COLORS['border'])
+        )
         
         # Simple panel with minimal styling
-        panel = Panel.fit(
+        return Align.center(Panel.fit(
             Align.center(banner_text),
-            border_style=f"{KARTOZA_COLORS['primary_blue']}",
+            border_style=KARTOZA_COLORS['primary_blue'],
             padding=(1, 2)
-        )
-        
-        console.print(Align.center(panel))
+        ))
+    
+    def _render_banner(self) -> str:
+        """Banner output, rendered once per terminal width"""
+        return self._render_static("banner", self._build_banner)
+    
+    @contextmanager
+    def _raw_mode(self):
+        """Switch the terminal to raw input with a hidden cursor for the lifetime of a menu"""
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        try:
+            tty.setraw(fd)
+            # Keep output post-processing so rendered newlines still return the carriage
+            mode = termios.tcgetattr(fd)
+            mode[tty.OFLAG] |= termios.OPOST
+            termios.tcsetattr(fd, termios.TCSADRAIN, mode)
+            # The cursor would otherwise flicker across the screen on every repaint
+            self._write_frame("\x1b[?25l")
+            yield
+        finally:
+            self._write_frame("\x1b[?25h")
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
     
     def _get_key(self):
-        """Get a single keypress from the user"""
+        """Get a single keypress from the user (the terminal must be in raw mode)"""
         try:
-            # Check if we're in an interactive terminal
-            if not sys.stdin.isatty():
-                raise Exception("Not in interactive terminal")
-                
-            fd = sys.stdin.fileno()
-            old_settings = termios.tcgetattr(fd)
-            try:
-                tty.setraw(sys.stdin.fileno())
-                ch = sys.stdin.read(1)
-                if ch == '\x1b':  # ESC sequence
-                    ch += sys.stdin.read(2)
-                return ch
-            finally:
-                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+            if not self._key_buf:
+                self._read_keys(sys.stdin.fileno())
+            return self._next_key()
         except:
             # Fallback for non-terminal environments - return empty to exit loop
             return '\x1b'
-
-    def _interactive_menu(self, choices: List[str], title: str = "Main Menu", 
-                         show_skip_option: bool = False) -> Optional[int]:
-        """Interactive menu with arrow key navigation"""
+    
+    def _read_keys(self, fd: int):
+        """Block for input, then drain every byte already queued into the key buffer"""
+        data = os.read(fd, 64)
+        while data:
+            self._key_buf += data.decode("utf-8", errors="ignore")
+            # Give an escape sequence a moment to complete, otherwise only take what is pending
+            timeout = 0.05 if self._key_buf.endswith(('\x1b', '\x1b[', '\x1bO')) else 0
+            if not select.select([fd], [], [], timeout)[0]:
+                break
+            data = os.read(fd, 64)
+    
+    def _next_key(self) -> str:
+        """Pop the next complete key (a character or an escape sequence) from the key buffer"""
+        buf = self._key_buf
+        if buf.startswith(('\x1b[', '\x1bO')) and len(buf) >= 3:
+            size = 3
+        else:
+            size = 1
+        self._key_buf = buf[size:]
+        return buf[:size]
+    
+    def _interactive_menu(self, choices: Sequence[str], title: str = "Main Menu", 
+                         show_skip_option: bool = False,
+                         max_choice_width: Optional[int] = None) -> Optional[int]:
+        """Interactive menu with arrow key navigation
+        
+        ``max_choice_width`` (in terminal cells) may be passed when the caller
+        already knows the widest entry of ``choices``, saving a scan of the list.
+        """
         # Check if we're in an interactive terminal, if not, fallback to numbered menu
-        if not sys.stdin.isatty():
+        if not sys.stdin.isatty() or not console.is_terminal:
             return self._interactive_select(choices, f"Select from {title}", show_skip_option)
         
+        if max_choice_width is None:
+            max_choice_width = max(map(cell_len, choices), default=0)
         if show_skip_option:
-            choices = choices + ["← Back"]
+            choices = [*choices, "← Back"]
+            max_choice_width = max(max_choice_width, cell_len(choices[-1]))
         
         selected = 0
+        previous = 0
         max_options = len(choices)
         
-        while True:
-            # Clear screen first
-            console.clear()
-            
-            # Display logo/banner only once, properly centered
-            self.show_banner()
-            
-            # Show menu header with proper centering and spacing
-            console.print()  # Add extra space after banner
-            
-            menu_title = Text()
-            menu_title.append("▣ ", style=f"{KARTOZA_COLORS['accent']}")
-            menu_title.append(title, style=f"bold {KARTOZA_COLORS['primary_blue']}")
-            if self.server_configured:
-                menu_title.append(" • ", style=f"{KARTOZA_COLORS['neutral_grey']}")
-                menu_title.append("Server Connected", style=f"{KARTOZA_COLORS['success_green']}")
-            else:
-                menu_title.append(" • ", style=f"{KARTOZA_COLORS['neutral_grey']}")
-                menu_title.append("Setup Required", style=f"{KARTOZA_COLORS['warning_amber']}")
-            
-            console.print(Align.center(menu_title))
-            
-            # Calculate max width based on longest menu item for better centering
-            max_choice_width = max(len(choice) for choice in choices)
-            border_width = max(max_choice_width + 10, 60)  # Ensure minimum width
-            
-            console.print(Align.center(f"[{KARTOZA_COLORS['border']}]{'─' * border_width}[/]"))
-            console.print()
-            
-            # Display menu options in a perfectly centered layout
-            for i, choice in enumerate(choices):
-                if i == selected:
-                    # Highlighted selection with proper padding
-                    menu_item = Text()
-                    menu_item.append("▶ ", style=f"bold {KARTOZA_COLORS['primary_orange']}")
-                    menu_item.append(f"{choice:<{max_choice_width}}", 
-                                   style=f"bold {KARTOZA_COLORS['primary_blue']} on grey11")
-                else:
-                    # Normal menu item with consistent spacing
-                    menu_item = Text()
-                    menu_item.append("  ", style="")
-                    menu_item.append(f"{choice:<{max_choice_width}}", 
-                                   style=f"{KARTOZA_COLORS['neutral_grey']}")
+        # Screen rows of the drawn menu items; None forces a full redraw
+        row_positions = None
+        # Row just below the drawn frame, valid whenever row_positions is set
+        end_row = None
+        frame_size = None
+        banner_rows = 0
+        # Set whenever the selection moved since the last paint
+        dirty = True
+        
+        with self._raw_mode():
+            while True:
+                size = (console.width, console.height)
+                # Unmapped keys leave the screen untouched, so only paint when something changed
+                if dirty or size != frame_size:
+                    header, normal_rows, highlight_rows, footer, fits = self._prerender_menu(
+                        choices, title, size[0], max_choice_width
+                    )
                 
-                console.print(Align.center(menu_item))
-            
-            console.print()
-            console.print()
-            
-            # Instructions at bottom
-            instructions = Text()
-            instructions.append("↑↓ ", style=f"bold {KARTOZA_COLORS['primary_blue']}")
-            instructions.append("Navigate  ", style=f"{KARTOZA_COLORS['muted']}")
-            instructions.append("Enter ", style=f"bold {KARTOZA_COLORS['success_green']}")
-            instructions.append("Select  ", style=f"{KARTOZA_COLORS['muted']}")
-            instructions.append("Esc ", style=f"bold {KARTOZA_COLORS['danger_red']}")
-            instructions.append("Cancel", style=f"{KARTOZA_COLORS['muted']}")
-            
-            console.print(Align.center(instructions))
-            
-            # Get user input
-            key = self._get_key()
-            
-            if key == '\x1b[A':  # Up arrow
-                selected = (selected - 1) % max_options
-            elif key == '\x1b[B':  # Down arrow  
-                selected = (selected + 1) % max_options
-            elif key == '\r' or key == '\n':  # Enter
-                if show_skip_option and selected == len(choices) - 1:
-                    return None  # User selected "Back"
-                return selected
-            elif key == '\x1b':  # Escape
-                return None
-            elif key == 'q' or key == 'Q':  # Quit
-                return None
+                    if row_positions is not None and size == frame_size:
+                        # Only the previously and newly highlighted rows changed - rewrite just those
+                        frame = []
+                        for index in (previous, selected):
+                            row = (highlight_rows if index == selected else normal_rows)[index].rstrip("\n")
+                            frame.append(f"\x1b[{row_positions[index]};1H\x1b[2K{row}")
+                        # Park the cursor below the frame again so later output follows the menu
+                        frame.append(f"\x1b[{end_row};1H")
+                        self._write_frame("".join(frame))
+                    else:
+                        rows = [highlight_rows[i] if i == selected else normal_rows[i] for i in range(max_options)]
+                        body = header + "".join(rows) + footer
+                        body_lines = body.count("\n")
+                
+                        if size == frame_size and banner_rows + body_lines < size[1]:
+                            # The banner from the last full paint is still on screen - repaint below it only
+                            self._write_frame(f"\x1b[{banner_rows + 1};1H" + body + "\x1b[J")
+                        else:
+                            # Clear the screen on entry, resize or after scrolling, then draw banner and menu
+                            banner = self._render_banner()
+                            banner_rows = banner.count("\n")
+                            self._write_frame("\x1b[2J\x1b[H" + banner + body + "\x1b[J")
+                
+                        # Row-level redraws are only safe when no line wrapped and nothing scrolled
+                        header_lines = banner_rows + header.count("\n")
+                        total_lines = banner_rows + body_lines
+                        if total_lines < size[1] and fits:
+                            row_positions = [header_lines + i + 1 for i in range(len(rows))]
+                            end_row = total_lines + 1
+                        else:
+                            row_positions = None
+                        frame_size = size
+                    dirty = False
+            
+                # Get user input
+                key = self._get_key()
+                previous = selected
+            
+                # Apply every queued arrow key before redrawing so key bursts only paint the final position
+                while key in ('\x1b[A', '\x1b[B'):
+                    if key == '\x1b[A':  # Up arrow
+                        selected = (selected - 1) % max_options
+                    else:  # Down arrow
+                        selected = (selected + 1) % max_options
+                    key = self._get_key() if self._key_buf else None
+                dirty = selected != previous
+            
+                if key == '\r' or key == '\n':  # Enter
+                    if show_skip_option and selected == len(choices) - 1:
+                        return None  # User selected "Back"
+                    return selected
+                elif key == '\x1b':  # Escape
+                    return None
+                elif key == 'q' or key == 'Q':  # Quit
+                    return None
+    
+    def _write_frame(self, frame: str):
+        """Emit a complete frame with a single write to the terminal
+        
+        Frames are already rendered ANSI text, so they are encoded and handed
+        straight to the file descriptor, bypassing the text layer's buffering.
+        """
+        out = console.file
+        try:
+            fd = out.fileno()
+        except (AttributeError, OSError, ValueError):
+            # Not backed by a real descriptor (e.g. captured output)
+            out.write(frame)
+            out.flush()
+            return
+        
+        # Anything still sitting in the text buffer must reach the terminal first
+        out.flush()
+        data = frame.encode(console.encoding, "replace")
+        while data:
+            written = os.write(fd, data)
+            data = data[written:]
+    
+    def _prerender_menu(self, choices: Sequence[str], title: str, width: int,
+                        max_choice_width: int) -> Tuple[str, List[str], List[str], str, bool]:
+        """Render menu header, normal/highlighted rows and footer once per menu and width
+        
+        The final flag is False when any line is wider than ``width`` and so wraps
+        on screen, which rules out row-level redraws. Widths are terminal cells.
+        """
+        cache_key = (tuple(choices), title, width, self.server_configured)
+        cached = self._menu_render_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Border width follows the longest menu item for better centering
+        # Ensure minimum width, but never wider than the terminal
+        border_width = min(max(max_choice_width + 10, 60), width)
+        
+        status = "Server Connected" if self.server_configured else "Setup Required"
+        status_style = KARTOZA_COLORS['success_green'] if self.server_configured else KARTOZA_COLORS['warning_amber']
+        menu_title = (f"[{KARTOZA_COLORS['accent']}]▣ [/][{STYLE_BOLD_BLUE}]{escape(title)}[/]"
+                      f"[{KARTOZA_COLORS['neutral_grey']}] • [/][{status_style}]{status}[/]")
+        title_len = cell_len(f"▣ {title} • {status}")
+        
+        # Show menu header with proper centering and spacing
+        header = "".join((
+            "\n",  # Add extra space after banner
+            self._center(self._render_line(menu_title), title_len, width),
+            self._center(self._render_line(_separator(border_width)), border_width, width),
+            "\n",
+        ))
+        
+        # Pad every choice once; both row variants share the padded label
+        padded = [choice + " " * (max_choice_width - cell_len(choice)) for choice in choices]
+        row_len = max_choice_width + 2
+        
+        # Highlighted selection with an arrow marker, normal items with matching indent
+        highlight_rows = [
+            self._center(self._render_line(Text.assemble(("▶ ", STYLE_BOLD_ORANGE), (label, STYLE_HIGHLIGHT_BG))),
+                         row_len, width)
+            for label in padded
+        ]
+        normal_rows = [
+            self._center(self._render_line(Text.assemble("  ", (label, KARTOZA_COLORS['neutral_grey']))),
+                         row_len, width)
+            for label in padded
+        ]
+        
+        # Instructions at bottom
+        instructions = f"[{STYLE_BOLD_BLUE}]↑↓ [/][{KARTOZA_COLORS['muted']}]Navigate  [/][{STYLE_BOLD_GREEN}]Enter [/][{KARTOZA_COLORS['muted']}]Select  [/][{STYLE_BOLD_RED}]Esc [/][{KARTOZA_COLORS['muted']}]Cancel[/]"
+        instructions_len = cell_len("↑↓ Navigate  Enter Select  Esc Cancel")
+        footer = "\n\n" + self._center(self._render_line(instructions), instructions_len, width)
+        
+        # Rendered lines carry no newlines of their own, so wrapping only shows up as width
+        fits = max(title_len, border_width, row_len, instructions_len) <= width
+        
+        self._menu_render_cache[cache_key] = (header, normal_rows, highlight_rows, footer, fits)
+        return self._menu_render_cache[cache_key]
+    
+    @staticmethod
+    def _render_line(renderable) -> str:
+        """Render a single line of markup or Text to ANSI without any alignment pass"""
+        with console.capture() as capture:
+            console.print(renderable, end="", soft_wrap=True)
+        return capture.get()
+    
+    @staticmethod
+    def _center(rendered: str, plain_len: int, width: int) -> str:
+        """Left-pad a pre-rendered line of ``plain_len`` cells so it sits centred in ``width``"""
+        return " " * max((width - plain_len) // 2, 0) + rendered + "\n"
 
-    def _interactive_select(self, choices: List[str], message: str = "Select an option", 
+    def _interactive_select(self, choices: Sequence[str], message: str = "Select an option", 
                            show_skip_option: bool = False) -> Optional[int]:
         """Interactive arrow-key selection menu with optional fallback"""
         if not self.use_interactive_menus:
-            # Enhanced fallback to numbered selection with better visual styling
-            console.print(f"[{KARTOZA_COLORS['muted']}]Choose from the following options:[/]")
-            console.print()
-            
-            for i, choice in enumerate(choices):
-                # Create visually appealing menu items with icons and colors
-                if i < 9:
-                    number_style = f"bold {KARTOZA_COLORS['primary_orange']}"
-                else:
-                    number_style = f"bold {KARTOZA_COLORS['primary_blue']}"
-                
-                # Add visual hierarchy with bullet points and spacing
-                console.print(f"  [{number_style}]{i+1:2d}[/] [{KARTOZA_COLORS['neutral_grey']}]▶[/] {choice}")
+            # Enhanced fallback to numbered selection with better visual styling,
+            # assembled into one markup string so the whole list is a single print
+            lines = [f"[{KARTOZA_COLORS['muted']}]Choose from the following options:[/]", ""]
+            # The first nine entries stand out in orange, later ones in blue
+            lines.extend(
+                f"  [{STYLE_BOLD_ORANGE if i < 9 else STYLE_BOLD_BLUE}]{i+1:2d}[/] "
+                f"[{KARTOZA_COLORS['neutral_grey']}]▶[/] {choice}"
+                for i, choice in enumerate(choices)
+            )
             
             if show_skip_option:
-                console.print(f"  [{KARTOZA_COLORS['muted']}]{len(choices)+1:2d}[/] [{KARTOZA_COLORS['muted']}]▶[/] [{KARTOZA_COLORS['muted']}]← Back[/]")
+                lines.append(f"  [{KARTOZA_COLORS['muted']}]{len(choices)+1:2d}[/] [{KARTOZA_COLORS['muted']}]▶[/] [{KARTOZA_COLORS['muted']}]← Back[/]")
                 max_choice = len(choices) + 1
             else:
                 max_choice = len(choices)
             
-            console.print()
-            console.print(f"[{KARTOZA_COLORS['border']}]{'─' * 40}[/]")
+            lines.append("")
+            lines.append(_separator(40))
+            console.print("\n".join(lines))
                 
             try:
                 selection = IntPrompt.ask(
@@ -222,13 +614,16 @@ class MenuInterface:
                     choices=[str(i+1) for i in range(max_choice)],
                     show_choices=False
                 )
+                if show_skip_option and selection == max_choice:
+                    return None  # User selected "Back"
                 return selection - 1
             except (KeyboardInterrupt, EOFError):
                 return None
         
         try:
             # Use questionary for interactive selection
-            questionary_choices = choices.copy()
+            questionary = _load_questionary()
+            questionary_choices = list(choices)
             if show_skip_option:
                 questionary_choices.append("🔙 Back")
             
@@ -253,8 +648,9 @@ class MenuInterface:
             if result is None or result == "🔙 Back":
                 return None
                 
-            # Find the index of the selected choice
-            return choices.index(result) if result in choices else None
+            # Find the index of the selected choice (first occurrence wins for duplicate labels)
+            index_map = {choice: i for i, choice in reversed(tuple(enumerate(choices)))}
+            return index_map.get(result)
             
         except (KeyboardInterrupt, EOFError):
             return None
@@ -262,17 +658,17 @@ class MenuInterface:
             # Fallback to numbered selection on any error
             return self._interactive_select_fallback(choices, message, show_skip_option)
     
-    def _interactive_select_fallback(self, choices: List[str], message: str, show_skip_option: bool) -> Optional[int]:
+    def _interactive_select_fallback(self, choices: Sequence[str], message: str, show_skip_option: bool) -> Optional[int]:
         """Fallback numbered selection when questionary fails"""
-        for i, choice in enumerate(choices):
-            console.print(f"  [{KARTOZA_COLORS['highlight3']}]{i+1}[/] - {choice}")
-        console.print()
+        lines = [f"  [{STYLE_HIGHLIGHT3}]{i+1}[/] - {choice}" for i, choice in enumerate(choices)]
+        lines.append("")
         
         if show_skip_option:
-            console.print(f"  [{KARTOZA_COLORS['highlight3']}]{len(choices)+1}[/] - 🔙 Back")
+            lines.append(f"  [{STYLE_HIGHLIGHT3}]{len(choices)+1}[/] - 🔙 Back")
             max_choice = len(choices) + 1
         else:
             max_choice = len(choices)
+        console.print("\n".join(lines))
             
         try:
             selection = IntPrompt.ask(
@@ -305,23 +701,10 @@ class MenuInterface:
     
     def setup_server(self):
         """Setup server connection and discover layers with consistent UI design"""
-        # Clear screen and show banner for consistency
-        console.clear()
-        self.show_banner()
-        
-        # Show section header with proper centering
-        console.print()
-        section_title = Text()
-        section_title.append("▲ ", style=f"{KARTOZA_COLORS['accent']}")
-        section_title.append("Server Setup", style=f"bold {KARTOZA_COLORS['primary_blue']}")
-        
-        console.print(Align.center(section_title))
-        console.print(Align.center(f"[{KARTOZA_COLORS['border']}]{'─' * 50}[/]"))
-        console.print()
+        self._show_screen_header("▲", "Server Setup", SEPARATOR_50)
         
         # Instructions with proper centering
-        instructions = Text()
-        instructions.append("Configure your GeoServer connection", style=f"{KARTOZA_COLORS['muted']}")
+        instructions = f"[{KARTOZA_COLORS['muted']}]Configure your GeoServer connection[/]"
         console.print(Align.center(instructions))
         console.print()
         console.print()
@@ -330,20 +713,16 @@ class MenuInterface:
         server_url = get_server_url_interactive()
         if not server_url:
             console.print()
-            error_msg = Text()
-            error_msg.append("× ", style=f"bold {KARTOZA_COLORS['danger_red']}")
-            error_msg.append("No server URL provided", style=f"{KARTOZA_COLORS['danger_red']}")
+            error_msg = f"[{STYLE_BOLD_RED}]× [/][{KARTOZA_COLORS['danger_red']}]No server URL provided[/]"
             console.print(Align.center(error_msg))
             console.print()
             console.print()
-            Prompt.ask("Press Enter to continue", default="")
+            _pause()
             return False
         
         # Show connection attempt
         console.print()
-        connecting_msg = Text()
-        connecting_msg.append("▷ ", style=f"bold {KARTOZA_COLORS['warning_amber']}")
-        connecting_msg.append(f"Connecting to: {server_url}", style=f"{KARTOZA_COLORS['info_blue']}")
+        connecting_msg = f"[{STYLE_BOLD_AMBER}]▷ [/][{KARTOZA_COLORS['info_blue']}]Connecting to: {escape(server_url)}[/]"
         console.print(Align.center(connecting_msg))
         console.print()
         
@@ -354,150 +733,95 @@ class MenuInterface:
             self.server_configured = True
             
             # Success message
-            success_msg = Text()
-            success_msg.append("✓ ", style=f"bold {KARTOZA_COLORS['success_green']}")
-            success_msg.append("Server configured successfully", style=f"{KARTOZA_COLORS['success_green']}")
+            success_msg = f"[{STYLE_BOLD_GREEN}]✓ [/][{KARTOZA_COLORS['success_green']}]Server configured successfully[/]"
             console.print(Align.center(success_msg))
             console.print()
             
+            # Discovery replaced service_info, so drop any panel built for the previous server
+            self.__dict__.pop("_service_info_panel", None)
             # Show service info if available - centered in a panel
-            if self.tester.service_info:
-                service_info = self.tester.service_info
-                info_text = Text()
-                info_text.append("Service: ", style=f"bold {KARTOZA_COLORS['primary_blue']}")
-                info_text.append(service_info.get('title', 'Unknown'), style=f"{KARTOZA_COLORS['info_blue']}")
-                
-                if service_info.get('abstract'):
-                    info_text.append("\n")
-                    # Truncate long descriptions
-                    description = service_info['abstract']
-                    if len(description) > 100:
-                        description = description[:97] + "..."
-                    info_text.append(description, style=f"{KARTOZA_COLORS['muted']}")
-                
-                # Show in a centered panel
-                from rich.panel import Panel
-                info_panel = Panel.fit(
-                    Align.center(info_text),
-                    border_style=f"{KARTOZA_COLORS['border']}",
-                    padding=(0, 1)
-                )
-                console.print(Align.center(info_panel))
+            if self._service_info_panel is not None:
+                console.print(Align.center(self._service_info_panel))
             
             console.print()
             console.print()
-            Prompt.ask("Press Enter to continue", default="")
+            _pause()
             return True
         else:
             # Failure message
-            error_msg = Text()
-            error_msg.append("× ", style=f"bold {KARTOZA_COLORS['danger_red']}")
-            error_msg.append("Failed to discover layers", style=f"{KARTOZA_COLORS['danger_red']}")
+            error_msg = f"[{STYLE_BOLD_RED}]× [/][{KARTOZA_COLORS['danger_red']}]Failed to discover layers[/]"
             console.print(Align.center(error_msg))
             
             console.print()
             console.print()
-            Prompt.ask("Press Enter to continue", default="")
+            _pause()
             return False
     
     def show_layer_info(self):
         """Display information about discovered layers with consistent UI design"""
-        # Clear screen and show banner for consistency
-        console.clear()
-        self.show_banner()
-        
-        # Show section header
-        console.print()
-        section_title = Text()
-        section_title.append("▧ ", style=f"{KARTOZA_COLORS['accent']}")
-        section_title.append("Layer Information", style=f"bold {KARTOZA_COLORS['primary_blue']}")
-        
-        console.print(Align.center(section_title))
-        console.print(Align.center(f"[{KARTOZA_COLORS['border']}]{'─' * 60}[/]"))
-        console.print()
+        self._show_screen_header("▧", "Layer Information")
         
         if not self.server_configured or not self.tester.layers:
-            error_msg = Text()
-            error_msg.append("× ", style=f"bold {KARTOZA_COLORS['danger_red']}")
-            error_msg.append("No server configured or layers discovered", style=f"{KARTOZA_COLORS['danger_red']}")
+            error_msg = f"[{STYLE_BOLD_RED}]× [/][{KARTOZA_COLORS['danger_red']}]No server configured or layers discovered[/]"
             console.print(Align.center(error_msg))
             console.print()
             
-            instruction_msg = Text()
-            instruction_msg.append("Please run server setup first", style=f"{KARTOZA_COLORS['muted']}")
+            instruction_msg = f"[{KARTOZA_COLORS['muted']}]Please run server setup first[/]"
             console.print(Align.center(instruction_msg))
             console.print()
             console.print()
-            Prompt.ask("Press Enter to continue", default="")
+            _pause()
             return
         
         # Enhanced table with better visual hierarchy
         table = Table(
             title="▧ Discovered Layers", 
             show_header=True,
-            header_style=f"bold {KARTOZA_COLORS['primary_blue']}",
-            border_style=f"{KARTOZA_COLORS['border']}",
-            title_style=f"bold {KARTOZA_COLORS['primary_orange']}"
+            header_style=STYLE_BOLD_BLUE,
+            border_style=KARTOZA_COLORS['border'],
+            title_style=STYLE_BOLD_ORANGE
         )
-        table.add_column("Layer Name", style=f"bold {KARTOZA_COLORS['primary_blue']}", no_wrap=True)
-        table.add_column("Title", style=f"{KARTOZA_COLORS['secondary_teal']}")
-        table.add_column("Abstract", style=f"{KARTOZA_COLORS['neutral_grey']}")
-        table.add_column("SRS", justify="center", style=f"{KARTOZA_COLORS['info_blue']}")
-        
-        for layer_name, layer_info in self.tester.layers.items():
-            # Truncate abstract if too long
-            abstract = layer_info.abstract[:80] + "..." if len(layer_info.abstract) > 80 else layer_info.abstract
-            
-            # Show primary SRS
-            primary_srs = layer_info.srs_list[0] if layer_info.srs_list else "Unknown"
-            
-            table.add_row(
+        table.add_column("Layer Name", style=STYLE_BOLD_BLUE, no_wrap=True)
+        table.add_column("Title", style=KARTOZA_COLORS['secondary_teal'])
+        table.add_column("Abstract", style=KARTOZA_COLORS['neutral_grey'])
+        table.add_column("SRS", justify="center", style=KARTOZA_COLORS['info_blue'])
+        
+        # Long abstracts are truncated and only the primary SRS is shown
+        rows = [
+            (
                 layer_name,
                 layer_info.title,
-                abstract,
-                primary_srs
+                layer_info.abstract[:80] + "..." if len(layer_info.abstract) > 80 else layer_info.abstract,
+                layer_info.srs_list[0] if layer_info.srs_list else "Unknown",
             )
+            for layer_name, layer_info in self.tester.layers.items()
+        ]
+        for row in rows:
+            table.add_row(*row)
         
         console.print(table)
         console.print()
         
         # Show additional info
-        console.print(f"[{KARTOZA_COLORS['highlight3']}]Total layers: {len(self.tester.layers)}[/]")
-        console.print(f"[{KARTOZA_COLORS['highlight3']}]Server: {self.tester.server_url}[/]")
+        console.print(f"[{STYLE_HIGHLIGHT3}]Total layers: {len(self.tester.layers)}[/]")
+        console.print(f"[{STYLE_HIGHLIGHT3}]Server: {self.tester.server_url}[/]")
         console.print()
         
-        Prompt.ask("Press Enter to continue", default="")
+        _pause()
     
     def test_connectivity_menu(self):
         """Test connectivity to all layers with consistent UI design"""
-        # Clear screen and show banner for consistency
-        console.clear()
-        self.show_banner()
-        
-        # Show section header
-        console.print()
-        section_title = Text()
-        section_title.append("▷ ", style=f"{KARTOZA_COLORS['accent']}")
-        section_title.append("Connectivity Test", style=f"bold {KARTOZA_COLORS['primary_blue']}")
-        
-        console.print(Align.center(section_title))
-        console.print(Align.center(f"[{KARTOZA_COLORS['border']}]{'─' * 60}[/]"))
-        console.print()
+        self._show_screen_header("▷", "Connectivity Test")
         
         if not self.server_configured:
-            error_msg = Text()
-            error_msg.append("× ", style=f"bold {KARTOZA_COLORS['danger_red']}")
-            error_msg.append("No server configured. Please run server setup first", style=f"{KARTOZA_COLORS['danger_red']}")
-            console.print(Align.center(error_msg))
+            console.print(Align.center(MSG_NO_SERVER))
             console.print()
             console.print()
-            Prompt.ask("Press Enter to continue", default="")
+            _pause()
             return
         
         # Show testing message
-        testing_msg = Text()
-        testing_msg.append("▷ ", style=f"bold {KARTOZA_COLORS['warning_amber']}")
-        testing_msg.append("Testing connectivity to all layers...", style=f"{KARTOZA_COLORS['info_blue']}")
+        testing_msg = f"[{STYLE_BOLD_AMBER}]▷ [/][{KARTOZA_COLORS['info_blue']}]Testing connectivity to all layers...[/]"
         console.print(Align.center(testing_msg))
         console.print()
         
@@ -507,27 +831,30 @@ class MenuInterface:
         table = Table(
             title="▷ Connectivity Test Results", 
             show_header=True,
-            header_style=f"bold {KARTOZA_COLORS['primary_blue']}",
-            border_style=f"{KARTOZA_COLORS['border']}",
-            title_style=f"bold {KARTOZA_COLORS['primary_orange']}"
+            header_style=STYLE_BOLD_BLUE,
+            border_style=KARTOZA_COLORS['border'],
+            title_style=STYLE_BOLD_ORANGE
         )
-        table.add_column("Layer Name", style=f"bold {KARTOZA_COLORS['primary_blue']}", no_wrap=True)
-        table.add_column("Title", style=f"{KARTOZA_COLORS['secondary_teal']}")
+        table.add_column("Layer Name", style=STYLE_BOLD_BLUE, no_wrap=True)
+        table.add_column("Title", style=KARTOZA_COLORS['secondary_teal'])
         table.add_column("Status", justify="center", style="bold")
-        table.add_column("HTTP Code", justify="center", style=f"{KARTOZA_COLORS['info_blue']}")
+        table.add_column("HTTP Code", justify="center", style=KARTOZA_COLORS['info_blue'])
         
-        all_accessible = True
-        for layer_name, (is_accessible, status_code) in results.items():
-            layer_info = self.tester.get_layer_info(layer_name)
-            layer_title = layer_info.title if layer_info else layer_name
-            
-            if is_accessible:
-                status = f"[{KARTOZA_COLORS['success_green']}]✓ Accessible[/]"
-            else:
-                status = f"[{KARTOZA_COLORS['danger_red']}]× Failed[/]"
-                all_accessible = False
-            
-            table.add_row(layer_name, layer_title, status, str(status_code))
+        accessible_status = f"[{KARTOZA_COLORS['success_green']}]✓ Accessible[/]"
+        failed_status = f"[{KARTOZA_COLORS['danger_red']}]× Failed[/]"
+        layers = self.tester.layers
+        rows = [
+            (
+                layer_name,
+                layers[layer_name].title if layer_name in layers else layer_name,
+                accessible_status if is_accessible else failed_status,
+                str(status_code),
+            )
+            for layer_name, (is_accessible, status_code) in results.items()
+        ]
+        for row in rows:
+            table.add_row(*row)
+        all_accessible = all(is_accessible for is_accessible, _ in results.values())
         
         console.print(table)
         console.print()
@@ -538,97 +865,77 @@ class MenuInterface:
             console.print(f"[{KARTOZA_COLORS['warning_amber']}]! Some layers are not accessible[/]")
         
         console.print()
-        Prompt.ask("Press Enter to continue", default="")
+        _pause()
     
     def preview_layer_menu(self):
         """Show layer preview menu with consistent UI design"""
-        # Clear screen and show banner for consistency
-        console.clear()
-        self.show_banner()
-        
-        # Show section header
-        console.print()
-        section_title = Text()
-        section_title.append("▤ ", style=f"{KARTOZA_COLORS['accent']}")
-        section_title.append("Layer Preview", style=f"bold {KARTOZA_COLORS['primary_blue']}")
-        
-        console.print(Align.center(section_title))
-        console.print(Align.center(f"[{KARTOZA_COLORS['border']}]{'─' * 60}[/]"))
-        console.print()
+        self._show_screen_header("▤", "Layer Preview")
         
         if not self.server_configured:
-            error_msg = Text()
-            error_msg.append("× ", style=f"bold {KARTOZA_COLORS['danger_red']}")
-            error_msg.append("No server configured. Please run server setup first", style=f"{KARTOZA_COLORS['danger_red']}")
-            console.print(Align.center(error_msg))
+            console.print(Align.center(MSG_NO_SERVER))
             console.print()
             console.print()
-            Prompt.ask("Press Enter to continue", default="")
+            _pause()
             return
         
         # Create layer choices from discovered layers
-        layer_names = list(self.tester.layers.keys())
+        layer_names, layer_choices, max_choice_width = self._get_layer_choices()
         if not layer_names:
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ No layers available[/]")
+            console.print(MSG_NO_LAYERS)
             console.print()
-            Prompt.ask("Press Enter to continue", default="")
+            _pause()
             return
         
-        # Create layer choices for interactive selection
-        layer_choices = []
-        for layer_name in layer_names:
-            layer_info = self.tester.layers[layer_name]
-            layer_choices.append(f"{layer_info.title} ({layer_name})")
-        
         choice_index = self._interactive_menu(
             layer_choices,
             "Layer Preview",
-            show_skip_option=True
+            show_skip_option=True,
+            max_choice_width=max_choice_width
         )
         
         if choice_index is not None:
             layer_name = layer_names[choice_index]
             self._show_layer_preview(layer_name)
     
+    def _get_layer_choices(self) -> Tuple[List[str], List[str], int]:
+        """Layer names, their menu labels and the widest label in cells, cached per discovered layer set"""
+        version = self.tester.layers_version
+        if self._layer_choices_cache is None or self._layer_choices_cache[0] != version:
+            layer_names = list(self.tester.layers)
+            layer_choices = [f"{info.title} ({name})" for name, info in self.tester.layers.items()]
+            max_choice_width = max(map(cell_len, layer_choices), default=0)
+            self._layer_choices_cache = (version, layer_names, layer_choices, max_choice_width)
+        return self._layer_choices_cache[1:]
+    
     def _show_layer_preview(self, layer_name: str):
         """Show preview for a specific layer using fim or system default viewer"""
         layer_info = self.tester.get_layer_info(layer_name)
         if not layer_info:
-            error_msg = Text()
-            error_msg.append("× ", style=f"bold {KARTOZA_COLORS['danger_red']}")
-            error_msg.append(f"Layer not found: {layer_name}", style=f"{KARTOZA_COLORS['danger_red']}")
+            error_msg = f"[{STYLE_BOLD_RED}]× [/][{KARTOZA_COLORS['danger_red']}]Layer not found: {escape(layer_name)}[/]"
             console.print(Align.center(error_msg))
             console.print()
-            Prompt.ask("Press Enter to continue", default="")
+            _pause()
             return
         
         # Show layer info with consistent styling
         console.print()
-        preview_title = Text()
-        preview_title.append("▤ ", style=f"bold {KARTOZA_COLORS['primary_orange']}")
-        preview_title.append(f"Previewing: {layer_info.title}", style=f"bold {KARTOZA_COLORS['primary_blue']}")
+        preview_title = f"[{STYLE_BOLD_ORANGE}]▤ [/][{STYLE_BOLD_BLUE}]Previewing: {escape(layer_info.title)}[/]"
         console.print(Align.center(preview_title))
         
         if layer_info.abstract:
-            abstract_text = Text()
-            abstract_text.append(layer_info.abstract[:100] + "..." if len(layer_info.abstract) > 100 else layer_info.abstract, 
-                               style=f"{KARTOZA_COLORS['muted']}")
-            console.print(Align.center(abstract_text))
+            abstract = layer_info.abstract[:100] + "..." if len(layer_info.abstract) > 100 else layer_info.abstract
+            console.print(Align.center(f"[{KARTOZA_COLORS['muted']}]{escape(abstract)}[/]"))
         console.print()
         
         # Download with progress indication
-        download_msg = Text()
-        download_msg.append("▷ ", style=f"bold {KARTOZA_COLORS['warning_amber']}")
-        download_msg.append("Downloading map preview...", style=f"{KARTOZA_COLORS['info_blue']}")
+        download_msg = f"[{STYLE_BOLD_AMBER}]▷ [/][{KARTOZA_COLORS['info_blue']}]Downloading map preview...[/]"
         console.print(Align.center(download_msg))
         
         preview_path = self.tester.download_map_preview(layer_name)
         
         if preview_path and preview_path.exists():
             # Success message
-            success_msg = Text()
-            success_msg.append("✓ ", style=f"bold {KARTOZA_COLORS['success_green']}")
-            success_msg.append(f"Preview downloaded: {preview_path.name}", style=f"{KARTOZA_COLORS['success_green']}")
+            success_msg = f"[{STYLE_BOLD_GREEN}]✓ [/][{KARTOZA_COLORS['success_green']}]Preview downloaded: {escape(preview_path.name)}[/]"
             console.print(Align.center(success_msg))
             console.print()
             
@@ -636,34 +943,27 @@ class MenuInterface:
             self._open_image_viewer(preview_path)
             
         else:
-            error_msg = Text()
-            error_msg.append("× ", style=f"bold {KARTOZA_COLORS['danger_red']}")
-            error_msg.append("Failed to download preview", style=f"{KARTOZA_COLORS['danger_red']}")
+            error_msg = f"[{STYLE_BOLD_RED}]× [/][{KARTOZA_COLORS['danger_red']}]Failed to download preview[/]"
             console.print(Align.center(error_msg))
         
         console.print()
         console.print()
-        Prompt.ask("Press Enter to continue", default="")
+        _pause()
     
     def _open_image_viewer(self, image_path: Path):
         """Open image using fim or system default viewer"""
-        import shutil
-        import os
-        
         # First try fim
-        if shutil.which("fim"):
+        if self._fim_path:
             try:
                 # Use fim to display the image
                 result = subprocess.run(
-                    ["fim", "-a", str(image_path)], 
+                    [self._fim_path, "-a", str(image_path)], 
                     capture_output=True, 
                     timeout=30,
                     check=False
                 )
                 if result.returncode == 0:
-                    viewer_msg = Text()
-                    viewer_msg.append("▤ ", style=f"bold {KARTOZA_COLORS['accent']}")
-                    viewer_msg.append("Image displayed with fim", style=f"{KARTOZA_COLORS['info_blue']}")
+                    viewer_msg = f"[{STYLE_BOLD_ACCENT}]▤ [/][{KARTOZA_COLORS['info_blue']}]Image displayed with fim[/]"
                     console.print(Align.center(viewer_msg))
                     return
             except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
@@ -672,79 +972,92 @@ class MenuInterface:
         # Fallback to system default viewer
         try:
             if os.name == 'nt':  # Windows
-                os.startfile(str(image_path))
+                self._launch_viewer(image_path)
             elif os.name == 'posix':  # Linux/macOS
-                if shutil.which("xdg-open"):  # Linux
-                    subprocess.run(["xdg-open", str(image_path)], check=False)
-                elif shutil.which("open"):  # macOS
-                    subprocess.run(["open", str(image_path)], check=False)
+                if self._system_opener:  # xdg-open on Linux, open on macOS
+                    self._launch_viewer(image_path)
                 else:
                     # Direct file path as clickable link
-                    link_msg = Text()
-                    link_msg.append("▤ ", style=f"bold {KARTOZA_COLORS['accent']}")
-                    link_msg.append("View image: ", style=f"{KARTOZA_COLORS['info_blue']}")
-                    link_msg.append(f"file://{image_path.absolute()}", style=f"bold {KARTOZA_COLORS['primary_orange']}")
+                    link_msg = f"[{STYLE_BOLD_ACCENT}]▤ [/][{KARTOZA_COLORS['info_blue']}]View image: [/][{STYLE_BOLD_ORANGE}]file://{escape(str(image_path.absolute()))}[/]"
                     console.print(Align.center(link_msg))
                     return
             
-            viewer_msg = Text()
-            viewer_msg.append("▤ ", style=f"bold {KARTOZA_COLORS['accent']}")
-            viewer_msg.append("Image opened in system default viewer", style=f"{KARTOZA_COLORS['info_blue']}")
+            viewer_msg = f"[{STYLE_BOLD_ACCENT}]▤ [/][{KARTOZA_COLORS['info_blue']}]Image opened in system default viewer[/]"
             console.print(Align.center(viewer_msg))
             
         except Exception as e:
             # Show direct file path as fallback
-            fallback_msg = Text()
-            fallback_msg.append("▤ ", style=f"bold {KARTOZA_COLORS['accent']}")
-            fallback_msg.append("Image saved to: ", style=f"{KARTOZA_COLORS['info_blue']}")
-            fallback_msg.append(str(image_path), style=f"bold {KARTOZA_COLORS['primary_orange']}")
+            fallback_msg = f"[{STYLE_BOLD_ACCENT}]▤ [/][{KARTOZA_COLORS['info_blue']}]Image saved to: [/][{STYLE_BOLD_ORANGE}]{escape(str(image_path))}[/]"
             console.print(Align.center(fallback_msg))
     
     
-    def single_test_menu(self):
-        """Menu for running a single layer test with multiple concurrency levels"""
-        # Clear screen and show banner for consistency  
-        console.clear()
-        self.show_banner()
+    def _prompt_test_params(self, requests_label: str,
+                            concurrency_label: str) -> Optional[Tuple[int, List[int]]]:
+        """Ask for the request count and concurrency levels, defaulting to the last used values
         
-        # Show section header
-        console.print()
-        section_title = Text()
-        section_title.append("▶ ", style=f"{KARTOZA_COLORS['accent']}")
-        section_title.append("Single Layer Load Test", style=f"bold {KARTOZA_COLORS['primary_blue']}")
+        Invalid input is reported here. Returns (total_requests, valid_concurrency)
+        after saving the configuration, or None when there is nothing to run.
+        """
+        last_requests = self.test_config.get_last_total_requests()
+        last_concurrency = self.test_config.get_last_concurrency_list()
         
-        console.print(Align.center(section_title))
-        console.print(Align.center(f"[{KARTOZA_COLORS['border']}]{'─' * 60}[/]"))
-        console.print()
+        total_requests = IntPrompt.ask(requests_label, default=last_requests)
+        
+        # Get concurrency levels as comma-separated list
+        console.print(f"[{STYLE_HIGHLIGHT3}]Enter concurrency levels as comma-separated values (e.g., 1,10,100,500)[/]")
+        concurrency_input = Prompt.ask(
+            concurrency_label,
+            default=format_concurrency_list(last_concurrency)
+        )
+        
+        # Parse and validate concurrency levels
+        concurrency_list = parse_concurrency_list(concurrency_input)
+        if not concurrency_list:
+            console.print(f"[{STYLE_ALERT}]❌ Invalid concurrency levels[/]")
+            console.print()
+            _pause()
+            return None
+        
+        # Remove concurrency levels greater than total requests
+        valid_concurrency, removed_concurrency = validate_concurrency_list(concurrency_list, total_requests)
+        
+        if removed_concurrency:
+            console.print(f"[{STYLE_ALERT}]⚠️  Removed concurrency levels greater than request count: {removed_concurrency}[/]")
+        
+        if not valid_concurrency:
+            console.print(f"[{STYLE_ALERT}]❌ No valid concurrency levels remaining[/]")
+            console.print()
+            _pause()
+            return None
+        
+        # Save configuration for next time
+        self.test_config.update_test_config(concurrency_list, total_requests)
+        return total_requests, valid_concurrency
+    
+    def single_test_menu(self):
+        """Menu for running a single layer test with multiple concurrency levels"""
+        self._show_screen_header("▶", "Single Layer Load Test")
         
         if not self.server_configured:
-            error_msg = Text()
-            error_msg.append("× ", style=f"bold {KARTOZA_COLORS['danger_red']}")
-            error_msg.append("No server configured. Please run server setup first", style=f"{KARTOZA_COLORS['danger_red']}")
-            console.print(Align.center(error_msg))
+            console.print(Align.center(MSG_NO_SERVER))
             console.print()
             console.print()
-            Prompt.ask("Press Enter to continue", default="")
+            _pause()
             return
         
         # Layer selection from discovered layers
-        layer_names = list(self.tester.layers.keys())
+        layer_names, layer_choices, max_choice_width = self._get_layer_choices()
         if not layer_names:
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ No layers available[/]")
+            console.print(MSG_NO_LAYERS)
             console.print()
-            Prompt.ask("Press Enter to continue", default="")
+            _pause()
             return
         
-        # Create layer choices for interactive selection
-        layer_choices = []
-        for layer_name in layer_names:
-            layer_info = self.tester.layers[layer_name]
-            layer_choices.append(f"{layer_info.title} ({layer_name})")
-        
         choice_index = self._interactive_menu(
             layer_choices,
             "Single Layer Load Test",
-            show_skip_option=True
+            show_skip_option=True,
+            max_choice_width=max_choice_width
         )
         
         if choice_index is None:
@@ -753,81 +1066,108 @@ class MenuInterface:
         layer_name = layer_names[choice_index]
         layer_info = self.tester.layers[layer_name]
         
-        console.print(f"[{KARTOZA_COLORS['highlight1']}]Selected: {layer_info.title}[/]")
+        console.print(f"[{STYLE_HIGHLIGHT1}]Selected: {layer_info.title}[/]")
         console.print()
         
-        # Test parameters - get last used values as defaults
-        last_requests = self.test_config.get_last_total_requests()
-        last_concurrency = self.test_config.get_last_concurrency_list()
-        
-        total_requests = IntPrompt.ask(
-            "Number of requests",
-            default=last_requests
-        )
-        
-        # Get concurrency levels as comma-separated list
-        default_concurrency_str = format_concurrency_list(last_concurrency)
-        console.print(f"[{KARTOZA_COLORS['highlight3']}]Enter concurrency levels as comma-separated values (e.g., 1,10,100,500)[/]")
-        
-        concurrency_input = Prompt.ask(
-            "Concurrency levels",
-            default=default_concurrency_str
-        )
-        
-        # Parse and validate concurrency levels
-        concurrency_list = parse_concurrency_list(concurrency_input)
-        if not concurrency_list:
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ Invalid concurrency levels[/]")
-            console.print()
-            Prompt.ask("Press Enter to continue", default="")
+        params = self._prompt_test_params("Number of requests", "Concurrency levels")
+        if params is None:
             return
+        total_requests, valid_concurrency = params
         
-        # Remove concurrency levels greater than total requests
-        valid_concurrency = validate_concurrency_list(concurrency_list, total_requests)
-        removed_concurrency = [c for c in concurrency_list if c not in valid_concurrency]
-        
-        if removed_concurrency:
-            console.print(f"[{KARTOZA_COLORS['alert']}]⚠️  Removed concurrency levels greater than request count: {removed_concurrency}[/]")
+        console.print()
+        _print_block(
+            f"[{STYLE_HIGHLIGHT3}]Test Configuration:[/]",
+            f"  Layer: {layer_info.title}",
+            f"  Requests per test: {total_requests:,}",
+            f"  Concurrency levels: {format_concurrency_list(valid_concurrency)}",
+            f"  Total tests: {len(valid_concurrency)}",
+            f"  Total requests: {total_requests * len(valid_concurrency):,}"
+        )
         
-        if not valid_concurrency:
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ No valid concurrency levels remaining[/]")
-            console.print()
-            Prompt.ask("Press Enter to continue", default="")
+        if not Confirm.ask(PROMPT_START_SUITE):
             return
         
-        # Save configuration for next time
-        self.test_config.update_test_config(concurrency_list, total_requests)
-        
-        console.print()
-        console.print(f"[{KARTOZA_COLORS['highlight3']}]Test Configuration:[/]")
-        console.print(f"  Layer: {layer_info.title}")
-        console.print(f"  Requests per test: {total_requests:,}")
-        console.print(f"  Concurrency levels: {format_concurrency_list(valid_concurrency)}")
-        console.print(f"  Total tests: {len(valid_concurrency)}")
-        console.print(f"  Total requests: {total_requests * len(valid_concurrency):,}")
-        console.print()
+        render = Confirm.ask(PROMPT_RENDER_WORKLOAD, default=False)
         
-        if not Confirm.ask(f"[{KARTOZA_COLORS['highlight4']}]Start load test suite?[/]"):
-            return
+        # Levels run one after another by default so they do not compete for the server
+        run_parallel = len(valid_concurrency) > 1 and Confirm.ask(PROMPT_RUN_PARALLEL, default=False)
         
         # Run the tests for all concurrency levels
-        console.print(f"[{KARTOZA_COLORS['highlight2']}]🚀 Starting load test suite...[/]")
-        console.print()
-        
-        results = []
-        for i, concurrency in enumerate(valid_concurrency, 1):
-            console.print(f"[{KARTOZA_COLORS['highlight1']}]Running test {i}/{len(valid_concurrency)}: {concurrency} concurrent connections[/]")
+        console.print(f"[{STYLE_HIGHLIGHT2}]🚀 Starting load test suite...[/]")
+        console.print()
+        
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
+            # One progress line per concurrency level, updated as each run starts and finishes
+            tasks = {
+                concurrency: progress.add_task(
+                    f"[{KARTOZA_COLORS['muted']}]C={concurrency}: waiting[/]", total=1
+                )
+                for concurrency in valid_concurrency
+            }
             
-            with console.status(f"[{KARTOZA_COLORS['highlight1']}]Testing concurrency level {concurrency}..."):
-                result = self.tester.run_single_test(layer_name, concurrency, total_requests)
+            started = set()
             
-            if result:
-                results.append(result)
-                console.print(f"[{KARTOZA_COLORS['highlight4']}]✅ Completed: {result.requests_per_second:.2f} RPS, {result.success_rate:.1f}% success[/]")
-            else:
-                console.print(f"[{KARTOZA_COLORS['alert']}]❌ Test failed for concurrency {concurrency}[/]")
+            def on_start(concurrency):
+                started.add(concurrency)
+                progress.update(
+                    tasks[concurrency],
+                    description=f"[{STYLE_HIGHLIGHT1}]C={concurrency}: testing {concurrency} concurrent connections...[/]"
+                )
             
-            console.print()
+            def on_complete(concurrency, result):
+                if result:
+                    description = f"[{STYLE_HIGHLIGHT4}]✅ C={concurrency}: {result.requests_per_second:.2f} RPS, {result.success_rate:.1f}% success[/]"
+                else:
+                    description = f"[{STYLE_ALERT}]❌ C={concurrency}: test failed[/]"
+                progress.update(tasks[concurrency], description=description, completed=1)
+            
+            # Tests run on a worker thread so Ctrl-C here can stop the sweep between levels
+            # and still keep the results gathered so far; a second Ctrl-C aborts outright
+            cancel = threading.Event()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(
+                    self.tester.run_concurrency_tests,
+                    layer_name,
+                    valid_concurrency,
+                    total_requests,
+                    max_parallel=len(valid_concurrency) if run_parallel else 1,
+                    on_start=on_start,
+                    on_complete=on_complete,
+                    cancel_event=cancel,
+                    render=render,
+                )
+                while True:
+                    try:
+                        level_results = future.result(timeout=0.2)
+                        break
+                    except FuturesTimeoutError:
+                        continue
+                    except KeyboardInterrupt:
+                        if cancel.is_set():
+                            # Running levels are killed, so the executor shuts down promptly
+                            terminate_apache_bench()
+                            progress.console.print(f"[{STYLE_ALERT}]⏹ Aborting running test(s)[/]")
+                            raise
+                        cancel.set()
+                        progress.console.print(
+                            f"[{STYLE_ALERT}]⏹ Stopping after the running test(s) finish "
+                            f"(Ctrl-C again to abort)...[/]"
+                        )
+            
+            for concurrency in valid_concurrency:
+                if concurrency not in started:
+                    progress.update(
+                        tasks[concurrency],
+                        description=f"[{KARTOZA_COLORS['muted']}]C={concurrency}: skipped[/]",
+                        completed=1
+                    )
+        
+        results = [result for result in level_results if result]
+        console.print()
         
         # Display comprehensive results
         if results:
@@ -835,11 +1175,8 @@ class MenuInterface:
             
             # Save session-specific consolidated results for PDF generation
             session_results_file = None
-            if len(results) > 1 and Confirm.ask(f"[{KARTOZA_COLORS['highlight4']}]Generate PDF report?[/]"):
+            if len(results) > 1 and Confirm.ask(PROMPT_GENERATE_PDF):
                 # Save current session results to a session-specific file
-                from datetime import datetime
-                from ..common import ReportGenerator
-                
                 session_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 report_generator = ReportGenerator("geoserver")
                 test_config = {
@@ -854,19 +1191,19 @@ class MenuInterface:
                 # Generate PDF from session-specific results
                 self._generate_pdf_report(session_results_file)
         else:
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ All tests failed[/]")
+            console.print(f"[{STYLE_ALERT}]❌ All tests failed[/]")
         
         console.print()
-        Prompt.ask("Press Enter to continue", default="")
+        _pause()
     
     def _display_test_result(self, result):
         """Display test result in a nice format"""
-        console.print(f"[{KARTOZA_COLORS['highlight4']}]✅ Test completed successfully![/]")
+        console.print(f"[{STYLE_HIGHLIGHT4}]✅ Test completed successfully![/]")
         console.print()
         
         table = Table(title="Test Results", show_header=True)
-        table.add_column("Metric", style=f"{KARTOZA_COLORS['highlight2']}")
-        table.add_column("Value", style=f"{KARTOZA_COLORS['highlight1']}")
+        table.add_column("Metric", style=KARTOZA_COLORS['highlight2'])
+        table.add_column("Value", style=KARTOZA_COLORS['highlight1'])
         
         table.add_row("Requests per Second", f"{result.requests_per_second:.2f}")
         table.add_row("Mean Response Time", f"{result.mean_response_time:.2f} ms")
@@ -879,38 +1216,30 @@ class MenuInterface:
     
     def _display_multiple_test_results(self, results, layer_title: str):
         """Display results from multiple concurrency tests in a comprehensive format"""
-        console.print(f"[{KARTOZA_COLORS['highlight4']}]✅ Test suite completed successfully![/]")
+        console.print(f"[{STYLE_HIGHLIGHT4}]✅ Test suite completed successfully![/]")
         console.print()
         
         # Enhanced comprehensive results table with better visual hierarchy
         table = Table(
             title=f"▶ Load Test Results: {layer_title}", 
             show_header=True,
-            header_style=f"bold {KARTOZA_COLORS['primary_blue']}",
-            border_style=f"{KARTOZA_COLORS['border']}",
-            title_style=f"bold {KARTOZA_COLORS['primary_orange']}"
+            header_style=STYLE_BOLD_BLUE,
+            border_style=KARTOZA_COLORS['border'],
+            title_style=STYLE_BOLD_ORANGE
         )
-        table.add_column("Concurrency", justify="center", style=f"bold {KARTOZA_COLORS['primary_blue']}")
-        table.add_column("RPS", justify="right", style=f"bold {KARTOZA_COLORS['success_green']}")
-        table.add_column("Mean Response (ms)", justify="right", style=f"{KARTOZA_COLORS['info_blue']}")
+        table.add_column("Concurrency", justify="center", style=STYLE_BOLD_BLUE)
+        table.add_column("RPS", justify="right", style=STYLE_BOLD_GREEN)
+        table.add_column("Mean Response (ms)", justify="right", style=KARTOZA_COLORS['info_blue'])
         table.add_column("Success Rate", justify="right", style="bold")
-        table.add_column("Failed Requests", justify="right", style=f"{KARTOZA_COLORS['neutral_grey']}")
-        table.add_column("Total Time (s)", justify="right", style=f"{KARTOZA_COLORS['muted']}")
+        table.add_column("Failed Requests", justify="right", style=KARTOZA_COLORS['neutral_grey'])
+        table.add_column("Total Time (s)", justify="right", style=KARTOZA_COLORS['muted'])
         
         for result in results:
-            # Enhanced color coding for success rate with multiple thresholds
-            if result.success_rate >= 98:
-                success_color = KARTOZA_COLORS['success_green']
-            elif result.success_rate >= 90:
-                success_color = KARTOZA_COLORS['warning_amber'] 
-            else:
-                success_color = KARTOZA_COLORS['danger_red']
-            
             table.add_row(
                 str(result.concurrency),
                 f"{result.requests_per_second:.2f}",
                 f"{result.mean_response_time:.2f}",
-                f"[{success_color}]{result.success_rate:.1f}%[/]",
+                _success_rate_cell(result.success_rate),
                 f"{result.failed_requests}/{result.total_requests}",
                 f"{result.total_time:.2f}"
             )
@@ -920,120 +1249,86 @@ class MenuInterface:
         
         # Display performance summary
         if len(results) > 1:
-            best_rps = max(results, key=lambda r: r.requests_per_second)
-            best_response = min(results, key=lambda r: r.mean_response_time)
-            
-            console.print(f"[{KARTOZA_COLORS['highlight3']}]Performance Summary:[/]")
-            console.print(f"  🚀 Best RPS: {best_rps.requests_per_second:.2f} at {best_rps.concurrency} concurrency")
-            console.print(f"  ⚡ Best Response Time: {best_response.mean_response_time:.2f}ms at {best_response.concurrency} concurrency")
-            console.print()
+            # Fastest throughput and lowest latency found in one traversal
+            best_rps = best_response = results[0]
+            for r in results:
+                if r.requests_per_second > best_rps.requests_per_second:
+                    best_rps = r
+                if r.mean_response_time < best_response.mean_response_time:
+                    best_response = r
+            
+            _print_block(
+                f"[{STYLE_HIGHLIGHT3}]Performance Summary:[/]",
+                f"  🚀 Best RPS: {best_rps.requests_per_second:.2f} at {best_rps.concurrency} concurrency",
+                f"  ⚡ Best Response Time: {best_response.mean_response_time:.2f}ms at {best_response.concurrency} concurrency"
+            )
     
     def comprehensive_test_menu(self):
         """Menu for running comprehensive tests"""
         if not self.server_configured:
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ No server configured. Please run server setup first.[/]")
+            console.print(f"[{STYLE_ALERT}]❌ No server configured. Please run server setup first.[/]")
             console.print()
-            Prompt.ask("Press Enter to continue", default="")
+            _pause()
             return
             
-        console.print(f"[{KARTOZA_COLORS['highlight2']}]🔥 Comprehensive Load Test Suite[/]")
+        console.print(f"[{STYLE_HIGHLIGHT2}]🔥 Comprehensive Load Test Suite[/]")
         console.print()
         
         if not self.tester.layers:
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ No layers available[/]")
-            console.print()
-            Prompt.ask("Press Enter to continue", default="")
-            return
-        
-        # Test parameters - get last used values as defaults
-        last_requests = self.test_config.get_last_total_requests()
-        last_concurrency = self.test_config.get_last_concurrency_list()
-        
-        total_requests = IntPrompt.ask(
-            "Requests per test",
-            default=last_requests
-        )
-        
-        # Get concurrency levels as comma-separated list
-        default_concurrency_str = format_concurrency_list(last_concurrency)
-        console.print(f"[{KARTOZA_COLORS['highlight3']}]Enter concurrency levels as comma-separated values (e.g., 1,10,100,500)[/]")
-        
-        concurrency_input = Prompt.ask(
-            "Concurrency levels for all layers",
-            default=default_concurrency_str
-        )
-        
-        # Parse and validate concurrency levels
-        concurrency_list = parse_concurrency_list(concurrency_input)
-        if not concurrency_list:
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ Invalid concurrency levels[/]")
+            console.print(MSG_NO_LAYERS)
             console.print()
-            Prompt.ask("Press Enter to continue", default="")
+            _pause()
             return
         
-        # Remove concurrency levels greater than total requests
-        valid_concurrency = validate_concurrency_list(concurrency_list, total_requests)
-        removed_concurrency = [c for c in concurrency_list if c not in valid_concurrency]
-        
-        if removed_concurrency:
-            console.print(f"[{KARTOZA_COLORS['alert']}]⚠️  Removed concurrency levels greater than request count: {removed_concurrency}[/]")
-        
-        if not valid_concurrency:
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ No valid concurrency levels remaining[/]")
-            console.print()
-            Prompt.ask("Press Enter to continue", default="")
+        params = self._prompt_test_params("Requests per test", "Concurrency levels for all layers")
+        if params is None:
             return
+        total_requests, valid_concurrency = params
         
-        # Save configuration for next time
-        self.test_config.update_test_config(concurrency_list, total_requests)
-        
-        console.print()
-        console.print(f"[{KARTOZA_COLORS['highlight3']}]Test Configuration:[/]")
-        console.print(f"  • Layers: {len(self.tester.layers)}")
-        console.print(f"  • Concurrency levels: {format_concurrency_list(valid_concurrency)}")
-        console.print(f"  • Requests per test: {total_requests:,}")
-        console.print(f"  • Total tests: {len(self.tester.layers) * len(valid_concurrency)}")
-        console.print(f"  • Total requests: {total_requests * len(self.tester.layers) * len(valid_concurrency):,}")
-        console.print(f"  • Estimated time: {self._estimate_test_time(len(valid_concurrency))} minutes")
         console.print()
+        _print_block(
+            f"[{STYLE_HIGHLIGHT3}]Test Configuration:[/]",
+            f"  • Layers: {len(self.tester.layers)}",
+            f"  • Concurrency levels: {format_concurrency_list(valid_concurrency)}",
+            f"  • Requests per test: {total_requests:,}",
+            f"  • Total tests: {len(self.tester.layers) * len(valid_concurrency)}",
+            f"  • Total requests: {total_requests * len(self.tester.layers) * len(valid_concurrency):,}",
+            f"  • Estimated time: {self._estimate_test_time(len(valid_concurrency))} minutes"
+        )
         
-        if not Confirm.ask(f"[{KARTOZA_COLORS['alert']}]⚠️  This is a comprehensive test. Continue?[/]"):
+        if not Confirm.ask(PROMPT_CONFIRM_COMPREHENSIVE):
             return
         
+        render = Confirm.ask(PROMPT_RENDER_WORKLOAD, default=False)
+        
         # Run comprehensive tests
-        console.print(f"[{KARTOZA_COLORS['highlight2']}]🚀 Starting comprehensive load tests...[/]")
+        console.print(f"[{STYLE_HIGHLIGHT2}]🚀 Starting comprehensive load tests...[/]")
         console.print()
         
-        results = self.tester.run_comprehensive_test(total_requests, valid_concurrency)
+        results = self.tester.run_comprehensive_test(total_requests, valid_concurrency, render=render)
         
         if results:
             self._display_comprehensive_results(results)
             
-            if Confirm.ask(f"[{KARTOZA_COLORS['highlight4']}]Generate PDF report?[/]"):
+            if Confirm.ask(PROMPT_GENERATE_PDF):
                 # Find the session-specific results file that was created by run_comprehensive_test
-                from datetime import datetime
                 # The comprehensive test should have already saved consolidated results
                 # We need to get the path to the most recent file for this session
-                import glob
-                from pathlib import Path
-                
-                # Look for the most recent consolidated file (should be the one just created)
-                results_pattern = f"{RESULTS_DIR}/consolidated_geoserver_results_*.json"
-                result_files = sorted(glob.glob(results_pattern), key=lambda x: Path(x).stat().st_mtime, reverse=True)
+                result_files, _ = _list_consolidated_results(RESULTS_DIR, "geoserver", limit=1)
                 
                 if result_files:
                     # Use the most recently created file (should be our session)
                     session_results_file = result_files[0]
-                    console.print(f"[{KARTOZA_COLORS['highlight3']}]Using session results: {Path(session_results_file).name}[/]")
+                    console.print(f"[{STYLE_HIGHLIGHT3}]Using session results: {Path(session_results_file).name}[/]")
                     self._generate_pdf_report(session_results_file)
                 else:
                     # Fallback to default behavior
                     self._generate_pdf_report()
         else:
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ No test results generated[/]")
+            console.print(f"[{STYLE_ALERT}]❌ No test results generated[/]")
         
         console.print()
-        Prompt.ask("Press Enter to continue", default="")
+        _pause()
     
     def _estimate_test_time(self, concurrency_count: int = None) -> int:
         """Estimate test completion time in minutes"""
@@ -1046,36 +1341,40 @@ class MenuInterface:
     
     def _display_comprehensive_results(self, results):
         """Display comprehensive test results summary"""
-        console.print(f"[{KARTOZA_COLORS['highlight4']}]✅ Comprehensive testing completed![/]")
+        console.print(f"[{STYLE_HIGHLIGHT4}]✅ Comprehensive testing completed![/]")
         console.print()
         
         # Summary table
         table = Table(title="Comprehensive Test Summary", show_header=True)
-        table.add_column("Layer", style=f"{KARTOZA_COLORS['highlight2']}")
+        table.add_column("Layer", style=KARTOZA_COLORS['highlight2'])
         table.add_column("Tests", justify="center")
-        table.add_column("Best RPS", justify="right", style=f"{KARTOZA_COLORS['highlight1']}")
+        table.add_column("Best RPS", justify="right", style=KARTOZA_COLORS['highlight1'])
         table.add_column("Worst RPS", justify="right")
-        table.add_column("Avg Success Rate", justify="right", style=f"{KARTOZA_COLORS['highlight4']}")
+        table.add_column("Avg Success Rate", justify="right", style=KARTOZA_COLORS['highlight4'])
         
         # Group results by layer
-        layer_stats = {}
+        # Results share one type, so pick the layer attribute once rather than per result
+        layer_attr = next((attr for attr in ('layer', 'target') if hasattr(results[0], attr)), None)
+        layer_stats = defaultdict(list)
         for result in results:
-            layer_name = getattr(result, 'layer', getattr(result, 'target', 'unknown'))
-            if layer_name not in layer_stats:
-                layer_stats[layer_name] = []
-            layer_stats[layer_name].append(result)
+            layer_stats[getattr(result, layer_attr, 'unknown') if layer_attr else 'unknown'].append(result)
         
         for layer_name, layer_results in layer_stats.items():
             layer_info = self.tester.get_layer_info(layer_name)
             layer_title = layer_info.title if layer_info else layer_name
             test_count = len(layer_results)
             
-            rps_values = [r.requests_per_second for r in layer_results]
-            success_rates = [r.success_rate for r in layer_results]
-            
-            best_rps = max(rps_values)
-            worst_rps = min(rps_values)
-            avg_success = sum(success_rates) / len(success_rates)
+            # Best/worst RPS and the success total in a single pass
+            best_rps = worst_rps = layer_results[0].requests_per_second
+            success_total = 0.0
+            for r in layer_results:
+                rps = r.requests_per_second
+                if rps > best_rps:
+                    best_rps = rps
+                elif rps < worst_rps:
+                    worst_rps = rps
+                success_total += r.success_rate
+            avg_success = success_total / test_count
             
             table.add_row(
                 layer_title,
@@ -1090,36 +1389,35 @@ class MenuInterface:
     def _generate_pdf_report(self, session_results_file=None):
         """Generate PDF report using common PDF generator"""
         try:
-            # Import the PDF generator
-            from ..common.pdf_generator import generate_pdf_report
+            generate_pdf_report = _require_pdf_generator()
             
             if session_results_file:
-                console.print(f"[{KARTOZA_COLORS['highlight2']}]📊 Generating PDF report for current session...[/]")
+                console.print(f"[{STYLE_HIGHLIGHT2}]📊 Generating PDF report for current session...[/]")
             else:
-                console.print(f"[{KARTOZA_COLORS['highlight2']}]📊 Generating comprehensive PDF report...[/]")
+                console.print(f"[{STYLE_HIGHLIGHT2}]📊 Generating comprehensive PDF report...[/]")
             
             # Generate PDF report
             pdf_path = generate_pdf_report("geoserver", results_file=session_results_file)
             
             if pdf_path:
-                console.print(f"[{KARTOZA_COLORS['highlight4']}]✅ PDF report generated![/]")
-                console.print(f"[{KARTOZA_COLORS['highlight3']}]📄 Report: {pdf_path}[/]")
+                console.print(f"[{STYLE_HIGHLIGHT4}]✅ PDF report generated![/]")
+                console.print(f"[{STYLE_HIGHLIGHT3}]📄 Report: {pdf_path}[/]")
             else:
-                console.print(f"[{KARTOZA_COLORS['alert']}]❌ Failed to generate PDF report[/]")
+                console.print(f"[{STYLE_ALERT}]❌ Failed to generate PDF report[/]")
                 
                 # Offer to generate text report as fallback
-                if Confirm.ask(f"[{KARTOZA_COLORS['highlight3']}]Generate text report instead?[/]"):
+                if Confirm.ask(PROMPT_TEXT_REPORT):
                     self._generate_text_report()
                     
         except ImportError:
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ PDF generation requires matplotlib[/]")
-            console.print(f"[{KARTOZA_COLORS['highlight3']}]Install with: pip install matplotlib[/]")
+            console.print(f"[{STYLE_ALERT}]❌ PDF generation requires matplotlib[/]")
+            console.print(f"[{STYLE_HIGHLIGHT3}]Install with: pip install matplotlib[/]")
             
             # Offer to generate text report as fallback
-            if Confirm.ask(f"[{KARTOZA_COLORS['highlight3']}]Generate text report instead?[/]"):
+            if Confirm.ask(PROMPT_TEXT_REPORT):
                 self._generate_text_report()
         except Exception as e:
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ Error generating report: {e}[/]")
+            console.print(f"[{STYLE_ALERT}]❌ Error generating report: {e}[/]")
     
     def _generate_text_report(self):
         """Generate a text report as fallback"""
@@ -1128,155 +1426,120 @@ class MenuInterface:
             report_generator = ReportGenerator("geoserver")
             
             # For now, just show that we could generate a report
-            console.print(f"[{KARTOZA_COLORS['highlight3']}]📄 Text report functionality available[/]")
-            console.print(f"[{KARTOZA_COLORS['highlight4']}]Future enhancement: Generate comprehensive text reports[/]")
+            console.print(f"[{STYLE_HIGHLIGHT3}]📄 Text report functionality available[/]")
+            console.print(f"[{STYLE_HIGHLIGHT4}]Future enhancement: Generate comprehensive text reports[/]")
             
         except Exception as e:
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ Error generating text report: {e}[/]")
+            console.print(f"[{STYLE_ALERT}]❌ Error generating text report: {e}[/]")
+    
+    def _generate_pdf_with_progress(self, results_file: Optional[str] = None) -> Optional[Path]:
+        """Generate the GeoServer PDF report behind a progress bar fed by the generator itself"""
+        generate_pdf_report = _require_pdf_generator()
+        
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TimeElapsedColumn(),
+            console=console,
+            transient=True
+        ) as progress:
+            task = progress.add_task("Generating PDF Report", total=100)
+            pdf_path = generate_pdf_report(
+                "geoserver",
+                results_file=results_file,
+                progress_callback=lambda completed, description: progress.update(
+                    task, completed=completed, description=description
+                )
+            )
+        
+        if pdf_path:
+            console.print("✅ PDF generation complete!", markup=False, highlight=False)
+        return pdf_path
     
     def generate_report_from_latest_menu(self):
         """Generate PDF report from latest benchmark results"""
-        console.print(f"[{KARTOZA_COLORS['highlight2']}]📊 Generate Report from Latest Results[/]")
+        console.print(f"[{STYLE_HIGHLIGHT2}]📊 Generate Report from Latest Results[/]")
         console.print()
         
         try:
-            from ..common.pdf_generator import generate_pdf_report
-            
-            # Create a clean progress bar with messages on separate lines
-            with Progress(
-                SpinnerColumn(),
-                BarColumn(),
-                MofNCompleteColumn(),
-                TimeElapsedColumn(),
-                console=console,
-                transient=True
-            ) as progress:
-                
-                # Add main task
-                task = progress.add_task("Generating PDF Report", total=100)
-                
-                # Step 1: Find latest results
-                console.print("🔍 Looking for latest benchmark results...")
-                progress.update(task, completed=10)
-                
-                # Step 2: Initialize PDF generator (simulated steps for better UX)
-                console.print("📋 Initializing PDF generator...")
-                progress.update(task, completed=20)
-                
-                # Step 3: Generate the actual PDF
-                console.print("📄 Generating comprehensive PDF report...")
-                progress.update(task, completed=30)
-                pdf_path = generate_pdf_report("geoserver")
-                
-                # Step 4: Finalize
-                console.print("✅ PDF generation complete!")
-                progress.update(task, completed=100)
+            console.print("🔍 Looking for latest benchmark results...", markup=False, highlight=False)
+            pdf_path = self._generate_pdf_with_progress()
             
             console.print()
             if pdf_path:
-                console.print(f"[{KARTOZA_COLORS['highlight4']}]✅ PDF report generated successfully![/]")
-                console.print(f"[{KARTOZA_COLORS['highlight3']}]📄 Report: {pdf_path}[/]")
+                console.print(f"[{STYLE_HIGHLIGHT4}]✅ PDF report generated successfully![/]")
+                console.print(f"[{STYLE_HIGHLIGHT3}]📄 Report: {pdf_path}[/]")
                 
                 # Ask user if they want to open the PDF
-                if Confirm.ask(f"[{KARTOZA_COLORS['highlight2']}]Open PDF report now?[/]", default=True):
+                if Confirm.ask(PROMPT_OPEN_PDF, default=True):
                     try:
-                        subprocess.run(["xdg-open", str(pdf_path)], check=False)
-                        console.print(f"[{KARTOZA_COLORS['highlight4']}]📖 Opening PDF in default viewer...[/]")
+                        self._launch_viewer(pdf_path)
+                        console.print(f"[{STYLE_HIGHLIGHT4}]📖 Opening PDF in default viewer...[/]")
                     except Exception as e:
-                        console.print(f"[{KARTOZA_COLORS['alert']}]❌ Could not open PDF: {e}[/]")
+                        console.print(f"[{STYLE_ALERT}]❌ Could not open PDF: {e}[/]")
             else:
-                console.print(f"[{KARTOZA_COLORS['alert']}]❌ No recent results found or failed to generate report[/]")
-                console.print(f"[{KARTOZA_COLORS['highlight3']}]💡 Run some benchmark tests first[/]")
+                console.print(f"[{STYLE_ALERT}]❌ No recent results found or failed to generate report[/]")
+                console.print(MSG_RUN_TESTS_FIRST)
                 
         except ImportError:
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ PDF generation requires additional dependencies[/]")
+            console.print(MSG_PDF_DEPS_MISSING)
         except Exception as e:
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ Error generating report: {e}[/]")
+            console.print(f"[{STYLE_ALERT}]❌ Error generating report: {e}[/]")
         
         console.print()
-        Prompt.ask("Press Enter to continue", default="")
+        _pause()
     
     def select_previous_report_menu(self):
         """Select and generate PDF report from previous benchmark results"""
-        console.print(f"[{KARTOZA_COLORS['highlight2']}]📋 Select Previous Benchmark Results[/]")
+        console.print(f"[{STYLE_HIGHLIGHT2}]📋 Select Previous Benchmark Results[/]")
         console.print()
         
         # Find all available result files
         results_dir = Path("results")
         if not results_dir.exists():
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ No results directory found[/]")
+            console.print(f"[{STYLE_ALERT}]❌ No results directory found[/]")
             console.print()
-            Prompt.ask("Press Enter to continue", default="")
+            _pause()
             return
         
-        pattern = str(results_dir / "consolidated_*_results_*.json")
-        result_files = sorted(glob.glob(pattern), reverse=True)
+        # Only the 10 most recent files are listed
+        display_files, total_files = _list_consolidated_results(results_dir, limit=10)
         
-        if not result_files:
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ No previous benchmark results found[/]")
-            console.print(f"[{KARTOZA_COLORS['highlight3']}]💡 Run some benchmark tests first[/]")
+        if not display_files:
+            console.print(f"[{STYLE_ALERT}]❌ No previous benchmark results found[/]")
+            console.print(MSG_RUN_TESTS_FIRST)
             console.print()
-            Prompt.ask("Press Enter to continue", default="")
+            _pause()
             return
         
-        console.print(f"[{KARTOZA_COLORS['highlight3']}]Found {len(result_files)} previous benchmark results:[/]")
+        console.print(f"[{STYLE_HIGHLIGHT3}]Found {total_files} previous benchmark results:[/]")
         console.print()
         
         # Create selection table
         table = Table(title="Available Benchmark Results", show_header=True)
-        table.add_column("#", justify="center", style=f"{KARTOZA_COLORS['highlight3']}")
-        table.add_column("Date/Time", style=f"{KARTOZA_COLORS['highlight1']}")
-        table.add_column("File", style=f"{KARTOZA_COLORS['highlight2']}")
-        
-        # Show top 10 most recent files
-        display_files = result_files[:10]
+        table.add_column("#", justify="center", style=KARTOZA_COLORS['highlight3'])
+        table.add_column("Date/Time", style=KARTOZA_COLORS['highlight1'])
+        table.add_column("File", style=KARTOZA_COLORS['highlight2'])
         
         for i, file_path in enumerate(display_files):
             filename = Path(file_path).name
-            # Extract datetime from filename if possible
-            try:
-                # Example: consolidated_geoserver_results_20241116_093401.json
-                parts = filename.replace('consolidated_', '').replace('_results_', '_').replace('.json', '').split('_')
-                if len(parts) >= 3:
-                    date_str = parts[-2]  # 20241116
-                    time_str = parts[-1]  # 093401
-                    formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]} {time_str[:2]}:{time_str[2:4]}:{time_str[4:6]}"
-                else:
-                    formatted_date = "Unknown"
-            except:
-                formatted_date = "Unknown"
-            
-            table.add_row(str(i + 1), formatted_date, filename)
+            table.add_row(str(i + 1), _parse_result_filename(filename) or "Unknown", filename)
         
-        if len(result_files) > 10:
-            table.add_row("...", f"({len(result_files) - 10} more files)", "...")
+        if total_files > len(display_files):
+            table.add_row("...", f"({total_files - len(display_files)} more files)", "...")
         
         console.print(table)
         console.print()
         
         if len(display_files) == 0:
-            console.print(f"[{KARTOZA_COLORS['alert']}]❌ No results to display[/]")
+            console.print(f"[{STYLE_ALERT}]❌ No results to display[/]")
             console.print()
-            Prompt.ask("Press Enter to continue", default="")
+            _pause()
             return
         
         # Create file choices for interactive selection
-        file_choices = []
-        for file_path in display_files:
-            filename = Path(file_path).name
-            # Extract datetime from filename if possible
-            try:
-                # Example: consolidated_geoserver_results_20241116_093401.json
-                parts = filename.replace('consolidated_', '').replace('_results_', '_').replace('.json', '').split('_')
-                if len(parts) >= 3:
-                    date_str = parts[-2]  # 20241116
-                    time_str = parts[-1]  # 093401
-                    formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]} {time_str[:2]}:{time_str[2:4]}:{time_str[4:6]}"
-                    file_choices.append(f"{formatted_date} - {filename}")
-                else:
-                    file_choices.append(filename)
-            except:
-                file_choices.append(filename)
+        file_choices = list(map(_format_result_choice, display_files))
         
         # Get user selection
         try:
@@ -1290,72 +1553,43 @@ class MenuInterface:
                 return  # User cancelled
             
             selected_file = display_files[choice_index]
-            console.print(f"[{KARTOZA_COLORS['highlight3']}]Selected: {Path(selected_file).name}[/]")
+            console.print(f"[{STYLE_HIGHLIGHT3}]Selected: {Path(selected_file).name}[/]")
             console.print()
             
             # Generate report from selected file with progress bar
             try:
-                from ..common.pdf_generator import generate_pdf_report
-                
-                # Create a clean progress bar with messages on separate lines
-                with Progress(
-                    SpinnerColumn(),
-                    BarColumn(),
-                    MofNCompleteColumn(),
-                    TimeElapsedColumn(),
-                    console=console,
-                    transient=True
-                ) as progress:
-                    
-                    # Add main task
-                    task = progress.add_task("Generating PDF Report", total=100)
-                    
-                    # Step 1: Load selected results
-                    console.print(f"📂 Loading results from {Path(selected_file).name}...")
-                    progress.update(task, completed=10)
-                    
-                    # Step 2: Initialize PDF generator
-                    console.print("📋 Initializing PDF generator...")
-                    progress.update(task, completed=20)
-                    
-                    # Step 3: Generate the actual PDF
-                    console.print("📄 Generating comprehensive PDF report...")
-                    progress.update(task, completed=30)
-                    pdf_path = generate_pdf_report("geoserver", results_file=selected_file)
-                    
-                    # Step 4: Finalize
-                    console.print("✅ PDF generation complete!")
-                    progress.update(task, completed=100)
+                console.print(f"📂 Loading results from {Path(selected_file).name}...")
+                pdf_path = self._generate_pdf_with_progress(selected_file)
                 
                 console.print()
                 if pdf_path:
-                    console.print(f"[{KARTOZA_COLORS['highlight4']}]✅ PDF report generated successfully![/]")
-                    console.print(f"[{KARTOZA_COLORS['highlight3']}]📄 Report: {pdf_path}[/]")
+                    console.print(f"[{STYLE_HIGHLIGHT4}]✅ PDF report generated successfully![/]")
+                    console.print(f"[{STYLE_HIGHLIGHT3}]📄 Report: {pdf_path}[/]")
                     
                     # Ask user if they want to open the PDF
-                    if Confirm.ask(f"[{KARTOZA_COLORS['highlight2']}]Open PDF report now?[/]", default=True):
+                    if Confirm.ask(PROMPT_OPEN_PDF, default=True):
                         try:
-                            subprocess.run(["xdg-open", str(pdf_path)], check=False)
-                            console.print(f"[{KARTOZA_COLORS['highlight4']}]📖 Opening PDF in default viewer...[/]")
+                            self._launch_viewer(pdf_path)
+                            console.print(f"[{STYLE_HIGHLIGHT4}]📖 Opening PDF in default viewer...[/]")
                         except Exception as e:
-                            console.print(f"[{KARTOZA_COLORS['alert']}]❌ Could not open PDF: {e}[/]")
+                            console.print(f"[{STYLE_ALERT}]❌ Could not open PDF: {e}[/]")
                 else:
-                    console.print(f"[{KARTOZA_COLORS['alert']}]❌ Failed to generate report[/]")
+                    console.print(f"[{STYLE_ALERT}]❌ Failed to generate report[/]")
                     
             except ImportError:
-                console.print(f"[{KARTOZA_COLORS['alert']}]❌ PDF generation requires additional dependencies[/]")
+                console.print(MSG_PDF_DEPS_MISSING)
             except Exception as e:
-                console.print(f"[{KARTOZA_COLORS['alert']}]❌ Error generating report: {e}[/]")
+                console.print(f"[{STYLE_ALERT}]❌ Error generating report: {e}[/]")
                 
         except (ValueError, KeyboardInterrupt):
-            console.print(f"[{KARTOZA_COLORS['highlight3']}]❌ Selection cancelled[/]")
+            console.print(f"[{STYLE_HIGHLIGHT3}]❌ Selection cancelled[/]")
         
         console.print()
-        Prompt.ask("Press Enter to continue", default="")
+        _pause()
     
     def view_results_menu(self):
         """Menu for viewing test results"""
-        console.print(f"[{KARTOZA_COLORS['highlight2']}]📊 View Test Results[/]")
+        console.print(f"[{STYLE_HIGHLIGHT2}]📊 View Test Results[/]")
         console.print()
         
         # Show summary table
@@ -1363,43 +1597,50 @@ class MenuInterface:
         if summary:
             console.print(summary)
         else:
-            console.print(f"[{KARTOZA_COLORS['alert']}]No test results found. Run some tests first![/]")
+            console.print(f"[{STYLE_ALERT}]No test results found. Run some tests first![/]")
         
         console.print()
-        Prompt.ask("Press Enter to continue", default="")
+        _pause()
+    
+    @cached_property
+    def _main_menu_options(self) -> Dict[bool, Tuple[List[str], Tuple[Callable[[], None], ...]]]:
+        """Main menu option labels and handlers, keyed by whether a server is configured"""
+        unconfigured = [
+            ("▲ Setup Server Connection", self.setup_server),
+            ("▪ Generate Report from Latest Results", self.generate_report_from_latest_menu),
+            ("◦ Select Previous Results for Report", self.select_previous_report_menu),
+            ("▣ Configure Monitoring", self.monitoring_config_menu),
+            ("? Help & Info", self._show_help),
+            ("× Exit", self.exit_app)
+        ]
+        configured = [
+            ("▲ Change Server Connection", self.setup_server),
+            ("▤ Preview Layer Maps", self.preview_layer_menu),
+            ("▶ Run Single Layer Test", self.single_test_menu), 
+            ("▣ Run Comprehensive Tests", self.comprehensive_test_menu),
+            ("■ View Test Results", self.view_results_menu),
+            ("▪ Generate Report from Latest Results", self.generate_report_from_latest_menu),
+            ("◦ Select Previous Results for Report", self.select_previous_report_menu),
+            ("▣ Configure Monitoring", self.monitoring_config_menu),
+            ("▷ Test Connectivity", self.test_connectivity_menu),
+            ("▧ Show Layer Info", self.show_layer_info),
+            ("▦ Image Rendering Info", self.show_image_capabilities),
+            ("× Exit", self.exit_app)
+        ]
+        return {
+            configured_flag: (list(labels), handlers)
+            for configured_flag, (labels, handlers) in (
+                (False, zip(*unconfigured)),
+                (True, zip(*configured)),
+            )
+        }
     
     def main_menu(self):
         """Display and handle the main menu"""
         
         while True:
-            # Dynamic menu based on server configuration - evaluated each loop iteration
-            if not self.server_configured:
-                menu_options = [
-                    ("▲ Setup Server Connection", self.setup_server),
-                    ("▪ Generate Report from Latest Results", self.generate_report_from_latest_menu),
-                    ("◦ Select Previous Results for Report", self.select_previous_report_menu),
-                    ("▣ Configure Monitoring", self.monitoring_config_menu),
-                    ("? Help & Info", self._show_help),
-                    ("× Exit", self.exit_app)
-                ]
-            else:
-                menu_options = [
-                    ("▲ Change Server Connection", self.setup_server),
-                    ("▤ Preview Layer Maps", self.preview_layer_menu),
-                    ("▶ Run Single Layer Test", self.single_test_menu), 
-                    ("▣ Run Comprehensive Tests", self.comprehensive_test_menu),
-                    ("■ View Test Results", self.view_results_menu),
-                    ("▪ Generate Report from Latest Results", self.generate_report_from_latest_menu),
-                    ("◦ Select Previous Results for Report", self.select_previous_report_menu),
-                    ("▣ Configure Monitoring", self.monitoring_config_menu),
-                    ("▷ Test Connectivity", self.test_connectivity_menu),
-                    ("▧ Show Layer Info", self.show_layer_info),
-                    ("▦ Image Rendering Info", self.show_image_capabilities),
-                    ("× Exit", self.exit_app)
-                ]
-            
-            # Extract option texts for interactive selection
-            option_texts = [option_text for option_text, _ in menu_options]
+            # Menu variant for the current server configuration
+            option_texts, handlers = self._main_menu_options[self.server_configured]
             
             try:
                 choice_index = self._interactive_menu(
@@ -1412,83 +1653,89 @@ class MenuInterface:
                     continue
                 
                 console.print()
-                _, handler = menu_options[choice_index]
-                handler()
+                handlers[choice_index]()
                 
             except (KeyboardInterrupt, EOFError):
                 self.exit_app()
     
     def show_image_capabilities(self):
         """Show image rendering capabilities"""
-        console.print(f"[{KARTOZA_COLORS['highlight2']}]🎨 Image Rendering Capabilities[/]")
+        console.print(f"[{STYLE_HIGHLIGHT2}]🎨 Image Rendering Capabilities[/]")
         console.print()
         
         self.image_renderer.print_capabilities()
         console.print()
         
-        Prompt.ask("Press Enter to continue", default="")
+        _pause()
     
-    def _show_help(self):
-        """Show help information"""
-        help_text = Text()
-        help_text.append("GeoServer Load Testing Suite", style=f"bold {KARTOZA_COLORS['highlight2']}")
-        help_text.append("\n\n")
-        help_text.append("This tool discovers layers dynamically from GeoServer instances\n", style=f"{KARTOZA_COLORS['highlight3']}")
-        help_text.append("and provides comprehensive load testing capabilities.\n\n", style=f"{KARTOZA_COLORS['highlight3']}")
-        help_text.append("Getting Started:\n", style=f"bold {KARTOZA_COLORS['highlight1']}")
-        help_text.append("1. Setup server connection (provide subdomain)\n", style=f"{KARTOZA_COLORS['highlight3']}")
-        help_text.append("2. Tool will discover layers via WMS GetCapabilities\n", style=f"{KARTOZA_COLORS['highlight3']}")
-        help_text.append("3. Run connectivity tests, previews, or load tests\n", style=f"{KARTOZA_COLORS['highlight3']}")
-        help_text.append("\n")
-        help_text.append("Features:\n", style=f"bold {KARTOZA_COLORS['highlight1']}")
-        help_text.append("• Dynamic layer discovery from any GeoServer\n", style=f"{KARTOZA_COLORS['highlight3']}")
-        help_text.append("• Subdomain history management\n", style=f"{KARTOZA_COLORS['highlight3']}")
-        help_text.append("• Apache Bench load testing integration\n", style=f"{KARTOZA_COLORS['highlight3']}")
-        help_text.append("• Map previews with metadata from capabilities\n", style=f"{KARTOZA_COLORS['highlight3']}")
-        help_text.append("• Rich progress tracking and reporting\n", style=f"{KARTOZA_COLORS['highlight3']}")
-        
-        panel = Panel.fit(
+    def _build_help_panel(self) -> Panel:
+        """Static help panel"""
+        heading = f"bold {KARTOZA_COLORS['highlight1']}"
+        body = KARTOZA_COLORS['highlight3']
+        help_text = Text.assemble(
+            ("GeoServer Load Testing Suite", f"bold {KARTOZA_COLORS['highlight2']}"),
+            "\n\n",
+            ("This tool discovers layers dynamically from GeoServer instances\n"
+             "and provides comprehensive load testing capabilities.\n\n", body),
+            ("Getting Started:\n", heading),
+            ("1. Setup server connection (provide subdomain)\n"
+             "2. Tool will discover layers via WMS GetCapabilities\n"
+             "3. Run connectivity tests, previews, or load tests\n", body),
+            "\n",
+            ("Features:\n", heading),
+            ("• Dynamic layer discovery from any GeoServer\n"
+             "• Subdomain history management\n"
+             "• Apache Bench load testing integration\n"
+             "• Map previews with metadata from capabilities\n"
+             "• Rich progress tracking and reporting\n", body),
+        )
+        
+        return Panel.fit(
             help_text,
-            border_style=f"{KARTOZA_COLORS['highlight4']}",
+            border_style=KARTOZA_COLORS['highlight4'],
             title="Help & Information",
             padding=(1, 2)
         )
-        
-        console.print(panel)
-        console.print()
-        Prompt.ask("Press Enter to continue", default="")
+    
+    def _show_help(self):
+        """Show help information"""
+        self._write_frame(self._render_static("help", self._build_help_panel) + "\n")
+        _pause()
     
     def monitoring_config_menu(self):
         """Main monitoring configuration menu"""
+        menu_options = [
+            ("📋 List All Endpoints", self._list_monitoring_endpoints),
+            ("➕ Add New Endpoint", self._add_monitoring_endpoint), 
+            ("✏️  Edit Endpoint", self._edit_monitoring_endpoint),
+            ("🔧 Test Endpoint Connection", self._test_monitoring_endpoint),
+            ("🔄 Toggle Endpoint Enable/Disable", self._toggle_monitoring_endpoint),
+            ("❌ Delete Endpoint", self._delete_monitoring_endpoint),
+            ("📤 Export Environment Variables", self._export_monitoring_env_vars),
+        ]
+        
+        # Extract option texts for interactive selection
+        option_texts = [option_text for option_text, _ in menu_options]
+        
+        painted_summary = None
         while True:
-            console.clear()
-            self.show_banner()
-            
-            console.print(f"[{KARTOZA_COLORS['highlight2']}]📊 Monitoring Configuration[/]")
-            console.print()
-            
-            # Show current configuration summary
+            # The summary dict is only replaced when the configuration changes, so the
+            # screen is cleared and redrawn on entry and after changes, not after
+            # read-only actions such as listing or testing endpoints
             summary = self.monitoring_config.get_config_summary()
-            console.print(f"[{KARTOZA_COLORS['highlight3']}]Configuration Summary:[/]")
-            console.print(f"  • Total endpoints: {summary['total_endpoints']}")
-            console.print(f"  • Enabled endpoints: {summary['enabled_endpoints']}")
-            console.print(f"  • Prometheus endpoints: {summary['prometheus_endpoints']}")
-            console.print(f"  • Grafana endpoints: {summary['grafana_endpoints']}")
-            console.print(f"  • Config file: {summary['config_file']}")
-            console.print()
-            
-            menu_options = [
-                ("📋 List All Endpoints", self._list_monitoring_endpoints),
-                ("➕ Add New Endpoint", self._add_monitoring_endpoint), 
-                ("✏️  Edit Endpoint", self._edit_monitoring_endpoint),
-                ("🔧 Test Endpoint Connection", self._test_monitoring_endpoint),
-                ("🔄 Toggle Endpoint Enable/Disable", self._toggle_monitoring_endpoint),
-                ("❌ Delete Endpoint", self._delete_monitoring_endpoint),
-                ("📤 Export Environment Variables", self._export_monitoring_env_vars),
-            ]
-            
-            # Extract option texts for interactive selection
-            option_texts = [option_text for option_text, _ in menu_options]
+            if summary is not painted_summary:
+                with console.capture() as capture:
+                    _print_block(f"[{STYLE_HIGHLIGHT2}]📊 Monitoring Configuration[/]")
+                    _print_block(
+                        f"[{STYLE_HIGHLIGHT3}]Configuration Summary:[/]",
+                        f"  • Total endpoints: {summary['total_endpoints']}",
+                        f"  • Enabled endpoints: {summary['enabled_endpoints']}",
+                        f"  • Prometheus endpoints: {summary['prometheus_endpoints']}",
+                        f"  • Grafana endpoints: {summary['grafana_endpoints']}",
+                        f"  • Config file: {escape(str(summary['config_file']))}"
+                    )
+                self._write_screen(capture.get())
+                painted_summary = summary
             
             try:
                 choice_index = self._interactive_select(
@@ -1508,60 +1755,110 @@ class MenuInterface:
             except (KeyboardInterrupt, EOFError):
                 break
     
-    def _list_monitoring_endpoints(self):
-        """List all monitoring endpoints"""
-        console.print(f"[{KARTOZA_COLORS['highlight2']}]📋 Monitoring Endpoints[/]")
-        console.print()
-        
-        endpoints = self.monitoring_config.read_all_endpoints()
-        
-        if not endpoints:
-            console.print(f"[{KARTOZA_COLORS['alert']}]No monitoring endpoints configured[/]")
+    def _get_endpoint_items(self) -> Tuple[Tuple[str, MonitoringEndpoint], ...]:
+        """Snapshot of the configured (name, endpoint) pairs, kept until endpoints change"""
+        if self._endpoint_items_cache is None:
+            self._endpoint_items_cache = tuple(self.monitoring_config.read_all_endpoints().items())
+        return self._endpoint_items_cache
+    
+    def _get_endpoint_choices(self, variant: str) -> Tuple[Tuple[Tuple[str, MonitoringEndpoint], ...], List[str]]:
+        """Configured (name, endpoint) pairs and their selection labels for ``variant``
+        
+        Both are memoized until the endpoints change, so the edit, test, toggle
+        and delete menus share one snapshot instead of each copying the endpoints.
+        """
+        endpoint_items = self._get_endpoint_items()
+        choices = self._choices_cache.get(variant)
+        if choices is None:
+            if variant == "status_with_url":
+                choices = [f"{e.status_icon} {n} ({e.type_display}) - {e.url}" for n, e in endpoint_items]
+            elif variant == "status_label":
+                choices = [f"{e.status_label} {n} ({e.type_display})" for n, e in endpoint_items]
+            else:
+                choices = [f"{e.status_icon} {n} ({e.type_display})" for n, e in endpoint_items]
+            self._choices_cache[variant] = choices
+        return endpoint_items, choices
+    
+    def _pick_endpoint(self, action: str, variant: str) -> Optional[Tuple[str, MonitoringEndpoint]]:
+        """Ask which endpoint to ``action``, listing labels of the given variant
+        
+        Returns the chosen (name, endpoint) pair, or None when no endpoints
+        are configured (after telling the user) or the selection is cancelled.
+        """
+        endpoint_items, endpoint_choices = self._get_endpoint_choices(variant)
+        if not endpoint_items:
+            console.print(f"[{STYLE_ALERT}]No endpoints to {action}[/]")
             console.print()
-            Prompt.ask("Press Enter to continue", default="")
-            return
+            _pause()
+            return None
         
-        # Create endpoints table
+        choice_index = self._interactive_select(
+            endpoint_choices,
+            f"Select endpoint to {action}:",
+            show_skip_option=True
+        )
+        if choice_index is None:
+            return None
+        return endpoint_items[choice_index]
+    
+    def _invalidate_endpoint_caches(self):
+        """Drop memoized endpoint data after the monitoring configuration changes"""
+        self._choices_cache.clear()
+        self._endpoint_items_cache = None
+        self._static_render_cache.pop("endpoints", None)
+    
+    def _build_endpoints_listing(self) -> Group:
+        """Title and table of the configured monitoring endpoints"""
         table = Table(title="Monitoring Endpoints", show_header=True)
-        table.add_column("Name", style=f"{KARTOZA_COLORS['highlight2']}")
-        table.add_column("Type", style=f"{KARTOZA_COLORS['highlight1']}")
-        table.add_column("URL", style=f"{KARTOZA_COLORS['highlight3']}")
+        table.add_column("Name", style=KARTOZA_COLORS['highlight2'])
+        table.add_column("Type", style=KARTOZA_COLORS['highlight1'])
+        table.add_column("URL", style=KARTOZA_COLORS['highlight3'])
         table.add_column("Status", justify="center")
-        table.add_column("Description", style=f"{KARTOZA_COLORS['highlight4']}")
+        table.add_column("Description", style=KARTOZA_COLORS['highlight4'])
         
-        for name, endpoint in endpoints.items():
-            status = "✅ Enabled" if endpoint.enabled else "❌ Disabled"
-            description = endpoint.description or "No description"
-            
+        # User-entered values go in as Text so they are never parsed as markup
+        for _, endpoint in self._get_endpoint_items():
             table.add_row(
-                endpoint.name,
-                endpoint.endpoint_type.upper(),
-                endpoint.url,
-                status,
-                description[:50] + "..." if len(description) > 50 else description
+                Text(endpoint.name),
+                endpoint.type_display,
+                Text(endpoint.url),
+                endpoint.status_label,
+                Text(endpoint.description_display)
             )
         
-        console.print(table)
-        console.print()
-        Prompt.ask("Press Enter to continue", default="")
+        return Group(f"[{STYLE_HIGHLIGHT2}]📋 Monitoring Endpoints[/]\n", table)
+    
+    def _list_monitoring_endpoints(self):
+        """List all monitoring endpoints"""
+        if not self._get_endpoint_items():
+            _print_block(
+                f"[{STYLE_HIGHLIGHT2}]📋 Monitoring Endpoints[/]\n",
+                f"[{STYLE_ALERT}]No monitoring endpoints configured[/]"
+            )
+            _pause()
+            return
+        
+        # The rendered table is reused until the endpoints change
+        self._write_frame(self._render_static("endpoints", self._build_endpoints_listing) + "\n")
+        _pause()
     
     def _add_monitoring_endpoint(self):
         """Add a new monitoring endpoint"""
-        console.print(f"[{KARTOZA_COLORS['highlight2']}]➕ Add New Monitoring Endpoint[/]")
+        console.print(f"[{STYLE_HIGHLIGHT2}]➕ Add New Monitoring Endpoint[/]")
         console.print()
         
         try:
             # Get endpoint details
             name = Prompt.ask("Endpoint name", default="")
             if not name:
-                console.print(f"[{KARTOZA_COLORS['alert']}]Name is required[/]")
-                Prompt.ask("Press Enter to continue", default="")
+                console.print(f"[{STYLE_ALERT}]Name is required[/]")
+                _pause()
                 return
             
             # Check if name already exists
             if self.monitoring_config.read_endpoint(name):
-                console.print(f"[{KARTOZA_COLORS['alert']}]Endpoint '{name}' already exists[/]")
-                Prompt.ask("Press Enter to continue", default="")
+                console.print(Text(f"Endpoint '{name}' already exists", style=STYLE_ALERT))
+                _pause()
                 return
             
             # Interactive endpoint type selection
@@ -1572,9 +1869,9 @@ class MenuInterface:
             )
             
             if type_index is None:
-                console.print(f"[{KARTOZA_COLORS['highlight3']}]Operation cancelled[/]")
+                console.print(MSG_OPERATION_CANCELLED)
                 console.print()
-                Prompt.ask("Press Enter to continue", default="")
+                _pause()
                 return
             
             endpoint_type = endpoint_types[type_index].lower()
@@ -1602,53 +1899,32 @@ class MenuInterface:
                 description=description,
                 enabled=enabled
             )
+            self._invalidate_endpoint_caches()
             
             if success:
-                console.print(f"[{KARTOZA_COLORS['highlight4']}]✅ Endpoint '{name}' created successfully![/]")
+                console.print(Text(f"✅ Endpoint '{name}' created successfully!", style=STYLE_HIGHLIGHT4))
             else:
-                console.print(f"[{KARTOZA_COLORS['alert']}]❌ Failed to create endpoint[/]")
+                console.print(f"[{STYLE_ALERT}]❌ Failed to create endpoint[/]")
             
         except (KeyboardInterrupt, EOFError):
-            console.print(f"[{KARTOZA_COLORS['highlight3']}]Operation cancelled[/]")
+            console.print(MSG_OPERATION_CANCELLED)
         
         console.print()
-        Prompt.ask("Press Enter to continue", default="")
+        _pause()
     
     def _edit_monitoring_endpoint(self):
         """Edit an existing monitoring endpoint"""
-        console.print(f"[{KARTOZA_COLORS['highlight2']}]✏️  Edit Monitoring Endpoint[/]")
+        console.print(f"[{STYLE_HIGHLIGHT2}]✏️  Edit Monitoring Endpoint[/]")
         console.print()
         
-        endpoints = self.monitoring_config.read_all_endpoints()
-        if not endpoints:
-            console.print(f"[{KARTOZA_COLORS['alert']}]No endpoints to edit[/]")
-            console.print()
-            Prompt.ask("Press Enter to continue", default="")
-            return
-        
-        # Create endpoint choices for interactive selection
-        endpoint_names = list(endpoints.keys())
-        endpoint_choices = []
-        for name in endpoint_names:
-            endpoint = endpoints[name]
-            status = "✅" if endpoint.enabled else "❌"
-            endpoint_choices.append(f"{status} {name} ({endpoint.endpoint_type.upper()})")
+        picked = self._pick_endpoint("edit", "status_only")
+        if picked is None:
+            return  # No endpoints, or the user cancelled
+        selected_name, endpoint = picked
         
         try:
-            choice_index = self._interactive_select(
-                endpoint_choices,
-                "Select endpoint to edit:",
-                show_skip_option=True
-            )
-            
-            if choice_index is None:
-                return  # User cancelled
-            
-            selected_name = endpoint_names[choice_index]
-            endpoint = endpoints[selected_name]
-            
-            console.print(f"[{KARTOZA_COLORS['highlight3']}]Editing: {selected_name}[/]")
-            console.print(f"[{KARTOZA_COLORS['highlight3']}]Leave fields empty to keep current values[/]")
+            console.print(Text(f"Editing: {selected_name}", style=STYLE_HIGHLIGHT3))
+            console.print(f"[{STYLE_HIGHLIGHT3}]Leave fields empty to keep current values[/]")
             console.print()
             
             # Edit fields
@@ -1674,194 +1950,135 @@ class MenuInterface:
             
             if update_data:
                 success = self.monitoring_config.update_endpoint(selected_name, **update_data)
+                self._invalidate_endpoint_caches()
                 if success:
-                    console.print(f"[{KARTOZA_COLORS['highlight4']}]✅ Endpoint updated successfully![/]")
+                    console.print(f"[{STYLE_HIGHLIGHT4}]✅ Endpoint updated successfully![/]")
                 else:
-                    console.print(f"[{KARTOZA_COLORS['alert']}]❌ Failed to update endpoint[/]")
+                    console.print(f"[{STYLE_ALERT}]❌ Failed to update endpoint[/]")
             else:
-                console.print(f"[{KARTOZA_COLORS['highlight3']}]No changes made[/]")
+                console.print(MSG_NO_CHANGES)
                 
         except (KeyboardInterrupt, EOFError, ValueError):
-            console.print(f"[{KARTOZA_COLORS['highlight3']}]Operation cancelled[/]")
+            console.print(MSG_OPERATION_CANCELLED)
         
         console.print()
-        Prompt.ask("Press Enter to continue", default="")
+        _pause()
     
     def _test_monitoring_endpoint(self):
         """Test connection to a monitoring endpoint"""
-        console.print(f"[{KARTOZA_COLORS['highlight2']}]🔧 Test Endpoint Connection[/]")
+        console.print(f"[{STYLE_HIGHLIGHT2}]🔧 Test Endpoint Connection[/]")
         console.print()
         
-        endpoints = self.monitoring_config.read_all_endpoints()
-        if not endpoints:
-            console.print(f"[{KARTOZA_COLORS['alert']}]No endpoints to test[/]")
-            console.print()
-            Prompt.ask("Press Enter to continue", default="")
-            return
-        
-        # Create endpoint choices for interactive selection  
-        endpoint_names = list(endpoints.keys())
-        endpoint_choices = []
-        for name in endpoint_names:
-            endpoint = endpoints[name]
-            status = "✅" if endpoint.enabled else "❌"
-            endpoint_choices.append(f"{status} {name} ({endpoint.endpoint_type.upper()}) - {endpoint.url}")
+        picked = self._pick_endpoint("test", "status_with_url")
+        if picked is None:
+            return  # No endpoints, or the user cancelled
+        selected_name, _ = picked
         
         try:
-            choice_index = self._interactive_select(
-                endpoint_choices,
-                "Select endpoint to test:",
-                show_skip_option=True
-            )
-            
-            if choice_index is None:
-                return  # User cancelled
-            
-            selected_name = endpoint_names[choice_index]
-            console.print(f"[{KARTOZA_COLORS['highlight3']}]Testing connection to {selected_name}...[/]")
+            console.print(Text(f"Testing connection to {selected_name}...", style=STYLE_HIGHLIGHT3))
             
             with console.status("Testing connection..."):
                 success, message = self.monitoring_config.test_endpoint_connection(selected_name)
             
             if success:
-                console.print(f"[{KARTOZA_COLORS['highlight4']}]✅ Connection successful: {message}[/]")
+                console.print(Text(f"✅ Connection successful: {message}", style=STYLE_HIGHLIGHT4))
             else:
-                console.print(f"[{KARTOZA_COLORS['alert']}]❌ Connection failed: {message}[/]")
+                console.print(Text(f"❌ Connection failed: {message}", style=STYLE_ALERT))
                 
         except (KeyboardInterrupt, EOFError, ValueError):
-            console.print(f"[{KARTOZA_COLORS['highlight3']}]Test cancelled[/]")
+            console.print(f"[{STYLE_HIGHLIGHT3}]Test cancelled[/]")
         
         console.print()
-        Prompt.ask("Press Enter to continue", default="")
+        _pause()
     
     def _toggle_monitoring_endpoint(self):
         """Toggle enable/disable status of an endpoint"""
-        console.print(f"[{KARTOZA_COLORS['highlight2']}]🔄 Toggle Endpoint Status[/]")
+        console.print(f"[{STYLE_HIGHLIGHT2}]🔄 Toggle Endpoint Status[/]")
         console.print()
         
-        endpoints = self.monitoring_config.read_all_endpoints()
-        if not endpoints:
-            console.print(f"[{KARTOZA_COLORS['alert']}]No endpoints to toggle[/]")
-            console.print()
-            Prompt.ask("Press Enter to continue", default="")
-            return
-        
-        # Create endpoint choices for interactive selection
-        endpoint_names = list(endpoints.keys())
-        endpoint_choices = []
-        for name in endpoint_names:
-            endpoint = endpoints[name]
-            status = "✅ Enabled" if endpoint.enabled else "❌ Disabled"
-            endpoint_choices.append(f"{status} {name} ({endpoint.endpoint_type.upper()})")
+        picked = self._pick_endpoint("toggle", "status_label")
+        if picked is None:
+            return  # No endpoints, or the user cancelled
+        selected_name, endpoint = picked
         
         try:
-            choice_index = self._interactive_select(
-                endpoint_choices,
-                "Select endpoint to toggle:",
-                show_skip_option=True
-            )
-            
-            if choice_index is None:
-                return  # User cancelled
-            
-            selected_name = endpoint_names[choice_index]
-            endpoint = endpoints[selected_name]
-            
-            current_status = "enabled" if endpoint.enabled else "disabled"
             new_status = "disabled" if endpoint.enabled else "enabled"
             
-            if Confirm.ask(f"Toggle '{selected_name}' from {current_status} to {new_status}?"):
+            if Confirm.ask(f"Toggle '{selected_name}' from {endpoint.status_word} to {new_status}?"):
                 success = self.monitoring_config.toggle_endpoint(selected_name)
+                self._invalidate_endpoint_caches()
                 if success:
-                    console.print(f"[{KARTOZA_COLORS['highlight4']}]✅ Endpoint '{selected_name}' is now {new_status}[/]")
+                    console.print(Text(f"✅ Endpoint '{selected_name}' is now {endpoint.status_word}", style=STYLE_HIGHLIGHT4))
                 else:
-                    console.print(f"[{KARTOZA_COLORS['alert']}]❌ Failed to toggle endpoint[/]")
+                    console.print(f"[{STYLE_ALERT}]❌ Failed to toggle endpoint[/]")
             else:
-                console.print(f"[{KARTOZA_COLORS['highlight3']}]No changes made[/]")
+                console.print(MSG_NO_CHANGES)
                 
         except (KeyboardInterrupt, EOFError, ValueError):
-            console.print(f"[{KARTOZA_COLORS['highlight3']}]Operation cancelled[/]")
+            console.print(MSG_OPERATION_CANCELLED)
         
         console.print()
-        Prompt.ask("Press Enter to continue", default="")
+        _pause()
     
     def _delete_monitoring_endpoint(self):
         """Delete a monitoring endpoint"""
-        console.print(f"[{KARTOZA_COLORS['highlight2']}]❌ Delete Monitoring Endpoint[/]")
+        console.print(f"[{STYLE_HIGHLIGHT2}]❌ Delete Monitoring Endpoint[/]")
         console.print()
         
-        endpoints = self.monitoring_config.read_all_endpoints()
-        if not endpoints:
-            console.print(f"[{KARTOZA_COLORS['alert']}]No endpoints to delete[/]")
-            console.print()
-            Prompt.ask("Press Enter to continue", default="")
-            return
-        
-        # Create endpoint choices for interactive selection
-        endpoint_names = list(endpoints.keys())
-        endpoint_choices = []
-        for name in endpoint_names:
-            endpoint = endpoints[name]
-            status = "✅" if endpoint.enabled else "❌"
-            endpoint_choices.append(f"{status} {name} ({endpoint.endpoint_type.upper()}) - {endpoint.url}")
+        picked = self._pick_endpoint("delete", "status_with_url")
+        if picked is None:
+            return  # No endpoints, or the user cancelled
+        selected_name, _ = picked
         
         try:
-            choice_index = self._interactive_select(
-                endpoint_choices,
-                "Select endpoint to delete:",
-                show_skip_option=True
-            )
-            
-            if choice_index is None:
-                return  # User cancelled
-            
-            selected_name = endpoint_names[choice_index]
-            
-            console.print(f"[{KARTOZA_COLORS['alert']}]⚠️  WARNING: This will permanently delete the endpoint '{selected_name}'[/]")
+            console.print(Text(f"⚠️  WARNING: This will permanently delete the endpoint '{selected_name}'", style=STYLE_ALERT))
             console.print()
             
             if Confirm.ask(f"Are you sure you want to delete '{selected_name}'?", default=False):
                 success = self.monitoring_config.delete_endpoint(selected_name)
+                self._invalidate_endpoint_caches()
                 if success:
-                    console.print(f"[{KARTOZA_COLORS['highlight4']}]✅ Endpoint '{selected_name}' deleted successfully[/]")
+                    console.print(Text(f"✅ Endpoint '{selected_name}' deleted successfully", style=STYLE_HIGHLIGHT4))
                 else:
-                    console.print(f"[{KARTOZA_COLORS['alert']}]❌ Failed to delete endpoint[/]")
+                    console.print(f"[{STYLE_ALERT}]❌ Failed to delete endpoint[/]")
             else:
-                console.print(f"[{KARTOZA_COLORS['highlight3']}]Deletion cancelled[/]")
+                console.print(f"[{STYLE_HIGHLIGHT3}]Deletion cancelled[/]")
                 
         except (KeyboardInterrupt, EOFError, ValueError):
-            console.print(f"[{KARTOZA_COLORS['highlight3']}]Operation cancelled[/]")
+            console.print(MSG_OPERATION_CANCELLED)
         
         console.print()
-        Prompt.ask("Press Enter to continue", default="")
+        _pause()
     
     def _export_monitoring_env_vars(self):
         """Export monitoring configuration as environment variables"""
-        console.print(f"[{KARTOZA_COLORS['highlight2']}]📤 Export Environment Variables[/]")
-        console.print()
-        
+        title = f"[{STYLE_HIGHLIGHT2}]📤 Export Environment Variables[/]\n"
         env_vars = self.monitoring_config.export_to_env_vars()
         
         if env_vars:
-            console.print(f"[{KARTOZA_COLORS['highlight3']}]Environment variables for active endpoints:[/]")
-            console.print()
-            
-            for var_name, var_value in env_vars.items():
-                console.print(f"export {var_name}=\"{var_value}\"")
-            
-            console.print()
-            console.print(f"[{KARTOZA_COLORS['highlight4']}]💡 You can copy these commands to set environment variables[/]")
-            console.print(f"[{KARTOZA_COLORS['highlight4']}]   or add them to your shell profile (.bashrc, .zshrc, etc.)[/]")
+            # Plain shell lines as an unstyled Text so values are never read as markup
+            exports = Text("\n".join(f'export {var_name}="{var_value}"' for var_name, var_value in env_vars.items()))
+            _print_group(
+                title,
+                f"[{STYLE_HIGHLIGHT3}]Environment variables for active endpoints:[/]\n",
+                exports,
+                "",
+                f"[{STYLE_HIGHLIGHT4}]💡 You can copy these commands to set environment variables[/]",
+                f"[{STYLE_HIGHLIGHT4}]   or add them to your shell profile (.bashrc, .zshrc, etc.)[/]",
+                ""
+            )
         else:
-            console.print(f"[{KARTOZA_COLORS['alert']}]No active endpoints found[/]")
-            console.print(f"[{KARTOZA_COLORS['highlight3']}]Enable at least one endpoint to export environment variables[/]")
+            _print_block(
+                title,
+                f"[{STYLE_ALERT}]No active endpoints found[/]",
+                f"[{STYLE_HIGHLIGHT3}]Enable at least one endpoint to export environment variables[/]"
+            )
         
-        console.print()
-        Prompt.ask("Press Enter to continue", default="")
+        _pause()
     
     def exit_app(self):
         """Exit the application"""
-        console.print(f"[{KARTOZA_COLORS['highlight4']}]👋 Goodbye![/]")
+        console.print(f"[{STYLE_HIGHLIGHT4}]👋 Goodbye![/]")
         sys.exit(0)
     
     def run(self):
@@ -0,0 +1,53 @@
+"""
+Canned inputs shared by the GeoServer test modules
+"""
+
+import textwrap
+from functools import lru_cache
+from typing import Tuple
+
+from gsh_benchmarker.geoserver.capabilities import LayerInfo
+
+
+# Apache Bench stdout returned by every test that stubs the ab subprocess
+CANNED_AB_STDOUT = textwrap.dedent("""
+    Requests per second:    100.50 [#/sec] (mean)
+    Time per request:       9.95 [ms] (mean)
+    Failed requests:        0
+    Time taken for tests:   49.75 seconds
+    Transfer rate:          1500.25 [Kbytes/sec] received
+    """)
+
+
+class FakeAbProcess:
+    """Stand-in for the Apache Bench Popen that exits at once with CANNED_AB_STDOUT"""
+
+    returncode = 0
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def communicate(self, timeout=None):
+        return CANNED_AB_STDOUT, ""
+
+    def kill(self):
+        pass
+
+    terminate = kill
+
+
+@lru_cache(maxsize=None)
+def make_layer(name: str, title: str, abstract: str,
+               srs: Tuple[str, ...], bbox: Tuple[float, float, float, float]) -> LayerInfo:
+    """Shared LayerInfo for the given values, built once per distinct argument set
+    
+    The instance is shared between callers, so deep-copy it before mutating.
+    bbox is (minx, miny, maxx, maxy).
+    """
+    return LayerInfo(
+        name=name,
+        title=title,
+        abstract=abstract,
+        srs_list=list(srs),
+        bbox=dict(zip(('minx', 'miny', 'maxx', 'maxy'), bbox))
+    )
@@ -2,46 +2,74 @@
 Unit tests to verify the LAYERS variable fix in the GeoServer testing suite
 """
 
-import unittest
-from unittest.mock import Mock, patch, MagicMock
+import copy
+import io
+import json
+import random
+import shutil
+import threading
 from pathlib import Path
 from datetime import datetime
+from types import SimpleNamespace
 
+import pytest
+
+from gsh_benchmarker.geoserver import core
 from gsh_benchmarker.geoserver.core import GeoServerTester
 from gsh_benchmarker.common import BenchmarkResult
-from gsh_benchmarker.geoserver.capabilities import LayerInfo
 
+from gsh_benchmarker.tests._fixtures import FakeAbProcess, make_layer
 
-class TestGeoServerFix(unittest.TestCase):
-    """Test cases to verify the LAYERS variable fix"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.tester = GeoServerTester()
-        
-        # Mock layer info
-        self.mock_layer = LayerInfo(
-            name="test_layer",
-            title="Test Layer",
-            abstract="A test layer for unit testing",
-            srs_list=["EPSG:3857", "EPSG:4326"],
-            bbox={'minx': 0, 'miny': 0, 'maxx': 100, 'maxy': 100}
-        )
-        
-        # Set up mock layers dictionary
-        self.tester.layers = {
-            "test_layer": self.mock_layer,
-            "another_layer": LayerInfo(
-                name="another_layer",
-                title="Another Layer", 
-                abstract="Another test layer",
-                srs_list=["EPSG:3857"],
-                bbox={'minx': 50, 'miny': 50, 'maxx': 150, 'maxy': 150}
-            )
-        }
-        
-        self.tester.server_url = "http://test.example.com"
-        self.tester._setup_urls()  # Initialize WMTS and WMS URLs
+@pytest.fixture(scope="module")
+def proto_tester():
+    """Fully wired tester, built once per module and only ever copied"""
+    tester = GeoServerTester()
+
+    # Set up mock layers dictionary
+    tester.layers = {
+        "test_layer": make_layer("test_layer", "Test Layer", "A test layer for unit testing",
+                                 ("EPSG:3857", "EPSG:4326"), (0, 0, 100, 100)),
+        "another_layer": make_layer("another_layer", "Another Layer", "Another test layer",
+                                    ("EPSG:3857",), (50, 50, 150, 150)),
+    }
+
+    tester.server_url = "http://test.example.com"
+    tester._setup_urls()  # Initialize WMTS and WMS URLs
+    return tester
+
+
+@pytest.fixture
+def tester(proto_tester):
+    """Each test's own copy of the prototype tester"""
+    return copy.deepcopy(proto_tester)
+
+
+@pytest.fixture
+def stub_ab_process(monkeypatch):
+    """Swap the Apache Bench subprocess for the canned result until the test ends"""
+    monkeypatch.setattr(core.subprocess, 'Popen', FakeAbProcess)
+
+
+@pytest.fixture
+def patch_fs(monkeypatch):
+    """Stub Path.mkdir, any extra Path attributes and builtins.open until the test ends
+
+    Stubs are plain functions swapped in with monkeypatch rather than mock.patch
+    contexts. The returned callable gives back the dict of Path stubs it installed.
+    """
+    def _patch(read_data='', **path_attrs):
+        path_stubs = {'mkdir': lambda self, *args, **kwargs: None, **path_attrs}
+        for name, stub in path_stubs.items():
+            monkeypatch.setattr(Path, name, stub)
+        # A fresh in-memory file per open(): reads return read_data, writes are dropped
+        monkeypatch.setattr('builtins.open', lambda *args, **kwargs: io.StringIO(read_data))
+        return path_stubs
+    return _patch
+
+
+class TestGeoServerFix:
+    """Test cases to verify the LAYERS variable fix"""
 
     def test_imports_work(self):
         """Test that all modules can be imported without NameError"""
@@ -50,99 +78,106 @@ class TestGeoServerFix(unittest.TestCase):
             from gsh_benchmarker.geoserver.ui import MenuInterface
             from gsh_benchmarker.geoserver.capabilities import LayerInfo
         except NameError as e:
-            self.fail(f"NameError during imports: {e}")
+            pytest.fail(f"NameError during imports: {e}")
 
     def test_instantiation_works(self):
         """Test that classes can be instantiated without NameError"""
         try:
             tester = GeoServerTester()
-            self.assertIsInstance(tester, GeoServerTester)
+            assert isinstance(tester, GeoServerTester)
         except NameError as e:
-            self.fail(f"NameError during instantiation: {e}")
+            pytest.fail(f"NameError during instantiation: {e}")
+
+    def test_get_layer_list_uses_self_layers(self, tester):
+        """Test that get_layer_list uses self.layers instead of undefined LAYERS"""
+        layer_list = tester.get_layer_list()
+        assert "test_layer" in layer_list
+        assert "another_layer" in layer_list
+        assert len(layer_list) == 2
+
+    def test_get_layer_info_uses_self_layers(self, tester):
+        """Test that get_layer_info uses self.layers instead of undefined LAYERS"""
+        layer_info = tester.get_layer_info("test_layer")
+        assert layer_info is not None
+        assert layer_info.name == "test_layer"
+        assert layer_info.title == "Test Layer"
 
-    @patch('gsh_benchmarker.geoserver.core.subprocess.run')
-    def test_run_single_test_uses_self_layers(self, mock_subprocess):
+    def test_run_single_test_uses_self_layers(self, tester, stub_ab_process, patch_fs):
         """Test that run_single_test uses self.layers instead of undefined LAYERS"""
-        # Mock subprocess.run to simulate successful Apache Bench
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = """
-        Requests per second:    100.50 [#/sec] (mean)
-        Time per request:       9.95 [ms] (mean)
-        Failed requests:        0
-        Time taken for tests:   49.75 seconds
-        Transfer rate:          1500.25 [Kbytes/sec] received
-        """
-        mock_subprocess.return_value = mock_result
-        
-        # Mock directory creation
-        with patch.object(Path, 'mkdir'), \
-             patch('builtins.open', unittest.mock.mock_open()):
-            
-            result = self.tester.run_single_test(
-                layer_key="test_layer",
-                concurrency=10,
-                total_requests=100
-            )
-            
-            # Verify test result was created successfully
-            self.assertIsInstance(result, BenchmarkResult)
-            self.assertEqual(result.target, "test_layer")
-            self.assertEqual(result.concurrency, 10)
-            self.assertEqual(result.total_requests, 100)
-
-    def test_get_layer_list_uses_self_layers(self):
-        """Test that get_layer_list uses self.layers"""
-        layer_list = self.tester.get_layer_list()
-        
-        self.assertIn("test_layer", layer_list)
-        self.assertIn("another_layer", layer_list)
-        self.assertEqual(len(layer_list), 2)
-
-    def test_get_layer_info_uses_self_layers(self):
-        """Test that get_layer_info uses self.layers"""
-        layer_info = self.tester.get_layer_info("test_layer")
-        
-        self.assertIsNotNone(layer_info)
-        self.assertEqual(layer_info.title, "Test Layer")
-        self.assertEqual(layer_info.name, "test_layer")
-
-    @patch('gsh_benchmarker.geoserver.core.subprocess.run')
-    def test_comprehensive_test_uses_self_layers(self, mock_subprocess):
+        patch_fs()
+
+        result = tester.run_single_test("test_layer", 10, 100)
+        assert isinstance(result, BenchmarkResult)
+        assert result.target == "test_layer"
+        assert result.concurrency == 10
+        assert result.total_requests == 100
+
+    def test_cancel_event_skips_queued_levels(self, tester, stub_ab_process, patch_fs):
+        """Test that levels not yet started are skipped once cancel_event is set"""
+        patch_fs()
+        cancel = threading.Event()
+        started = []
+
+        def on_start(concurrency):
+            started.append(concurrency)
+            cancel.set()  # As if Ctrl-C arrived while the first level runs
+
+        results = tester.run_concurrency_tests(
+            "test_layer", [1, 5, 10], total_requests=100,
+            on_start=on_start, cancel_event=cancel
+        )
+
+        assert started == [1]
+        assert isinstance(results[0], BenchmarkResult)
+        assert results[1:] == [None, None]
+
+    def test_comprehensive_test_uses_self_layers(self, tester, stub_ab_process, patch_fs,
+                                                 monkeypatch):
         """Test that run_comprehensive_test uses self.layers instead of undefined LAYERS"""
-        # Mock subprocess.run to simulate successful Apache Bench
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = """
-        Requests per second:    50.25 [#/sec] (mean)
-        Time per request:       19.90 [ms] (mean)
-        Failed requests:        0
-        Time taken for tests:   99.50 seconds
-        Transfer rate:          750.75 [Kbytes/sec] received
-        """
-        mock_subprocess.return_value = mock_result
-        
-        # Mock directory operations and file I/O
-        with patch.object(Path, 'mkdir'), \
-             patch.object(Path, 'exists', return_value=True), \
-             patch('shutil.rmtree'), \
-             patch('builtins.open', unittest.mock.mock_open()), \
-             patch.object(self.tester, 'test_connectivity', return_value=(True, 200)):
-            
-            results = self.tester.run_comprehensive_test(
-                total_requests=100,
-                concurrency_levels=[5, 10]
-            )
-            
-            # Should have 4 results (2 layers × 2 concurrency levels)
-            self.assertEqual(len(results), 4)
-            
-            # Verify all results are BenchmarkResult objects
-            for result in results:
-                self.assertIsInstance(result, BenchmarkResult)
-
-    @patch('builtins.open', unittest.mock.mock_open())
-    def test_save_test_metadata_uses_layer_info_object(self):
+        patch_fs(exists=lambda self: True)
+        monkeypatch.setattr(shutil, 'rmtree', lambda *args, **kwargs: None)
+        monkeypatch.setattr(tester, 'test_connectivity', lambda layer_name: (True, 200))
+
+        results = tester.run_comprehensive_test(
+            total_requests=100,
+            concurrency_levels=[5, 10]
+        )
+
+        # Should have 4 results (2 layers × 2 concurrency levels)
+        assert len(results) == 4
+
+        # Verify all results are BenchmarkResult objects
+        for result in results:
+            assert isinstance(result, BenchmarkResult)
+
+    def test_render_url_stays_inside_layer_bbox(self, tester):
+        """Test that generate_render_url picks an untiled window within the layer extent"""
+        url = tester.generate_render_url("test_layer", rng=random.Random(0))
+        params = dict(part.split("=", 1) for part in url.split("?", 1)[1].split("&"))
+
+        assert params["REQUEST"] == "GetMap"
+        assert params["TILED"] == "false"
+        minx, miny, maxx, maxy = map(float, params["BBOX"].split(","))
+        assert 0 <= minx < maxx <= 100
+        assert 0 <= miny < maxy <= 100
+
+    def test_render_metadata_records_getmap_window(self, tester, stub_ab_process, patch_fs,
+                                                   monkeypatch):
+        """Test that a render run records the GetMap bbox and size, not WMTS tile fields"""
+        patch_fs()
+        saved = []
+        monkeypatch.setattr(core.json, 'dumps', lambda obj, **kwargs: saved.append(obj) or '')
+
+        tester.run_single_test("test_layer", 10, 100, render=True)
+
+        metadata = saved[-1]
+        assert metadata["protocol"] == "WMS"
+        assert metadata["width"] == metadata["height"] == "256"
+        assert len(metadata["bbox"].split(",")) == 4
+        assert "tile_matrix" not in metadata
+        assert "tile_row" not in metadata
+
+    def test_save_test_metadata_uses_layer_info_object(self, tester, patch_fs):
         """Test that _save_test_metadata correctly accesses LayerInfo object attributes"""
         # Create a test result
         result = BenchmarkResult(
@@ -159,19 +194,19 @@ class TestGeoServerFix(unittest.TestCase):
             test_id="test_123",
             timestamp="20241114_120000"
         )
-        
+
         tile_url = "http://test.example.com/wmts?..."
-        
-        # Mock directory creation
-        with patch.object(Path, 'mkdir'):
-            # This should not raise any AttributeError about dict access
-            try:
-                self.tester._save_test_metadata(result, tile_url, self.mock_layer)
-            except AttributeError as e:
-                if "'LayerInfo' object" in str(e):
-                    self.fail(f"LayerInfo object access error: {e}")
-
-    def test_results_summary_uses_self_layers(self):
+
+        patch_fs()
+
+        # This should not raise any AttributeError about dict access
+        try:
+            tester._save_test_metadata(result, tile_url, tester.layers["test_layer"])
+        except AttributeError as e:
+            if "'LayerInfo' object" in str(e):
+                pytest.fail(f"LayerInfo object access error: {e}")
+
+    def test_results_summary_uses_self_layers(self, tester, patch_fs, monkeypatch):
         """Test that get_results_summary uses self.layers correctly"""
         # Mock JSON files in results directory
         mock_json_data = {
@@ -185,25 +220,24 @@ class TestGeoServerFix(unittest.TestCase):
                 "success_rate": "100.0"
             }
         }
-        
-        with patch.object(Path, 'exists', return_value=True), \
-             patch.object(Path, 'glob', return_value=[Path('test_result.json')]), \
-             patch.object(Path, 'stat') as mock_stat, \
-             patch.object(Path, 'mkdir'), \
-             patch('builtins.open', unittest.mock.mock_open(read_data='')) as mock_open, \
-             patch('json.load', return_value=mock_json_data):
-            
-            mock_stat.return_value.st_mtime = datetime.now().timestamp()
-            
-            try:
-                summary = self.tester.get_results_summary()
-                # Should not raise NameError about LAYERS
-                self.assertIsNotNone(summary)
-            except NameError as e:
-                if "LAYERS" in str(e):
-                    self.fail(f"NameError about LAYERS: {e}")
+
+        file_stat = SimpleNamespace(st_mtime=datetime.now().timestamp())
+        patch_fs(
+            exists=lambda self: True,
+            glob=lambda self, pattern: [Path('test_result.json')],
+            stat=lambda self, **kwargs: file_stat
+        )
+        monkeypatch.setattr(json, 'load', lambda f: mock_json_data)
+
+        try:
+            summary = tester.get_results_summary()
+            # Should not raise NameError about LAYERS
+            assert summary is not None
+        except NameError as e:
+            if "LAYERS" in str(e):
+                pytest.fail(f"NameError about LAYERS: {e}")
 
 
 if __name__ == '__main__':
     # Run the tests
-    unittest.main(verbosity=2)
\ No newline at end of file
+    pytest.main([__file__, "-v"])
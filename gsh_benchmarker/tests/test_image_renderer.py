@@ -3,96 +3,94 @@
 Test script for the enhanced image rendering functionality
 """
 
-import unittest
 import sys
-import tempfile
 from pathlib import Path
-from PIL import Image, ImageDraw
+
+import pytest
 
 from gsh_benchmarker.geoserver.image_renderer import TerminalImageRenderer
 
 
-class TestImageRenderer(unittest.TestCase):
+def create_test_image(path: Path, width: int = 300, height: int = 200):
+    """Create a test image for rendering"""
+    # PIL is only needed to draw the sample, so keep it out of collection
+    from PIL import Image, ImageDraw
+
+    # Create a simple test image with PIL
+    img = Image.new('RGB', (width, height), color='lightblue')
+    draw = ImageDraw.Draw(img)
+
+    # Draw some shapes
+    draw.rectangle([50, 50, width-50, height-50], outline='darkblue', width=3)
+    draw.ellipse([100, 75, width-100, height-75], fill='yellow', outline='orange', width=2)
+    draw.text((width//2-50, height//2-10), "GeoServer", fill='black')
+
+    img.save(path, 'PNG')
+
+
+@pytest.fixture(scope="session")
+def sample_png(tmp_path_factory):
+    """Sample PNG drawn once per test session"""
+    path = tmp_path_factory.mktemp("img") / "test.png"
+    create_test_image(path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def renderer():
+    """One renderer shared by the session, since capability detection is process-global"""
+    return TerminalImageRenderer()
+
+
+class TestImageRenderer:
     """Test cases for the enhanced image renderer"""
 
-    def create_test_image(self, path: Path, width: int = 300, height: int = 200):
-        """Create a test image for rendering"""
-        # Create a simple test image with PIL
-        img = Image.new('RGB', (width, height), color='lightblue')
-        draw = ImageDraw.Draw(img)
-        
-        # Draw some shapes
-        draw.rectangle([50, 50, width-50, height-50], outline='darkblue', width=3)
-        draw.ellipse([100, 75, width-100, height-75], fill='yellow', outline='orange', width=2)
-        draw.text((width//2-50, height//2-10), "GeoServer", fill='black')
-        
-        img.save(path, 'PNG')
-
-
-    def test_image_rendering_capabilities(self):
+    def test_image_rendering_capabilities(self, renderer):
         """Test the image rendering capabilities detection"""
-        renderer = TerminalImageRenderer()
-        
         # Test capabilities detection
         caps = renderer.get_capabilities_info()
-        self.assertIsInstance(caps, dict)
-        self.assertIn('terminal_type', caps)
-        self.assertIn('available_renderers', caps)
-        self.assertIn('supports_true_images', caps)
-        
+        assert isinstance(caps, dict)
+        assert 'terminal_type' in caps
+        assert 'available_renderers' in caps
+        assert 'supports_true_images' in caps
+
         # Terminal type should be a string
-        self.assertIsInstance(caps['terminal_type'], str)
-        
+        assert isinstance(caps['terminal_type'], str)
+
         # Available renderers should be a list
-        self.assertIsInstance(caps['available_renderers'], list)
-        
+        assert isinstance(caps['available_renderers'], list)
+
         # Supports true images should be a boolean
-        self.assertIsInstance(caps['supports_true_images'], bool)
+        assert isinstance(caps['supports_true_images'], bool)
 
-    def test_image_rendering_functionality(self):
+    def test_image_rendering_functionality(self, renderer, sample_png):
         """Test the image rendering functionality"""
-        # Initialize renderer
-        renderer = TerminalImageRenderer()
-        
-        # Create a test image
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-            test_image_path = Path(tmp_file.name)
-        
+        assert sample_png.exists()
+        assert sample_png.stat().st_size > 0
+
+        # Test rendering - should not raise exceptions
         try:
-            self.create_test_image(test_image_path)
-            self.assertTrue(test_image_path.exists())
-            self.assertGreater(test_image_path.stat().st_size, 0)
-            
-            # Test rendering - should not raise exceptions
-            try:
-                success = renderer.render_image(test_image_path, max_width=40, max_height=15)
-                # Success depends on available renderers, but should not crash
-                self.assertIsInstance(success, bool)
-            except Exception as e:
-                self.fail(f"Image rendering raised exception: {e}")
-                
-        finally:
-            # Clean up
-            if test_image_path.exists():
-                test_image_path.unlink()
-
-    def test_image_rendering_with_missing_file(self):
+            success = renderer.render_image(sample_png, max_width=40, max_height=15)
+            # Success depends on available renderers, but should not crash
+            assert isinstance(success, bool)
+        except Exception as e:
+            pytest.fail(f"Image rendering raised exception: {e}")
+
+    def test_image_rendering_with_missing_file(self, renderer):
         """Test image rendering with non-existent file"""
-        renderer = TerminalImageRenderer()
-        
         # Test with non-existent file
         non_existent_path = Path("/tmp/does_not_exist.png")
         success = renderer.render_image(non_existent_path)
-        self.assertFalse(success)
+        assert not success
 
     def test_renderer_initialization(self):
         """Test that renderer initializes without errors"""
         try:
             renderer = TerminalImageRenderer()
-            self.assertIsInstance(renderer, TerminalImageRenderer)
+            assert isinstance(renderer, TerminalImageRenderer)
         except Exception as e:
-            self.fail(f"TerminalImageRenderer initialization failed: {e}")
+            pytest.fail(f"TerminalImageRenderer initialization failed: {e}")
 
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -3,9 +3,13 @@
 Test script to verify the original NameError has been fixed
 """
 
+import copy
+import io
 import unittest
 import sys
-from unittest.mock import patch, Mock
+from unittest.mock import patch
+
+from gsh_benchmarker.tests._fixtures import FakeAbProcess, make_layer
 
 
 class TestOriginalErrorScenario(unittest.TestCase):
@@ -19,43 +23,26 @@ class TestOriginalErrorScenario(unittest.TestCase):
         try:
             # Import the modules
             from gsh_benchmarker.geoserver.core import GeoServerTester
-            from gsh_benchmarker.geoserver.capabilities import LayerInfo
             
             # Create tester instance
             tester = GeoServerTester()
             tester.server_url = "http://test.example.com"
             tester._setup_urls()
             
-            # Set up a mock layer like the UI would do after discovery
-            mock_layer = LayerInfo(
-                name="bkb_2024",
-                title="BKB 2024",
-                abstract="Test layer",
-                srs_list=["EPSG:3857"],
-                bbox={'minx': 0, 'miny': 0, 'maxx': 100, 'maxy': 100}
-            )
+            # Set up a mock layer like the UI would do after discovery; make_layer's
+            # instance is shared, so the tester gets its own copy
+            mock_layer = copy.deepcopy(make_layer("bkb_2024", "BKB 2024", "Test layer",
+                                                  ("EPSG:3857",), (0, 0, 100, 100)))
             
             tester.layers = {"bkb_2024": mock_layer}
             
             print("✅ Setup complete - no NameError")
             
             # Mock subprocess to avoid actual Apache Bench call
-            with patch('gsh_benchmarker.geoserver.core.subprocess.run') as mock_subprocess, \
-                 patch('builtins.open'), \
+            with patch('gsh_benchmarker.geoserver.core.subprocess.Popen', FakeAbProcess), \
+                 patch('builtins.open', lambda *args, **kwargs: io.StringIO()), \
                  patch('pathlib.Path.mkdir'):
                 
-                # Mock successful Apache Bench result
-                mock_result = Mock()
-                mock_result.returncode = 0
-                mock_result.stdout = """
-                Requests per second:    100.50 [#/sec] (mean)
-                Time per request:       9.95 [ms] (mean)
-                Failed requests:        0
-                Time taken for tests:   49.75 seconds
-                Transfer rate:          1500.25 [Kbytes/sec] received
-                """
-                mock_subprocess.return_value = mock_result
-                
                 # This is the exact call that was failing before
                 result = tester.run_single_test("bkb_2024", 100, 5000)
                 
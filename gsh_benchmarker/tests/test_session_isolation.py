@@ -7,9 +7,11 @@ and do not show results from previous runs.
 """
 
 import pytest
+import itertools
 import json
-import time
-from datetime import datetime
+import shutil
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 from ..common.reports import ReportGenerator
@@ -17,22 +19,89 @@ from ..common.utils import BenchmarkResult
 from ..common.pdf_generator import generate_pdf_report
 
 
+# Session timestamps only need to be unique within a run, so a counter stands in for the clock
+_SESSION_COUNTER = itertools.count()
+
+
+def next_session_timestamp() -> str:
+    """Unique, fixed-width session timestamp"""
+    return f"T{next(_SESSION_COUNTER):012d}"
+
+
+@lru_cache(maxsize=None)
+def _result_fields(layer_name: str, concurrency: int) -> dict:
+    """Timestamp-independent BenchmarkResult fields, computed once per layer/concurrency
+    
+    Only ever unpacked into BenchmarkResult(...), so the shared dict is never mutated.
+    """
+    return dict(
+        target=layer_name,
+        service_type='geoserver',
+        concurrency=concurrency,
+        total_requests=1000,
+        requests_per_second=50.0 + concurrency/10,  # Variable performance based on concurrency
+        mean_response_time=200.0 - concurrency/10,
+        failed_requests=0,
+        total_time=1000/(50.0 + concurrency/10),
+        transfer_rate=1000.0,
+        success_rate=100.0,
+    )
+
+
+def fake_clock():
+    """Clock that advances one millisecond per call, for deterministic report dates"""
+    ticks = itertools.count()
+    return lambda: datetime(2024, 1, 1) + timedelta(milliseconds=next(ticks))
+
+
+def read_session(session_file: Path) -> dict:
+    """Read a consolidated session file straight from disk"""
+    with open(session_file) as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def _cached_session(path_str: str, mtime_ns: int, size: int) -> dict:
+    return read_session(Path(path_str))
+
+
+def load_session(session_file: Path) -> dict:
+    """Parsed session file, re-read only when its mtime or size changes
+    
+    The dict is shared between callers, so treat it as read-only.
+    """
+    stat = session_file.stat()
+    return _cached_session(str(session_file), stat.st_mtime_ns, stat.st_size)
+
+
+# Suffixes for the per-test directories created under tmp_base
+_DIR_COUNTER = itertools.count()
+
+
+@pytest.fixture(scope="module")
+def tmp_base(tmp_path_factory):
+    """One pytest temp directory for the module; each test gets a subdirectory of it"""
+    return tmp_path_factory.mktemp("session_iso")
+
+
 class TestSessionIsolation:
     """Test cases for session isolation in benchmark reporting"""
     
     @pytest.fixture
-    def temp_results_dir(self, tmp_path):
+    def temp_results_dir(self, tmp_base):
         """Create temporary results directory for testing"""
-        results_dir = tmp_path / "results"
+        results_dir = tmp_base / f"results{next(_DIR_COUNTER)}"
         results_dir.mkdir()
-        return results_dir
+        yield results_dir
+        shutil.rmtree(results_dir, ignore_errors=True)
     
     @pytest.fixture
-    def temp_reports_dir(self, tmp_path):
+    def temp_reports_dir(self, tmp_base):
         """Create temporary reports directory for testing"""
-        reports_dir = tmp_path / "reports"
+        reports_dir = tmp_base / f"reports{next(_DIR_COUNTER)}"
         reports_dir.mkdir()
-        return reports_dir
+        yield reports_dir
+        shutil.rmtree(reports_dir, ignore_errors=True)
     
     def create_mock_benchmark_result(self, layer_name: str, concurrency: int, timestamp: str = None) -> BenchmarkResult:
         """Create a mock benchmark result for testing"""
@@ -40,25 +109,16 @@ class TestSessionIsolation:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             
         return BenchmarkResult(
-            target=layer_name,
-            service_type='geoserver',
-            concurrency=concurrency,
-            total_requests=1000,
-            requests_per_second=50.0 + concurrency/10,  # Variable performance based on concurrency
-            mean_response_time=200.0 - concurrency/10,
-            failed_requests=0,
-            total_time=1000/(50.0 + concurrency/10),
-            transfer_rate=1000.0,
-            success_rate=100.0,
+            **_result_fields(layer_name, concurrency),
             test_id=f"{layer_name}_c{concurrency}_{timestamp}",
             timestamp=timestamp
         )
     
-    def create_session_results(self, layer_name: str, concurrency_levels: list, 
-                              results_dir: Path, session_type: str = "single_layer") -> tuple:
-        """Create consolidated results for a test session"""
+    def _session_inputs(self, layer_name: str, concurrency_levels: list,
+                        results_dir: Path, session_type: str) -> tuple:
+        """Build the report generator, results, timestamp and config for a test session"""
         results = []
-        session_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:-3]  # Include microseconds for uniqueness
+        session_timestamp = next_session_timestamp()
         
         for concurrency in concurrency_levels:
             result = self.create_mock_benchmark_result(layer_name, concurrency, session_timestamp)
@@ -75,34 +135,49 @@ class TestSessionIsolation:
             'session_type': session_type
         }
         
-        session_file = report_gen.consolidate_results(results, session_timestamp, test_config)
+        return report_gen, results, session_timestamp, test_config
+    
+    def create_session_results(self, layer_name: str, concurrency_levels: list, 
+                              results_dir: Path, session_type: str = "single_layer",
+                              now=datetime.now) -> tuple:
+        """Create consolidated results for a test session"""
+        report_gen, results, session_timestamp, test_config = self._session_inputs(
+            layer_name, concurrency_levels, results_dir, session_type
+        )
+        session_file = report_gen.consolidate_results(results, session_timestamp, test_config, now)
         return session_file, results, session_timestamp
     
+    def build_session_data(self, layer_name: str, concurrency_levels: list,
+                           results_dir: Path, session_type: str = "single_layer",
+                           now=datetime.now) -> tuple:
+        """Build consolidated session data in memory, skipping the JSON file round-trip"""
+        report_gen, results, session_timestamp, test_config = self._session_inputs(
+            layer_name, concurrency_levels, results_dir, session_type
+        )
+        session_data = report_gen.build_consolidated(results, session_timestamp, test_config, now)
+        return session_data, results, session_timestamp
+    
     def test_single_layer_session_isolation(self, temp_results_dir):
         """Test that single layer sessions only contain data for that layer"""
         
+        now = fake_clock()
+        
         # Create session for layer 1
         layer1_name = 'AfstandTotKoelte'
-        session1_file, session1_results, _ = self.create_session_results(
-            layer1_name, [10, 100, 500], temp_results_dir, 'single_layer'
+        session1_data, session1_results, timestamp1 = self.build_session_data(
+            layer1_name, [10, 100, 500], temp_results_dir, 'single_layer', now
         )
         
-        # Small delay to ensure different timestamps
-        time.sleep(0.001)
-        
         # Create session for layer 2
         layer2_name = 'bkb_2024'
-        session2_file, session2_results, _ = self.create_session_results(
-            layer2_name, [10, 100], temp_results_dir, 'single_layer'
+        session2_data, session2_results, timestamp2 = self.build_session_data(
+            layer2_name, [10, 100], temp_results_dir, 'single_layer', now
         )
         
-        # Verify that sessions are isolated
-        assert session1_file != session2_file, "Session files should be different"
-        
-        # Load and verify session 1 contains only layer 1
-        with open(session1_file) as f:
-            session1_data = json.load(f)
+        # Verify that sessions are isolated (session files are named by timestamp)
+        assert timestamp1 != timestamp2, "Session timestamps should be different"
         
+        # Verify session 1 contains only layer 1
         session1_layers = session1_data['test_suite']['targets_tested']
         assert len(session1_layers) == 1, f"Session 1 should contain 1 layer, got {len(session1_layers)}"
         assert layer1_name in session1_layers, f"Session 1 should contain {layer1_name}"
@@ -111,10 +186,7 @@ class TestSessionIsolation:
         # Verify session 1 has correct number of results
         assert len(session1_data['results']) == 3, f"Session 1 should have 3 results, got {len(session1_data['results'])}"
         
-        # Load and verify session 2 contains only layer 2
-        with open(session2_file) as f:
-            session2_data = json.load(f)
-        
+        # Verify session 2 contains only layer 2
         session2_layers = session2_data['test_suite']['targets_tested']
         assert len(session2_layers) == 1, f"Session 2 should contain 1 layer, got {len(session2_layers)}"
         assert layer2_name in session2_layers, f"Session 2 should contain {layer2_name}"
@@ -123,43 +195,42 @@ class TestSessionIsolation:
         # Verify session 2 has correct number of results
         assert len(session2_data['results']) == 2, f"Session 2 should have 2 results, got {len(session2_data['results'])}"
     
-    def test_comprehensive_session_isolation(self, temp_results_dir):
+    @pytest.mark.parametrize("layers,concurrency_levels", [
+        (['layer1', 'layer2', 'layer3'], [10, 100]),
+        (['layer1', 'layer2'], [10, 50, 100]),
+    ], ids=["3_layers_x_2_levels", "2_layers_x_3_levels"])
+    def test_comprehensive_session_isolation(self, temp_results_dir, layers, concurrency_levels):
         """Test that comprehensive sessions contain multiple layers but only from that session"""
         
-        # Create a comprehensive session with multiple layers
-        layers = ['layer1', 'layer2', 'layer3']
-        all_results = []
-        session_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:-3]
-        
-        for layer_name in layers:
-            for concurrency in [10, 100]:
-                result = self.create_mock_benchmark_result(layer_name, concurrency, session_timestamp)
-                all_results.append(result)
+        # Create a comprehensive session with every layer × concurrency combination
+        session_timestamp = next_session_timestamp()
+        all_results = [
+            self.create_mock_benchmark_result(layer_name, concurrency, session_timestamp)
+            for layer_name, concurrency in itertools.product(layers, concurrency_levels)
+        ]
         
         # Consolidate all results into one comprehensive session
         report_gen = ReportGenerator('geoserver', results_dir=temp_results_dir)
         test_config = {
             'total_requests': 1000,
-            'concurrency_levels': [10, 100],
+            'concurrency_levels': concurrency_levels,
             'layers_tested': layers,
             'server': 'test.example.com',
             'session_type': 'comprehensive'
         }
         
-        session_file = report_gen.consolidate_results(all_results, session_timestamp, test_config)
+        session_data = report_gen.build_consolidated(all_results, session_timestamp, test_config)
         
         # Verify comprehensive session contains all intended layers
-        with open(session_file) as f:
-            session_data = json.load(f)
-        
         session_layers = session_data['test_suite']['targets_tested']
-        assert len(session_layers) == 3, f"Comprehensive session should contain 3 layers, got {len(session_layers)}"
+        assert len(session_layers) == len(layers), f"Comprehensive session should contain {len(layers)} layers, got {len(session_layers)}"
         
         for layer in layers:
             assert layer in session_layers, f"Comprehensive session should contain {layer}"
         
-        # Verify correct number of results (3 layers × 2 concurrency levels = 6 results)
-        assert len(session_data['results']) == 6, f"Comprehensive session should have 6 results, got {len(session_data['results'])}"
+        # Verify correct number of results (one per layer × concurrency level)
+        expected = len(layers) * len(concurrency_levels)
+        assert len(session_data['results']) == expected, f"Comprehensive session should have {expected} results, got {len(session_data['results'])}"
         
         # Verify session type is marked correctly
         assert session_data['configuration']['session_type'] == 'comprehensive'
@@ -169,14 +240,10 @@ class TestSessionIsolation:
         
         layer_name = 'test_layer'
         concurrency_levels = [10, 50, 100]
-        session_file, results, timestamp = self.create_session_results(
+        session_data, results, timestamp = self.build_session_data(
             layer_name, concurrency_levels, temp_results_dir, 'single_layer'
         )
         
-        # Load session data and verify metadata
-        with open(session_file) as f:
-            session_data = json.load(f)
-        
         # Verify test suite metadata
         test_suite = session_data['test_suite']
         assert test_suite['service_type'] == 'geoserver'
@@ -208,29 +275,27 @@ class TestSessionIsolation:
     def test_no_cross_session_contamination(self, temp_results_dir):
         """Test that creating new sessions doesn't affect existing session files"""
         
+        now = fake_clock()
+        
         # Create first session
         session1_file, _, timestamp1 = self.create_session_results(
-            'layer_a', [10, 100], temp_results_dir, 'single_layer'
+            'layer_a', [10, 100], temp_results_dir, 'single_layer', now
         )
         
         # Read initial session 1 data
-        with open(session1_file) as f:
-            original_session1_data = json.load(f)
-        
-        time.sleep(0.001)  # Ensure different timestamp
+        original_session1_data = load_session(session1_file)
         
         # Create second session
         session2_file, _, timestamp2 = self.create_session_results(
-            'layer_b', [50, 200], temp_results_dir, 'single_layer'
+            'layer_b', [50, 200], temp_results_dir, 'single_layer', now
         )
         
         # Verify sessions have different files and timestamps
         assert session1_file != session2_file
         assert timestamp1 != timestamp2
         
-        # Re-read session 1 data and verify it's unchanged
-        with open(session1_file) as f:
-            current_session1_data = json.load(f)
+        # Re-read session 1 data from disk (bypassing the cache) and verify it's unchanged
+        current_session1_data = read_session(session1_file)
         
         assert current_session1_data == original_session1_data, "Session 1 data should be unchanged"
         
@@ -239,14 +304,14 @@ class TestSessionIsolation:
         assert session1_layers == ['layer_a'], "Session 1 should still only contain layer_a"
         
         # Verify session 2 contains only layer_b
-        with open(session2_file) as f:
-            session2_data = json.load(f)
+        session2_data = load_session(session2_file)
         
         session2_layers = session2_data['test_suite']['targets_tested']
         assert session2_layers == ['layer_b'], "Session 2 should only contain layer_b"
 
 
 # Integration test that can be run standalone
+@pytest.mark.integration
 def test_pdf_generation_uses_session_data(tmp_path):
     """Integration test to verify PDF generation uses session-specific data"""
     
@@ -260,7 +325,7 @@ def test_pdf_generation_uses_session_data(tmp_path):
     reports_dir.mkdir()
     
     # Create a single-layer session
-    session_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:-3]
+    session_timestamp = next_session_timestamp()
     layer_name = 'test_pdf_layer'
     
     results = []
@@ -296,8 +361,7 @@ def test_pdf_generation_uses_session_data(tmp_path):
     # Verify the session file was created correctly
     assert session_file.exists(), "Session file should be created"
     
-    with open(session_file) as f:
-        session_data = json.load(f)
+    session_data = load_session(session_file)
     
     # Verify session contains only our test layer
     assert session_data['test_suite']['targets_tested'] == [layer_name]
@@ -325,7 +389,9 @@ if __name__ == "__main__":
             test_instance.test_single_layer_session_isolation(tmp_path / "results1")
             print("✅ Single layer session isolation test passed")
             
-            test_instance.test_comprehensive_session_isolation(tmp_path / "results2") 
+            test_instance.test_comprehensive_session_isolation(
+                tmp_path / "results2", ['layer1', 'layer2', 'layer3'], [10, 100]
+            )
             print("✅ Comprehensive session isolation test passed")
             
             test_instance.test_session_metadata_integrity(tmp_path / "results3")